@@ -132,6 +132,15 @@ async def get_available_skills(ada: AdaMaritimeAI = Depends(get_ada_system)):
     return ada.orchestrator.get_all_available_skills()
 
 
+@app.get("/api/v1/skills/stats")
+async def get_skill_stats(
+    skill_name: Optional[str] = None,
+    ada: AdaMaritimeAI = Depends(get_ada_system)
+):
+    """Get per-skill execution latency and success statistics"""
+    return ada.orchestrator.big5.get_skill_stats(skill_name)
+
+
 # ============================================================================
 # VESSEL VERIFICATION ENDPOINTS
 # ============================================================================
@@ -447,6 +456,8 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down Ada Maritime AI API...")
+    if ada_system is not None:
+        await ada_system.orchestrator.big5.shutdown()
 
 
 if __name__ == "__main__":
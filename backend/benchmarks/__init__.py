@@ -0,0 +1,5 @@
+"""Micro-benchmarks for Ada Maritime AI hot paths
+
+Run from the repository root, e.g.:
+    python -m backend.benchmarks.bench_db_lookups
+"""
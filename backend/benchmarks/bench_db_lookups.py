@@ -0,0 +1,71 @@
+"""
+Benchmark: primary-key lookups vs. berth count
+
+Shows that get_berth_by_id stays flat as the berth table grows from 1k to
+1M rows, compared with the previous linear next(...) scan (measured up to
+100k rows). get_marina_by_id and get_booking_by_id use the same dict
+indexes.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_db_lookups [--sizes 1000 10000 100000 1000000]
+"""
+
+import argparse
+import random
+import timeit
+from dataclasses import replace
+from typing import List
+
+from backend.database.mediterranean_db import MediterraneanDatabase
+from backend.database.models import Berth
+
+
+def _scale_berths(template: List[Berth], size: int) -> List[Berth]:
+    """Clone template berths with unique IDs up to `size` rows"""
+    return [
+        replace(template[i % len(template)], berth_id=f"BENCH-{i:07d}")
+        for i in range(size)
+    ]
+
+
+def _linear_lookup(berths: List[Berth], berth_id: str):
+    return next((b for b in berths if b.berth_id == berth_id), None)
+
+
+def run(sizes: List[int], lookups: int = 1000, scan_limit: int = 100_000) -> None:
+    db = MediterraneanDatabase()
+    template = list(db.berths)
+
+    print(f"{'berths':>10} | {'indexed (us/op)':>16} | {'linear scan (us/op)':>20}")
+    print("-" * 54)
+
+    for size in sizes:
+        db.berths = _scale_berths(template, size)
+        db._rebuild_indexes()
+
+        ids = [random.choice(db.berths).berth_id for _ in range(lookups)]
+        indexed = timeit.timeit(
+            lambda: [db.get_berth_by_id(i) for i in ids], number=1
+        ) / lookups * 1e6
+
+        if size <= scan_limit:
+            scan_ids = ids[:max(1, lookups // 100)]
+            linear = timeit.timeit(
+                lambda: [_linear_lookup(db.berths, i) for i in scan_ids], number=1
+            ) / len(scan_ids) * 1e6
+            linear_str = f"{linear:20.2f}"
+        else:
+            linear_str = f"{'(skipped)':>20}"
+
+        print(f"{size:>10} | {indexed:16.2f} | {linear_str}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+",
+        default=[1_000, 10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.sizes, args.lookups)
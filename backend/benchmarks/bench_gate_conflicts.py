@@ -0,0 +1,79 @@
+"""
+Benchmark: gate conflict detection vs. assignment count
+
+Compares the sort-and-sweep detector (find_overlap_clusters, used by
+ConflictResolutionSkill) with the previous pairwise scan (every new
+assignment compared against all earlier ones on the same gate) at
+1k / 10k / 100k assignments.
+
+Usage (from the repository root):
+    python -m backend.benchmarks.bench_gate_conflicts [--sizes 1000 10000 100000] [--gates 20]
+"""
+
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from backend.utils.intervals import find_overlap_clusters
+
+
+Interval = Tuple[datetime, datetime, str]
+
+
+def _generate(size: int, gates: int, seed: int = 42) -> Dict[str, List[Interval]]:
+    """Random 30-240 minute stays spread over a week, grouped by gate"""
+    rng = random.Random(seed)
+    base = datetime(2030, 1, 1)
+    by_gate: Dict[str, List[Interval]] = {}
+    for i in range(size):
+        start = base + timedelta(minutes=rng.randrange(7 * 24 * 60))
+        end = start + timedelta(minutes=rng.randrange(30, 240))
+        by_gate.setdefault(f"G{rng.randrange(gates):03d}", []).append((start, end, f"V{i:07d}"))
+    return by_gate
+
+
+def _sweep(by_gate: Dict[str, List[Interval]]) -> int:
+    return sum(len(find_overlap_clusters(intervals)) for intervals in by_gate.values())
+
+
+def _pairwise(by_gate: Dict[str, List[Interval]]) -> int:
+    """Previous O(n^2)-per-gate algorithm (one conflict per overlapping pair)"""
+    pairs = 0
+    for intervals in by_gate.values():
+        seen: List[Interval] = []
+        for start, end, vessel_id in intervals:
+            for other_start, other_end, _ in seen:
+                if start < other_end and end > other_start:
+                    pairs += 1
+            seen.append((start, end, vessel_id))
+    return pairs
+
+
+def run(sizes: List[int], gates: int = 20, pairwise_limit: int = 10_000) -> None:
+    print(f"{'assignments':>12} | {'clusters':>9} | {'sweep (ms)':>11} | {'pairwise (ms)':>14}")
+    print("-" * 57)
+
+    for size in sizes:
+        by_gate = _generate(size, gates)
+
+        clusters = _sweep(by_gate)
+        sweep = timeit.timeit(lambda: _sweep(by_gate), number=3) / 3 * 1e3
+
+        if size <= pairwise_limit:
+            pairwise = timeit.timeit(lambda: _pairwise(by_gate), number=1) * 1e3
+            pairwise_str = f"{pairwise:14.1f}"
+        else:
+            pairwise_str = f"{'(skipped)':>14}"
+
+        print(f"{size:>12} | {clusters:>9} | {sweep:11.1f} | {pairwise_str}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--gates", type=int, default=20)
+    parser.add_argument("--pairwise-limit", type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.sizes, args.gates, args.pairwise_limit)
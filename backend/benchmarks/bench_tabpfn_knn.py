@@ -0,0 +1,79 @@
+"""
+Benchmark: TabPFNAdapter KNN prediction latency at MAX_SAMPLES
+
+Compares the vectorized feature-matrix search with the previous path,
+which re-extracted features for every training sample, computed the
+mixed-type distance in Python and fully sorted the result.
+
+Usage:
+    python -m backend.benchmarks.bench_tabpfn_knn [--sizes 1000 10000] [--queries 20]
+"""
+
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta
+from typing import List
+
+from backend.learning.models import Experience, ExperienceType
+from backend.learning.tabpfn_adapter import TabPFNAdapter
+
+
+def _experience(rng: random.Random, i: int) -> Experience:
+    return Experience(
+        experience_id=f"bench_{i}",
+        experience_type=rng.choice(list(ExperienceType)),
+        timestamp=datetime(2030, 1, 1) + timedelta(hours=rng.randrange(24 * 365)),
+        context={
+            "season": rng.choice(["low", "mid", "high"]),
+            "occupancy_rate": rng.random(),
+            "marina": f"marina_{rng.randrange(20)}",
+        },
+        vessel_state={"wind_speed": rng.uniform(0, 40), "water_depth": rng.uniform(2, 20)},
+        action=rng.choice(["suggest_price", "assign_berth", "decline"]),
+        action_params={"suggested_price": rng.randrange(50, 500)},
+        outcome=rng.choice(["success", "failure", "partial"]),
+        performance_score=rng.random(),
+        metrics={"booking_time": rng.uniform(5, 120)},
+    )
+
+
+def _legacy_neighbors(adapter: TabPFNAdapter, query: Experience, k: int):
+    query_features = adapter._extract_features(query)
+    distances = [
+        (exp, adapter._calculate_distance(query_features, adapter._extract_features(exp)))
+        for exp in adapter.training_data
+    ]
+    distances.sort(key=lambda x: x[1])
+    return distances[:k]
+
+
+def run(sizes: List[int], queries: int = 20) -> None:
+    rng = random.Random(42)
+    print(f"{'samples':>8} | {'vectorized (ms/query)':>22} | {'legacy (ms/query)':>18}")
+    print("-" * 55)
+
+    for size in sizes:
+        adapter = TabPFNAdapter(enable_caching=False)
+        for i in range(size):
+            adapter.add_training_sample(_experience(rng, i))
+        probes = [_experience(rng, size + i) for i in range(queries)]
+        k = adapter.K_NEIGHBORS
+
+        vectorized = timeit.timeit(
+            lambda: [adapter._find_k_nearest_neighbors(adapter._extract_features(q), k) for q in probes],
+            number=1
+        ) / queries * 1e3
+        legacy = timeit.timeit(
+            lambda: [_legacy_neighbors(adapter, q, k) for q in probes], number=1
+        ) / queries * 1e3
+
+        print(f"{size:>8} | {vectorized:22.2f} | {legacy:18.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, TabPFNAdapter.MAX_SAMPLES])
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+    run(args.sizes, args.queries)
@@ -22,6 +22,8 @@ class APIConfig:
     anthropic_api_key: str
     openai_api_key: Optional[str] = None
     google_api_key: Optional[str] = None
+    llm_max_concurrency: int = 16  # In-flight LLM calls per process
+    llm_timeout_seconds: float = 60.0
 
 
 @dataclass
@@ -46,7 +48,9 @@ class AppConfig:
         api_config = APIConfig(
             anthropic_api_key=anthropic_key,
             openai_api_key=os.getenv("OPENAI_API_KEY"),
-            google_api_key=os.getenv("GOOGLE_API_KEY")
+            google_api_key=os.getenv("GOOGLE_API_KEY"),
+            llm_max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "16")),
+            llm_timeout_seconds=float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
         )
         
         # Database
@@ -0,0 +1,150 @@
+"""Date-aware berth reservation calendar backed by sorted interval lists"""
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Union
+
+from .models import Berth
+
+
+DateLike = Union[str, datetime]
+
+
+def _to_datetime(value: DateLike) -> datetime:
+    """Accept ISO strings or datetimes"""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+@dataclass
+class _BerthSchedule:
+    """Non-overlapping half-open [start, end) reservations of one berth, sorted by start"""
+    starts: List[datetime] = field(default_factory=list)
+    ends: List[datetime] = field(default_factory=list)
+    booking_ids: List[str] = field(default_factory=list)
+
+    def find_conflict(self, start: datetime, end: datetime) -> Optional[int]:
+        """Index of a reservation overlapping [start, end), or None - O(log n)"""
+        i = bisect_right(self.starts, start)
+        # Reservation starting at or before `start` that is still running
+        if i > 0 and self.ends[i - 1] > start:
+            return i - 1
+        # First reservation starting after `start` that begins before `end`
+        if i < len(self.starts) and self.starts[i] < end:
+            return i
+        return None
+
+    def insert(self, start: datetime, end: datetime, booking_id: str) -> None:
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.booking_ids.insert(i, booking_id)
+
+    def remove(self, booking_id: str) -> bool:
+        try:
+            i = self.booking_ids.index(booking_id)
+        except ValueError:
+            return False
+        del self.starts[i], self.ends[i], self.booking_ids[i]
+        return True
+
+
+class BerthCalendar:
+    """
+    Per-berth reservation calendar.
+
+    Reservations are half-open ``[check_in, check_out)`` intervals, so a
+    check-out and the next check-in on the same day do not conflict. Each
+    berth keeps its intervals in sorted, non-overlapping lists, so a
+    "free between check_in and check_out" query is a single bisection.
+    """
+
+    def __init__(self) -> None:
+        self._schedules: Dict[str, _BerthSchedule] = {}
+
+    def is_free(self, berth_id: str, check_in: DateLike, check_out: DateLike) -> bool:
+        """Check whether a berth has no reservation overlapping the range"""
+        schedule = self._schedules.get(berth_id)
+        if schedule is None:
+            return True
+        return schedule.find_conflict(_to_datetime(check_in), _to_datetime(check_out)) is None
+
+    def get_conflict(self, berth_id: str, check_in: DateLike, check_out: DateLike) -> Optional[str]:
+        """Booking ID blocking the range, if any"""
+        schedule = self._schedules.get(berth_id)
+        if schedule is None:
+            return None
+        i = schedule.find_conflict(_to_datetime(check_in), _to_datetime(check_out))
+        return schedule.booking_ids[i] if i is not None else None
+
+    def reserve(self, berth_id: str, check_in: DateLike, check_out: DateLike, booking_id: str) -> bool:
+        """
+        Reserve a range for a berth
+
+        Returns:
+            False if the range overlaps an existing reservation
+        """
+        start, end = _to_datetime(check_in), _to_datetime(check_out)
+        if end <= start:
+            raise ValueError("Check-out must be after check-in")
+
+        schedule = self._schedules.setdefault(berth_id, _BerthSchedule())
+        if schedule.find_conflict(start, end) is not None:
+            return False
+        schedule.insert(start, end, booking_id)
+        return True
+
+    def block_occupied(self, berths: Iterable[Berth], start: DateLike, end: DateLike) -> int:
+        """
+        Reserve ``[start, end)`` on every berth that is not currently available
+
+        Seeded data marks berths occupied/reserved without a booking behind
+        them; this stands in for their current stay so date-range searches
+        do not offer them as free.
+
+        Returns:
+            Number of berths blocked
+        """
+        blocked = 0
+        for berth in berths:
+            if berth.is_available():
+                continue
+            booking_id = berth.current_booking_id or f"OCCUPIED-{berth.berth_id}"
+            blocked += self.reserve(berth.berth_id, start, end, booking_id)
+        return blocked
+
+    def release(self, berth_id: str, booking_id: str) -> bool:
+        """Remove a reservation (e.g. on cancellation)"""
+        schedule = self._schedules.get(berth_id)
+        return schedule.remove(booking_id) if schedule else False
+
+    def free_berths(
+        self,
+        berths: Iterable[Berth],
+        check_in: DateLike,
+        check_out: DateLike
+    ) -> List[Berth]:
+        """Filter berths down to those free for the whole range, preserving order"""
+        start, end = _to_datetime(check_in), _to_datetime(check_out)
+        schedules = self._schedules
+        results: List[Berth] = []
+        for berth in berths:
+            schedule = schedules.get(berth.berth_id)
+            if schedule is None or schedule.find_conflict(start, end) is None:
+                results.append(berth)
+        return results
+
+    def reservations(self, berth_id: str) -> List[Dict[str, str]]:
+        """List reservations of a berth in chronological order"""
+        schedule = self._schedules.get(berth_id)
+        if schedule is None:
+            return []
+        return [
+            {"booking_id": bid, "check_in": s.isoformat(), "check_out": e.isoformat()}
+            for s, e, bid in zip(schedule.starts, schedule.ends, schedule.booking_ids)
+        ]
+
+    def __len__(self) -> int:
+        return sum(len(s.starts) for s in self._schedules.values())
@@ -0,0 +1,188 @@
+"""Secondary index for berth search - per-marina buckets, length bisection and amenity bitsets"""
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional
+
+from .models import Berth
+
+
+class BerthSearchIndex:
+    """
+    In-memory secondary index over a list of berths.
+
+    Every berth gets a fixed slot in price order (ascending ``daily_rate``).
+    Filters are Python ``int`` bitsets over those slots, so combining filters
+    is a handful of big-integer ANDs and the surviving bits come out already
+    sorted by price:
+
+    - one bitset per marina (per-marina bucket)
+    - one bitset per amenity (electricity, water, fuel, pump-out)
+    - one bitset of currently available berths, updated on status change
+    - a length-sorted array of slots, bisected for ``min_length``/``max_length``,
+      with prefix bitsets over that order so a length range is
+      ``prefix[hi] & ~prefix[lo]``
+
+    Memory: every bitset spans all slots (n / 8 bytes for n berths), so the
+    marina, amenity and availability bitsets cost a few n / 8 bytes each
+    (~125 KB apiece at 1M berths). The length prefixes dominate and are
+    capped at ``length_prefix_budget`` bytes: 1024 prefixes for up to
+    ~260k berths, then fewer, with the rest of a prefix rebuilt per query.
+    """
+
+    AMENITIES = ("electricity", "water", "fuel", "pump_out")
+
+    # Most prefix bitsets kept for the length order; above this many berths
+    # only every n-th prefix is stored and the remainder is built per query
+    LENGTH_PREFIXES = 1024
+    # Memory cap for those prefixes (1M berths: 256 prefixes of ~125 KB)
+    LENGTH_PREFIX_BUDGET = 32 * 1024 * 1024
+
+    def __init__(self, berths: List[Berth], length_prefix_budget: int = LENGTH_PREFIX_BUDGET) -> None:
+        """
+        Args:
+            berths: Berths to index
+            length_prefix_budget: Max bytes spent on length prefix bitsets
+        """
+        self.length_prefix_budget = length_prefix_budget
+        self.rebuild(berths)
+
+    def rebuild(self, berths: List[Berth]) -> None:
+        """(Re)build the index from scratch"""
+        # Price-ordered view: slot -> berth
+        self._by_price: List[Berth] = sorted(berths, key=lambda b: b.daily_rate)
+        self._slot: Dict[str, int] = {
+            b.berth_id: slot for slot, b in enumerate(self._by_price)
+        }
+
+        self._bitset_bytes = (len(self._by_price) + 7) // 8
+
+        # Collect slots first: OR-ing single bits into a big int is O(n) each
+        marina_slots: Dict[str, List[int]] = {}
+        amenity_slots: Dict[str, List[int]] = {name: [] for name in self.AMENITIES}
+        available_slots: List[int] = []
+
+        for slot, berth in enumerate(self._by_price):
+            marina_slots.setdefault(berth.marina_id, []).append(slot)
+            if berth.has_electricity:
+                amenity_slots["electricity"].append(slot)
+            if berth.has_water:
+                amenity_slots["water"].append(slot)
+            if berth.has_fuel:
+                amenity_slots["fuel"].append(slot)
+            if berth.has_pump_out:
+                amenity_slots["pump_out"].append(slot)
+            if berth.is_available():
+                available_slots.append(slot)
+
+        self._marina_bits: Dict[str, int] = {
+            marina_id: self._bitset(slots) for marina_id, slots in marina_slots.items()
+        }
+        self._amenity_bits: Dict[str, int] = {
+            name: self._bitset(slots) for name, slots in amenity_slots.items()
+        }
+        self._available_bits = self._bitset(available_slots)
+
+        # Length-sorted array of (length, slot) for range bisection
+        by_length = sorted(
+            (b.length_meters, slot) for slot, b in enumerate(self._by_price)
+        )
+        self._lengths: List[float] = [length for length, _ in by_length]
+        self._length_slots: List[int] = [slot for _, slot in by_length]
+        self._build_length_prefixes()
+
+        self._all_bits = (1 << len(self._by_price)) - 1
+
+    def __len__(self) -> int:
+        return len(self._by_price)
+
+    def update_status(self, berth: Berth) -> None:
+        """Refresh the availability bit after ``berth.status`` changed"""
+        slot = self._slot.get(berth.berth_id)
+        if slot is None:
+            return
+        bit = 1 << slot
+        if berth.is_available():
+            self._available_bits |= bit
+        else:
+            self._available_bits &= ~bit
+
+    def _bitset(self, slots: Iterable[int]) -> int:
+        """Bitset of ``slots``, built in a bytearray and converted once (O(n / 8))"""
+        buffer = bytearray(self._bitset_bytes)
+        for slot in slots:
+            buffer[slot >> 3] |= 1 << (slot & 7)
+        return int.from_bytes(buffer, "little")
+
+    def _build_length_prefixes(self) -> None:
+        """Bitsets of the first k length-ordered slots, for every ``stride``-th k"""
+        count = len(self._length_slots)
+        prefixes = max(1, min(self.LENGTH_PREFIXES, self.length_prefix_budget // max(1, self._bitset_bytes)))
+        self._prefix_stride = max(1, -(-count // prefixes))
+        # Set bits in a bytearray and convert once per prefix: O(n / 8) each
+        buffer = bytearray(self._bitset_bytes)
+        self._length_prefixes: List[int] = [0]
+        for k, slot in enumerate(self._length_slots, 1):
+            buffer[slot >> 3] |= 1 << (slot & 7)
+            if k % self._prefix_stride == 0:
+                self._length_prefixes.append(int.from_bytes(buffer, "little"))
+
+    def _length_prefix(self, k: int) -> int:
+        """Bitset of the ``k`` shortest berths"""
+        block, rest = divmod(k, self._prefix_stride)
+        mask = self._length_prefixes[block]
+        if rest:
+            start = block * self._prefix_stride
+            mask |= self._bitset(self._length_slots[start:k])
+        return mask
+
+    def _length_mask(self, min_length: Optional[float], max_length: Optional[float]) -> int:
+        """Bitset of slots whose length lies in [min_length, max_length]"""
+        lo = bisect_left(self._lengths, min_length) if min_length else 0
+        hi = bisect_right(self._lengths, max_length) if max_length else len(self._lengths)
+        if lo == 0 and hi == len(self._lengths):
+            return self._all_bits
+        if lo >= hi:
+            return 0
+        return self._length_prefix(hi) & ~self._length_prefix(lo)
+
+    def search(
+        self,
+        marina_id: Optional[str] = None,
+        min_length: Optional[float] = None,
+        max_length: Optional[float] = None,
+        needs_electricity: bool = False,
+        needs_water: bool = False,
+        needs_fuel: bool = False,
+        needs_pump_out: bool = False,
+        available_only: bool = True
+    ) -> List[Berth]:
+        """Return matching berths sorted by ``daily_rate``"""
+        mask = self._available_bits if available_only else self._all_bits
+
+        if marina_id:
+            mask &= self._marina_bits.get(marina_id, 0)
+        if needs_electricity:
+            mask &= self._amenity_bits["electricity"]
+        if needs_water:
+            mask &= self._amenity_bits["water"]
+        if needs_fuel:
+            mask &= self._amenity_bits["fuel"]
+        if needs_pump_out:
+            mask &= self._amenity_bits["pump_out"]
+        if mask and (min_length or max_length):
+            mask &= self._length_mask(min_length, max_length)
+
+        return self._collect(mask)
+
+    def _collect(self, mask: int) -> List[Berth]:
+        """Materialise the berths for the set bits of ``mask`` in slot (price) order"""
+        if not mask:
+            return []
+        # bin() runs in C; reversing puts slot 0 at string index 0
+        bits = bin(mask)[:1:-1]
+        results: List[Berth] = []
+        pos = bits.find("1")
+        while pos != -1:
+            results.append(self._by_price[pos])
+            pos = bits.find("1", pos + 1)
+        return results
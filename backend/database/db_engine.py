@@ -7,9 +7,10 @@ Supports PostgreSQL (recommended) and MySQL.
 
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.pool import QueuePool
-from contextlib import contextmanager
+from sqlalchemy.pool import QueuePool, StaticPool
+from contextlib import asynccontextmanager, contextmanager
 import logging
 
 from ..config import get_config
@@ -23,6 +24,19 @@ Base = declarative_base()
 _engine = None
 _session_factory = None
 
+# Async engine for event-loop code (FastAPI handlers, async skills)
+_async_engine = None
+_async_session_factory = None
+
+# Sync driver -> async driver
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
 
 def get_database_url() -> str:
     """
@@ -57,6 +71,38 @@ def get_database_url() -> str:
     return "sqlite:///ada_maritime.db"
 
 
+def create_db_engine(database_url: str, echo: bool = False):
+    """
+    Create a SQLAlchemy engine with pooling suited to the backend
+
+    PostgreSQL/MySQL get a QueuePool shared by all sessions of the process.
+    In-memory SQLite uses a single static connection so every session sees
+    the same database (used by the test suite).
+
+    Args:
+        database_url: Database connection URL
+        echo: Enable SQL query logging
+    """
+    if database_url.startswith("sqlite"):
+        kwargs = {"connect_args": {"check_same_thread": False}}
+        if ":memory:" in database_url or database_url.rstrip("/") == "sqlite:":
+            kwargs["poolclass"] = StaticPool
+        engine = create_engine(database_url, echo=echo, **kwargs)
+    else:
+        engine = create_engine(
+            database_url,
+            echo=echo,
+            poolclass=QueuePool,
+            pool_size=10,
+            max_overflow=20,
+            pool_pre_ping=True,  # Verify connections before using
+            pool_recycle=3600,   # Recycle connections after 1 hour
+        )
+
+    _register_listeners(engine)
+    return engine
+
+
 def init_database(database_url: str = None, echo: bool = False) -> None:
     """
     Initialize database engine and session factory
@@ -76,15 +122,7 @@ def init_database(database_url: str = None, echo: bool = False) -> None:
     logger.info(f"Initializing database: {url.split('@')[-1] if '@' in url else url}")
 
     # Create engine with connection pooling
-    _engine = create_engine(
-        url,
-        echo=echo,
-        poolclass=QueuePool,
-        pool_size=10,
-        max_overflow=20,
-        pool_pre_ping=True,  # Verify connections before using
-        pool_recycle=3600,   # Recycle connections after 1 hour
-    )
+    _engine = create_db_engine(url, echo=echo)
 
     # Create session factory
     _session_factory = scoped_session(
@@ -134,6 +172,111 @@ def get_db_session():
         session.close()
 
 
+def get_async_database_url(database_url: str = None) -> str:
+    """
+    Translate a (sync) database URL to its async driver
+
+    sqlite:// -> sqlite+aiosqlite://, postgresql:// -> postgresql+asyncpg://,
+    mysql+pymysql:// -> mysql+aiomysql://. URLs that already name an async
+    driver are returned unchanged.
+    """
+    url = database_url or get_database_url()
+    scheme, sep, rest = url.partition("://")
+    return f"{ASYNC_DRIVERS.get(scheme, scheme)}{sep}{rest}"
+
+
+def create_async_db_engine(database_url: str, echo: bool = False):
+    """
+    Create an async SQLAlchemy engine (aiosqlite / asyncpg / aiomysql)
+
+    Args:
+        database_url: Database connection URL (sync URLs are translated)
+        echo: Enable SQL query logging
+    """
+    url = get_async_database_url(database_url)
+
+    if url.startswith("sqlite"):
+        kwargs = {}
+        if ":memory:" in url:
+            kwargs["poolclass"] = StaticPool
+        return create_async_engine(url, echo=echo, **kwargs)
+
+    return create_async_engine(
+        url,
+        echo=echo,
+        pool_size=10,
+        max_overflow=20,
+        pool_pre_ping=True,
+        pool_recycle=3600,
+    )
+
+
+def init_async_database(database_url: str = None, echo: bool = False) -> None:
+    """
+    Initialize async database engine and session factory
+
+    Args:
+        database_url: Database connection URL (if None, uses config)
+        echo: Enable SQL query logging
+    """
+    global _async_engine, _async_session_factory
+
+    if _async_engine is not None:
+        logger.warning("Async database already initialized")
+        return
+
+    url = get_async_database_url(database_url)
+
+    logger.info(f"Initializing async database: {url.split('@')[-1] if '@' in url else url}")
+
+    _async_engine = create_async_db_engine(url, echo=echo)
+    _async_session_factory = async_sessionmaker(
+        bind=_async_engine,
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+    logger.info("Async database initialized successfully")
+
+
+def get_async_engine():
+    """Get async SQLAlchemy engine (initializes if needed)"""
+    if _async_engine is None:
+        init_async_database()
+    return _async_engine
+
+
+def get_async_session() -> AsyncSession:
+    """Get new async database session"""
+    if _async_session_factory is None:
+        init_async_database()
+    return _async_session_factory()
+
+
+@asynccontextmanager
+async def get_async_db_session():
+    """
+    Async context manager for database sessions
+
+    Each call gets its own AsyncSession (and pooled connection), so
+    concurrent tasks under asyncio.gather overlap their I/O.
+
+    Usage:
+        async with get_async_db_session() as session:
+            result = await session.execute(select(BerthRecord))
+    """
+    session = get_async_session()
+    try:
+        yield session
+        await session.commit()
+    except Exception as e:
+        await session.rollback()
+        logger.error(f"Database error: {e}")
+        raise
+    finally:
+        await session.close()
+
+
 def create_all_tables():
     """Create all database tables"""
     Base.metadata.create_all(bind=get_engine())
@@ -161,14 +304,29 @@ def close_database():
     logger.info("Database connections closed")
 
 
-# Connection event listeners
-@event.listens_for(_engine, "connect", once=True)
-def receive_connect(dbapi_conn, connection_record):
-    """Log first database connection"""
-    logger.info("First database connection established")
+async def close_async_database():
+    """Close async database connections"""
+    global _async_engine, _async_session_factory
 
+    _async_session_factory = None
 
-@event.listens_for(_engine, "close")
-def receive_close(dbapi_conn, connection_record):
-    """Log database connection close"""
-    logger.debug("Database connection closed")
+    if _async_engine:
+        await _async_engine.dispose()
+        _async_engine = None
+
+    logger.info("Async database connections closed")
+
+
+# Connection event listeners
+def _register_listeners(engine) -> None:
+    """Attach connection logging listeners to an engine"""
+
+    @event.listens_for(engine, "connect", once=True)
+    def receive_connect(dbapi_conn, connection_record):
+        """Log first database connection"""
+        logger.info("First database connection established")
+
+    @event.listens_for(engine, "close")
+    def receive_close(dbapi_conn, connection_record):
+        """Log database connection close"""
+        logger.debug("Database connection closed")
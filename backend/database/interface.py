@@ -1,10 +1,11 @@
 """Database interface for Ada Maritime AI - Airport-Style Parallel Operations"""
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 
-from .models import Berth, Booking, Marina, Vessel, Gate, Terminal, ServiceQueue, TrafficData, GateAssignment
+from .models import Berth, Booking, Marina
 
 
 class DatabaseInterface(ABC):
@@ -69,3 +70,134 @@ class DatabaseInterface(ABC):
     def get_all_berths(self) -> List[Berth]:
         """Get all berths"""
         pass
+
+
+class AsyncDatabaseInterface(ABC):
+    """
+    Async counterpart of DatabaseInterface for event-loop code
+
+    Implementations must not block the loop, so independent calls issued
+    through asyncio.gather overlap their I/O.
+    """
+
+    @abstractmethod
+    async def get_marina_by_id(self, marina_id: str) -> Optional[Marina]:
+        """Get marina by ID"""
+        pass
+
+    @abstractmethod
+    async def get_all_marinas(self) -> List[Marina]:
+        """Get all marinas"""
+        pass
+
+    @abstractmethod
+    async def search_available_berths(
+        self,
+        marina_id: Optional[str] = None,
+        min_length: Optional[float] = None,
+        max_length: Optional[float] = None,
+        check_in: Optional[str] = None,
+        check_out: Optional[str] = None,
+        needs_electricity: bool = False,
+        needs_water: bool = False
+    ) -> List[Berth]:
+        """Search for available berths"""
+        pass
+
+    @abstractmethod
+    async def get_berth_by_id(self, berth_id: str) -> Optional[Berth]:
+        """Get berth by ID"""
+        pass
+
+    @abstractmethod
+    async def create_booking(
+        self,
+        berth_id: str,
+        customer_name: str,
+        customer_email: str,
+        customer_phone: str,
+        boat_name: str,
+        boat_length: float,
+        check_in: str,
+        check_out: str,
+        services: List[str]
+    ) -> Booking:
+        """Create a new booking"""
+        pass
+
+    @abstractmethod
+    async def get_booking_by_id(self, booking_id: str) -> Optional[Booking]:
+        """Get booking by ID"""
+        pass
+
+    @abstractmethod
+    async def get_bookings_by_marina(self, marina_id: str) -> List[Booking]:
+        """Get all bookings for a marina"""
+        pass
+
+    @abstractmethod
+    async def get_all_berths(self) -> List[Berth]:
+        """Get all berths"""
+        pass
+
+
+class AsyncDatabaseAdapter(AsyncDatabaseInterface):
+    """
+    Expose a synchronous DatabaseInterface through the async API
+
+    Each call runs in the default thread pool via asyncio.to_thread, so a
+    blocking backend never stalls the event loop. Methods outside the
+    interface (e.g. get_vessel, allocate_gate) are wrapped the same way.
+    """
+
+    def __init__(self, db: DatabaseInterface) -> None:
+        self.db = db
+
+    async def get_marina_by_id(self, marina_id: str) -> Optional[Marina]:
+        return await asyncio.to_thread(self.db.get_marina_by_id, marina_id)
+
+    async def get_all_marinas(self) -> List[Marina]:
+        return await asyncio.to_thread(self.db.get_all_marinas)
+
+    async def search_available_berths(self, *args: Any, **kwargs: Any) -> List[Berth]:
+        return await asyncio.to_thread(self.db.search_available_berths, *args, **kwargs)
+
+    async def get_berth_by_id(self, berth_id: str) -> Optional[Berth]:
+        return await asyncio.to_thread(self.db.get_berth_by_id, berth_id)
+
+    async def create_booking(self, *args: Any, **kwargs: Any) -> Booking:
+        return await asyncio.to_thread(self.db.create_booking, *args, **kwargs)
+
+    async def get_booking_by_id(self, booking_id: str) -> Optional[Booking]:
+        return await asyncio.to_thread(self.db.get_booking_by_id, booking_id)
+
+    async def get_bookings_by_marina(self, marina_id: str) -> List[Booking]:
+        return await asyncio.to_thread(self.db.get_bookings_by_marina, marina_id)
+
+    async def get_all_berths(self) -> List[Berth]:
+        return await asyncio.to_thread(self.db.get_all_berths)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "db":
+            raise AttributeError(name)
+        attr = getattr(self.db, name)
+        if not callable(attr):
+            return attr
+
+        async def _call(*args: Any, **kwargs: Any) -> Any:
+            return await asyncio.to_thread(attr, *args, **kwargs)
+
+        return _call
+
+
+def as_async_database(db: Any) -> Any:
+    """
+    Normalise a database handle for async callers
+
+    Sync DatabaseInterface implementations are wrapped in
+    AsyncDatabaseAdapter; async implementations, None and duck-typed
+    objects are returned unchanged.
+    """
+    if isinstance(db, DatabaseInterface):
+        return AsyncDatabaseAdapter(db)
+    return db
@@ -1,10 +1,13 @@
 """Mediterranean Multi-Region Marina Database - Comprehensive Mock Implementation"""
 
 import random
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 
 from .interface import DatabaseInterface
+from .availability import BerthCalendar
+from .berth_index import BerthSearchIndex
 from .models import (
     Berth, Booking, Marina, OperatingHours, SeasonalPricing,
     Weather, MaintenanceRecord, Staff
@@ -23,6 +26,9 @@ logger = setup_logger(__name__)
 class MediterraneanDatabase(DatabaseInterface):
     """Comprehensive multi-region Mediterranean marina database"""
 
+    # Seeded occupied/reserved berths have no booking; assume this long a stay
+    CURRENT_STAY_DAYS = 7
+
     def __init__(self) -> None:
         """Initialize mock data for Mediterranean marinas"""
         logger.info("Initializing Mediterranean Marina Database")
@@ -32,6 +38,9 @@ class MediterraneanDatabase(DatabaseInterface):
         self.bookings: List[Booking] = []
         self.staff: List[Staff] = self._create_mock_staff()
         self.maintenance_records: List[MaintenanceRecord] = []
+        self.calendar = BerthCalendar()
+        self._block_current_occupancy()
+        self._rebuild_indexes()
 
         logger.info(
             f"Database initialized: {len(self.marinas)} marinas across "
@@ -671,12 +680,32 @@ class MediterraneanDatabase(DatabaseInterface):
 
         return staff_members
 
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the primary-key and per-marina indexes from the backing lists"""
+        self._marinas_by_id: Dict[str, Marina] = {m.marina_id: m for m in self.marinas}
+        self._berths_by_id: Dict[str, Berth] = {b.berth_id: b for b in self.berths}
+        self._bookings_by_id: Dict[str, Booking] = {}
+        self._bookings_by_marina: Dict[str, List[Booking]] = defaultdict(list)
+        for booking in self.bookings:
+            self._index_booking(booking)
+        self.berth_index = BerthSearchIndex(self.berths)
+
+    def _block_current_occupancy(self) -> None:
+        """Block today's occupied/reserved berths for their (assumed) current stay"""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        blocked = self.calendar.block_occupied(
+            self.berths, today, today + timedelta(days=self.CURRENT_STAY_DAYS)
+        )
+        logger.debug(f"Blocked {blocked} occupied berths for {self.CURRENT_STAY_DAYS} days")
+
+    def _index_booking(self, booking: Booking) -> None:
+        """Add a booking to the lookup indexes"""
+        self._bookings_by_id.setdefault(booking.booking_id, booking)
+        self._bookings_by_marina[booking.marina_id].append(booking)
+
     def get_marina_by_id(self, marina_id: str) -> Optional[Marina]:
         """Get marina by ID"""
-        marina = next(
-            (m for m in self.marinas if m.marina_id == marina_id),
-            None
-        )
+        marina = self._marinas_by_id.get(marina_id)
 
         if marina:
             logger.debug(f"Found marina: {marina.name}")
@@ -704,35 +733,46 @@ class MediterraneanDatabase(DatabaseInterface):
         check_in: Optional[str] = None,
         check_out: Optional[str] = None,
         needs_electricity: bool = False,
-        needs_water: bool = False
+        needs_water: bool = False,
+        needs_fuel: bool = False,
+        needs_pump_out: bool = False
     ) -> List[Berth]:
-        """Search for available berths with filters"""
+        """
+        Search for available berths with filters (results sorted by price)
+
+        Without dates, availability is the berth's current status. With
+        check_in/check_out, any berth not under maintenance qualifies as long
+        as its reservation calendar is free for the whole range.
+        """
 
         logger.info(
             f"Searching berths: marina={marina_id}, "
             f"length={min_length}-{max_length}, "
+            f"dates={check_in}-{check_out}, "
             f"electricity={needs_electricity}, water={needs_water}"
         )
 
-        results = [b for b in self.berths if b.is_available()]
-
-        if marina_id:
-            results = [b for b in results if b.marina_id == marina_id]
-
-        if min_length:
-            results = [b for b in results if b.length_meters >= min_length]
-
-        if max_length:
-            results = [b for b in results if b.length_meters <= max_length]
-
-        if needs_electricity:
-            results = [b for b in results if b.has_electricity]
-
-        if needs_water:
-            results = [b for b in results if b.has_water]
+        date_range = bool(check_in and check_out)
+        results = self.berth_index.search(
+            marina_id=marina_id,
+            min_length=min_length,
+            max_length=max_length,
+            needs_electricity=needs_electricity,
+            needs_water=needs_water,
+            needs_fuel=needs_fuel,
+            needs_pump_out=needs_pump_out,
+            available_only=not date_range
+        )
 
-        # Sort by price
-        results.sort(key=lambda b: b.daily_rate)
+        if date_range:
+            try:
+                results = self.calendar.free_berths(
+                    (b for b in results if b.is_in_service()),
+                    check_in,
+                    check_out
+                )
+            except ValueError as e:
+                raise BookingError(f"Invalid date format: {e}")
 
         logger.info(f"Found {len(results)} available berths")
 
@@ -740,10 +780,7 @@ class MediterraneanDatabase(DatabaseInterface):
 
     def get_berth_by_id(self, berth_id: str) -> Optional[Berth]:
         """Get berth by ID"""
-        berth = next(
-            (b for b in self.berths if b.berth_id == berth_id),
-            None
-        )
+        berth = self._berths_by_id.get(berth_id)
 
         if berth:
             logger.debug(f"Found berth: {berth.number}")
@@ -772,7 +809,7 @@ class MediterraneanDatabase(DatabaseInterface):
         if not berth:
             raise BerthNotFoundError(f"Berth {berth_id} not found")
 
-        if not berth.is_available():
+        if not berth.is_in_service():
             raise BerthNotAvailableError(
                 f"Berth {berth_id} is {berth.status}"
             )
@@ -794,9 +831,10 @@ class MediterraneanDatabase(DatabaseInterface):
         except ValueError as e:
             raise BookingError(f"Invalid date format: {e}")
 
+        booking_id = f"BK-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+
         total_price = berth.daily_rate * nights
 
-        booking_id = f"BK-{datetime.now().strftime('%Y%m%d%H%M%S')}"
         booking = Booking(
             booking_id=booking_id,
             berth_id=berth_id,
@@ -816,12 +854,24 @@ class MediterraneanDatabase(DatabaseInterface):
             services_requested=services
         )
 
+        # Reserve only once the booking is built, so a failure leaves no orphan
+        if not self.calendar.reserve(berth_id, check_in_dt, check_out_dt, booking_id):
+            conflict = self.calendar.get_conflict(berth_id, check_in_dt, check_out_dt)
+            raise BerthNotAvailableError(
+                f"Berth {berth_id} is already booked ({conflict}) "
+                f"between {check_in} and {check_out}"
+            )
+
         self.bookings.append(booking)
+        self._index_booking(booking)
 
-        # Update berth status
-        berth.status = "reserved"
-        berth.current_booking_id = booking_id
-        berth.current_boat_name = boat_name
+        # The calendar holds the reservation; the status flag only tracks
+        # the berth's current state, so flip it only if the stay is ongoing
+        if check_in_dt <= datetime.now() < check_out_dt and berth.is_available():
+            berth.status = "reserved"
+            berth.current_booking_id = booking_id
+            berth.current_boat_name = boat_name
+            self.berth_index.update_status(berth)
 
         logger.info(
             f"Booking created: {booking_id} for {nights} nights, "
@@ -832,10 +882,7 @@ class MediterraneanDatabase(DatabaseInterface):
 
     def get_booking_by_id(self, booking_id: str) -> Optional[Booking]:
         """Get booking by ID"""
-        booking = next(
-            (b for b in self.bookings if b.booking_id == booking_id),
-            None
-        )
+        booking = self._bookings_by_id.get(booking_id)
 
         if booking:
             logger.debug(f"Found booking: {booking_id}")
@@ -846,7 +893,7 @@ class MediterraneanDatabase(DatabaseInterface):
 
     def get_bookings_by_marina(self, marina_id: str) -> List[Booking]:
         """Get all bookings for a marina"""
-        bookings = [b for b in self.bookings if b.marina_id == marina_id]
+        bookings = list(self._bookings_by_marina.get(marina_id, ()))
         logger.debug(f"Found {len(bookings)} bookings for marina: {marina_id}")
         return bookings
 
@@ -128,6 +128,10 @@ class Berth:
         """Check if berth is available"""
         return self.status == "available"
 
+    def is_in_service(self) -> bool:
+        """Check if berth can take reservations (not under maintenance)"""
+        return self.status != "maintenance"
+
     @property
     def daily_rate_eur(self) -> float:
         """Backward compatibility: return daily rate as EUR"""
@@ -702,3 +706,89 @@ class VHFMonitoringSession:
             return (end - start).total_seconds() / 60
         except:
             return None
+
+
+# ============================================================================
+# AIRPORT-STYLE OPERATIONS MODELS
+# ============================================================================
+
+class VesselStatus(Enum):
+    """Vessel movement status"""
+    APPROACHING = "approaching"
+    WAITING = "waiting"
+    ASSIGNED = "assigned"
+    DOCKED = "docked"
+    DEPARTED = "departed"
+
+
+class GateStatus(Enum):
+    """Gate (berth slot) status"""
+    AVAILABLE = "available"
+    RESERVED = "reserved"
+    OCCUPIED = "occupied"
+    MAINTENANCE = "maintenance"
+
+
+@dataclass
+class Vessel:
+    """Vessel handled by parallel gate and scheduling operations"""
+    vessel_id: str
+    vessel_name: str
+    length_meters: float
+    beam_meters: Optional[float] = None
+    draft_meters: Optional[float] = None
+    vessel_type: str = "yacht"
+    priority_level: int = 0  # Higher is served first
+    status: str = "approaching"  # VesselStatus
+    eta: Optional[str] = None  # ISO format
+
+
+@dataclass
+class Gate:
+    """Berth slot assigned like an airport gate"""
+    gate_id: str
+    terminal_id: str
+    length_meters: float
+    hourly_rate_eur: float
+    status: str = "available"  # GateStatus
+    max_beam_meters: Optional[float] = None
+
+    def is_available(self) -> bool:
+        """Check if gate is available"""
+        return self.status == GateStatus.AVAILABLE.value
+
+
+@dataclass
+class GateAssignment:
+    """Vessel-to-gate assignment for a time window"""
+    assignment_id: str
+    vessel_id: str
+    gate_id: str
+    scheduled_arrival: str  # ISO format
+    scheduled_departure: str  # ISO format
+    terminal_id: Optional[str] = None
+    status: str = "assigned"  # assigned, active, completed, cancelled
+
+
+@dataclass
+class Conflict:
+    """Scheduling conflict between gate assignments"""
+    conflict_id: str
+    conflict_type: str  # gate_overlap, time_conflict, resource_shortage
+    severity: str  # critical, high, medium, low
+    vessel_ids: List[str] = field(default_factory=list)
+    gate_id: Optional[str] = None
+    resource_type: Optional[str] = None
+    description: str = ""
+    resolved: bool = False
+
+
+@dataclass
+class TrafficData:
+    """Port traffic snapshot used for arrival scheduling"""
+    port_id: str
+    timestamp: str  # ISO format
+    congestion_level: str = "low"  # low, medium, high
+    queue_length: int = 0
+    weather_safe: bool = True
+    ferry_times: List[str] = field(default_factory=list)  # "HH:MM"
@@ -0,0 +1,722 @@
+"""SQLAlchemy-backed marina database (sync and async) - shared state for multi-worker deployments"""
+
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, fields
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import (
+    JSON, Boolean, Column, Float, Index, Integer, String, and_, exists, insert, select
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from .db_engine import (
+    Base, create_async_db_engine, create_db_engine, get_async_engine, get_engine
+)
+from .interface import AsyncDatabaseInterface, DatabaseInterface
+from .models import Berth, Booking, Marina, OperatingHours, SeasonalPricing
+from ..logger import setup_logger
+from ..exceptions import (
+    BerthNotFoundError,
+    BerthNotAvailableError,
+    BookingError
+)
+
+
+logger = setup_logger(__name__)
+
+
+# ============================================================================
+# TABLES
+# ============================================================================
+# Column names mirror the dataclass field names in models.py so rows map
+# 1:1 onto Berth/Booking/Marina.
+
+class MarinaRecord(Base):
+    """marinas table"""
+    __tablename__ = "marinas"
+
+    marina_id = Column(String(64), primary_key=True)
+    name = Column(String(200), nullable=False)
+    location = Column(String(200), nullable=False)
+    city = Column(String(100), nullable=False)
+    country = Column(String(100), nullable=False)
+    country_code = Column(String(2), nullable=False, index=True)
+    total_berths = Column(Integer, nullable=False)
+    available_berths = Column(Integer, nullable=False)
+    coordinates = Column(JSON, nullable=False)
+    amenities = Column(JSON, nullable=False)
+    contact_email = Column(String(200), nullable=False)
+    contact_phone = Column(String(50), nullable=False)
+    currency = Column(String(3), default="EUR")
+    timezone = Column(String(64), default="Europe/Athens")
+    language = Column(String(8), default="en")
+    marina_type = Column(String(32), default="commercial")
+    website = Column(String(200))
+    description = Column(String(2000))
+    max_boat_length_meters = Column(Float, default=50.0)
+    min_depth_meters = Column(Float, default=2.0)
+    max_depth_meters = Column(Float, default=10.0)
+    fuel_available = Column(Boolean, default=True)
+    diesel_price_per_liter = Column(Float)
+    gasoline_price_per_liter = Column(Float)
+    electricity_available = Column(Boolean, default=True)
+    water_available = Column(Boolean, default=True)
+    wifi_available = Column(Boolean, default=True)
+    security_24h = Column(Boolean, default=True)
+    customs_available = Column(Boolean, default=False)
+    repair_services = Column(Boolean, default=True)
+    restaurant = Column(Boolean, default=True)
+    supermarket = Column(Boolean, default=False)
+    laundry = Column(Boolean, default=True)
+    operating_hours = Column(JSON, default=list)
+    seasonal_pricing = Column(JSON, default=list)
+    tax_rate = Column(Float, default=0.0)
+    manager_name = Column(String(200))
+    founded_year = Column(Integer)
+    certifications = Column(JSON, default=list)
+    accepts_megayachts = Column(Boolean, default=False)
+    has_travel_lift = Column(Boolean, default=False)
+    travel_lift_capacity_tons = Column(Float)
+
+
+class BerthRecord(Base):
+    """berths table"""
+    __tablename__ = "berths"
+
+    berth_id = Column(String(64), primary_key=True)
+    marina_id = Column(String(64), nullable=False)
+    section = Column(String(16), nullable=False)
+    number = Column(String(16), nullable=False)
+    length_meters = Column(Float, nullable=False)
+    width_meters = Column(Float, nullable=False)
+    depth_meters = Column(Float, nullable=False)
+    has_electricity = Column(Boolean, nullable=False)
+    has_water = Column(Boolean, nullable=False)
+    has_wifi = Column(Boolean, nullable=False)
+    daily_rate = Column(Float, nullable=False)
+    currency = Column(String(3), default="EUR")
+    status = Column(String(16), default="available")
+    current_boat_name = Column(String(200))
+    current_booking_id = Column(String(64))
+    berth_type = Column(String(32), default="standard")
+    max_beam_meters = Column(Float)
+    has_fuel = Column(Boolean, default=False)
+    has_pump_out = Column(Boolean, default=False)
+    has_shore_power_amps = Column(Integer)
+    last_maintenance_date = Column(String(32))
+
+    __table_args__ = (
+        # search_available_berths: marina + status + length range, ordered by price
+        Index("ix_berths_search", "marina_id", "status", "length_meters", "daily_rate"),
+        # Network-wide searches filtered by amenities
+        Index("ix_berths_amenities", "status", "has_electricity", "has_water", "daily_rate"),
+    )
+
+
+class BookingRecord(Base):
+    """bookings table"""
+    __tablename__ = "bookings"
+
+    booking_id = Column(String(64), primary_key=True)
+    berth_id = Column(String(64), nullable=False)
+    marina_id = Column(String(64), nullable=False, index=True)
+    customer_name = Column(String(200), nullable=False)
+    customer_email = Column(String(200), nullable=False)
+    customer_phone = Column(String(50), nullable=False)
+    boat_name = Column(String(200), nullable=False)
+    boat_length_meters = Column(Float, nullable=False)
+    check_in = Column(String(32), nullable=False)
+    check_out = Column(String(32), nullable=False)
+    total_nights = Column(Integer, nullable=False)
+    total_price = Column(Float, nullable=False)
+    currency = Column(String(3), default="EUR")
+    status = Column(String(16), default="pending")
+    created_at = Column(String(32), default="")
+    services_requested = Column(JSON, default=list)
+    boat_registration = Column(String(64))
+    boat_type = Column(String(64))
+    number_of_guests = Column(Integer, default=1)
+    special_requests = Column(String(2000))
+    payment_status = Column(String(16), default="pending")
+    payment_method = Column(String(32))
+
+    __table_args__ = (
+        # Date-overlap check for a berth
+        Index("ix_bookings_berth_dates", "berth_id", "check_in", "check_out"),
+    )
+
+
+# ============================================================================
+# MAPPING HELPERS
+# ============================================================================
+
+def _normalize_date(value: str) -> str:
+    """Normalise an ISO date/datetime so stored values compare lexicographically"""
+    return datetime.fromisoformat(value).isoformat()
+
+
+def _to_mapping(obj: Any) -> Dict[str, Any]:
+    """Dataclass -> column mapping (nested dataclasses become dicts)"""
+    return asdict(obj)
+
+
+def _to_berth(row: BerthRecord) -> Berth:
+    return Berth(**{f.name: getattr(row, f.name) for f in fields(Berth)})
+
+
+def _to_booking(row: BookingRecord) -> Booking:
+    data = {f.name: getattr(row, f.name) for f in fields(Booking)}
+    data["services_requested"] = list(data["services_requested"] or [])
+    return Booking(**data)
+
+
+def _to_marina(row: MarinaRecord) -> Marina:
+    data = {f.name: getattr(row, f.name) for f in fields(Marina)}
+    data["operating_hours"] = [OperatingHours(**h) for h in data["operating_hours"] or []]
+    data["seasonal_pricing"] = [SeasonalPricing(**p) for p in data["seasonal_pricing"] or []]
+    data["certifications"] = list(data["certifications"] or [])
+    return Marina(**data)
+
+
+def _overlap_exists(berth_id_column, start: str, end: str):
+    """EXISTS clause for a live booking overlapping [start, end)"""
+    return exists().where(
+        and_(
+            BookingRecord.berth_id == berth_id_column,
+            BookingRecord.status != "cancelled",
+            BookingRecord.check_in < end,
+            BookingRecord.check_out > start
+        )
+    )
+
+
+def _berth_search_query(
+    marina_id: Optional[str],
+    min_length: Optional[float],
+    max_length: Optional[float],
+    check_in: Optional[str],
+    check_out: Optional[str],
+    needs_electricity: bool,
+    needs_water: bool
+):
+    """
+    Build the berth search SELECT (results sorted by price)
+
+    Without dates, availability is the berth's current status. With
+    check_in/check_out, any berth not under maintenance qualifies as long
+    as no booking overlaps the range.
+    """
+    query = select(BerthRecord)
+
+    if marina_id:
+        query = query.where(BerthRecord.marina_id == marina_id)
+
+    if check_in and check_out:
+        try:
+            start, end = _normalize_date(check_in), _normalize_date(check_out)
+        except ValueError as e:
+            raise BookingError(f"Invalid date format: {e}")
+        query = query.where(
+            BerthRecord.status != "maintenance",
+            ~_overlap_exists(BerthRecord.berth_id, start, end)
+        )
+    else:
+        query = query.where(BerthRecord.status == "available")
+
+    if min_length:
+        query = query.where(BerthRecord.length_meters >= min_length)
+    if max_length:
+        query = query.where(BerthRecord.length_meters <= max_length)
+    if needs_electricity:
+        query = query.where(BerthRecord.has_electricity.is_(True))
+    if needs_water:
+        query = query.where(BerthRecord.has_water.is_(True))
+
+    return query.order_by(BerthRecord.daily_rate)
+
+
+def _parse_stay(check_in: str, check_out: str) -> Tuple[datetime, datetime, int]:
+    """Parse and validate a stay, returning (check_in, check_out, nights)"""
+    try:
+        check_in_dt = datetime.fromisoformat(check_in)
+        check_out_dt = datetime.fromisoformat(check_out)
+        nights = (check_out_dt - check_in_dt).days
+
+        if nights <= 0:
+            raise BookingError("Check-out must be after check-in")
+
+    except ValueError as e:
+        raise BookingError(f"Invalid date format: {e}")
+
+    return check_in_dt, check_out_dt, nights
+
+
+def _check_berth_bookable(berth: Berth, boat_length: float) -> None:
+    """Raise if the berth cannot take this boat at all"""
+    if not berth.is_in_service():
+        raise BerthNotAvailableError(
+            f"Berth {berth.berth_id} is {berth.status}"
+        )
+
+    if not berth.is_suitable_for_boat(boat_length):
+        raise BookingError(
+            f"Berth {berth.berth_id} ({berth.length_meters}m) too small "
+            f"for boat ({boat_length}m)"
+        )
+
+
+def _locked_berth_query(berth_id: str):
+    """Berth row with a row lock so concurrent workers cannot double-book (no-op on SQLite)"""
+    return select(BerthRecord).where(BerthRecord.berth_id == berth_id).with_for_update()
+
+
+def _new_booking(
+    berth: Berth,
+    customer_name: str,
+    customer_email: str,
+    customer_phone: str,
+    boat_name: str,
+    boat_length: float,
+    check_in_dt: datetime,
+    check_out_dt: datetime,
+    nights: int,
+    services: List[str]
+) -> Booking:
+    return Booking(
+        booking_id=f"BK-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid4().hex[:6]}",
+        berth_id=berth.berth_id,
+        marina_id=berth.marina_id,
+        customer_name=customer_name,
+        customer_email=customer_email,
+        customer_phone=customer_phone,
+        boat_name=boat_name,
+        boat_length_meters=boat_length,
+        check_in=check_in_dt.isoformat(),
+        check_out=check_out_dt.isoformat(),
+        total_nights=nights,
+        total_price=round(berth.daily_rate * nights, 2),
+        currency=berth.currency,
+        status="confirmed",
+        created_at=datetime.now().isoformat(),
+        services_requested=services
+    )
+
+
+def _mark_if_ongoing(row: BerthRecord, booking: Booking, check_in_dt: datetime, check_out_dt: datetime) -> None:
+    """Status only tracks the berth's current state"""
+    if check_in_dt <= datetime.now() < check_out_dt and row.status == "available":
+        row.status = "reserved"
+        row.current_booking_id = booking.booking_id
+        row.current_boat_name = booking.boat_name
+
+
+# ============================================================================
+# DATABASE
+# ============================================================================
+
+class SQLDatabase(DatabaseInterface):
+    """
+    DatabaseInterface backed by a SQL database via SQLAlchemy
+
+    All API workers pointed at the same database share one consistent view
+    of marinas, berths and bookings. Use ``sqlite:///:memory:`` for tests.
+    """
+
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        engine=None,
+        echo: bool = False,
+        create_tables: bool = True
+    ) -> None:
+        """
+        Args:
+            database_url: Connection URL; creates a dedicated engine
+            engine: Existing engine to use instead of ``database_url``
+            echo: Enable SQL query logging (only with ``database_url``)
+            create_tables: Create missing tables on startup
+        """
+        if engine is None:
+            engine = create_db_engine(database_url, echo=echo) if database_url else get_engine()
+
+        self.engine = engine
+        self._session_factory = sessionmaker(
+            bind=engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+        if create_tables:
+            Base.metadata.create_all(
+                bind=engine,
+                tables=[MarinaRecord.__table__, BerthRecord.__table__, BookingRecord.__table__]
+            )
+
+        logger.info(f"SQL database ready: {engine.url.render_as_string(hide_password=True)}")
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Transactional session scope"""
+        session = self._session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    # ------------------------------------------------------------------
+    # Bulk loading
+    # ------------------------------------------------------------------
+
+    def seed(
+        self,
+        marinas: Iterable[Marina],
+        berths: Iterable[Berth],
+        batch_size: int = 1000
+    ) -> None:
+        """Bulk insert marinas and berths (executemany in batches)"""
+        marina_rows = [_to_mapping(m) for m in marinas]
+        berth_rows = [_to_mapping(b) for b in berths]
+
+        with self._session() as session:
+            for start in range(0, len(marina_rows), batch_size):
+                session.bulk_insert_mappings(MarinaRecord, marina_rows[start:start + batch_size])
+            for start in range(0, len(berth_rows), batch_size):
+                session.bulk_insert_mappings(BerthRecord, berth_rows[start:start + batch_size])
+
+        logger.info(f"Seeded {len(marina_rows)} marinas and {len(berth_rows)} berths")
+
+    def seed_from(self, source: DatabaseInterface, batch_size: int = 1000) -> None:
+        """Copy marinas and berths from another DatabaseInterface (e.g. a mock)"""
+        self.seed(source.get_all_marinas(), source.get_all_berths(), batch_size=batch_size)
+
+    def import_bookings(self, bookings: Iterable[Booking], batch_size: int = 1000) -> int:
+        """
+        Bulk insert pre-validated bookings (e.g. migration from another system)
+
+        No availability checks are performed; use create_booking for that.
+
+        Returns:
+            Number of bookings inserted
+        """
+        rows = []
+        for booking in bookings:
+            row = _to_mapping(booking)
+            row["check_in"] = _normalize_date(booking.check_in)
+            row["check_out"] = _normalize_date(booking.check_out)
+            rows.append(row)
+
+        with self._session() as session:
+            for start in range(0, len(rows), batch_size):
+                session.bulk_insert_mappings(BookingRecord, rows[start:start + batch_size])
+
+        logger.info(f"Imported {len(rows)} bookings")
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # DatabaseInterface
+    # ------------------------------------------------------------------
+
+    def get_marina_by_id(self, marina_id: str) -> Optional[Marina]:
+        """Get marina by ID"""
+        with self._session() as session:
+            row = session.get(MarinaRecord, marina_id)
+            marina = _to_marina(row) if row else None
+
+        if marina:
+            logger.debug(f"Found marina: {marina.name}")
+        else:
+            logger.warning(f"Marina not found: {marina_id}")
+
+        return marina
+
+    def get_all_marinas(self) -> List[Marina]:
+        """Get all marinas"""
+        with self._session() as session:
+            rows = session.scalars(select(MarinaRecord)).all()
+            return [_to_marina(r) for r in rows]
+
+    def search_available_berths(
+        self,
+        marina_id: Optional[str] = None,
+        min_length: Optional[float] = None,
+        max_length: Optional[float] = None,
+        check_in: Optional[str] = None,
+        check_out: Optional[str] = None,
+        needs_electricity: bool = False,
+        needs_water: bool = False
+    ) -> List[Berth]:
+        """Search for available berths with filters (results sorted by price)"""
+        logger.info(
+            f"Searching berths: marina={marina_id}, "
+            f"length={min_length}-{max_length}, "
+            f"dates={check_in}-{check_out}, "
+            f"electricity={needs_electricity}, water={needs_water}"
+        )
+
+        query = _berth_search_query(
+            marina_id, min_length, max_length, check_in, check_out,
+            needs_electricity, needs_water
+        )
+
+        with self._session() as session:
+            results = [_to_berth(r) for r in session.scalars(query).all()]
+
+        logger.info(f"Found {len(results)} available berths")
+
+        return results
+
+    def get_berth_by_id(self, berth_id: str) -> Optional[Berth]:
+        """Get berth by ID"""
+        with self._session() as session:
+            row = session.get(BerthRecord, berth_id)
+            berth = _to_berth(row) if row else None
+
+        if berth:
+            logger.debug(f"Found berth: {berth.number}")
+        else:
+            logger.warning(f"Berth not found: {berth_id}")
+
+        return berth
+
+    def create_booking(
+        self,
+        berth_id: str,
+        customer_name: str,
+        customer_email: str,
+        customer_phone: str,
+        boat_name: str,
+        boat_length: float,
+        check_in: str,
+        check_out: str,
+        services: List[str]
+    ) -> Booking:
+        """Create a new booking"""
+
+        logger.info(f"Creating booking for berth: {berth_id}")
+
+        check_in_dt, check_out_dt, nights = _parse_stay(check_in, check_out)
+        start, end = check_in_dt.isoformat(), check_out_dt.isoformat()
+
+        with self._session() as session:
+            row = session.scalars(_locked_berth_query(berth_id)).first()
+            if not row:
+                raise BerthNotFoundError(f"Berth {berth_id} not found")
+
+            berth = _to_berth(row)
+            _check_berth_bookable(berth, boat_length)
+
+            if session.scalar(select(_overlap_exists(berth_id, start, end))):
+                raise BerthNotAvailableError(
+                    f"Berth {berth_id} is already booked between {check_in} and {check_out}"
+                )
+
+            booking = _new_booking(
+                berth, customer_name, customer_email, customer_phone, boat_name,
+                boat_length, check_in_dt, check_out_dt, nights, services
+            )
+            session.add(BookingRecord(**_to_mapping(booking)))
+            _mark_if_ongoing(row, booking, check_in_dt, check_out_dt)
+
+        logger.info(
+            f"Booking created: {booking.booking_id} for {nights} nights, "
+            f"{booking.currency} {booking.total_price:.2f}"
+        )
+
+        return booking
+
+    def get_booking_by_id(self, booking_id: str) -> Optional[Booking]:
+        """Get booking by ID"""
+        with self._session() as session:
+            row = session.get(BookingRecord, booking_id)
+            booking = _to_booking(row) if row else None
+
+        if booking:
+            logger.debug(f"Found booking: {booking_id}")
+        else:
+            logger.warning(f"Booking not found: {booking_id}")
+
+        return booking
+
+    def get_bookings_by_marina(self, marina_id: str) -> List[Booking]:
+        """Get all bookings for a marina"""
+        with self._session() as session:
+            rows = session.scalars(
+                select(BookingRecord)
+                .where(BookingRecord.marina_id == marina_id)
+                .order_by(BookingRecord.check_in)
+            ).all()
+            bookings = [_to_booking(r) for r in rows]
+
+        logger.debug(f"Found {len(bookings)} bookings for marina: {marina_id}")
+        return bookings
+
+    def get_all_berths(self) -> List[Berth]:
+        """Get all berths"""
+        with self._session() as session:
+            return [_to_berth(r) for r in session.scalars(select(BerthRecord)).all()]
+
+
+class AsyncSQLDatabase(AsyncDatabaseInterface):
+    """
+    AsyncDatabaseInterface over the same tables, using an async engine
+
+    Every call opens its own AsyncSession on a pooled connection, so calls
+    fanned out with asyncio.gather run concurrently instead of queueing
+    behind one session or blocking the event loop.
+    """
+
+    def __init__(self, database_url: Optional[str] = None, engine=None, echo: bool = False) -> None:
+        """
+        Args:
+            database_url: Connection URL (sync URLs are mapped to async drivers)
+            engine: Existing AsyncEngine to use instead of ``database_url``
+            echo: Enable SQL query logging (only with ``database_url``)
+        """
+        if engine is None:
+            engine = create_async_db_engine(database_url, echo=echo) if database_url else get_async_engine()
+
+        self.engine = engine
+        self._session_factory = async_sessionmaker(
+            bind=engine,
+            autoflush=False,
+            expire_on_commit=False
+        )
+
+    async def create_tables(self) -> None:
+        """Create missing tables"""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(
+                Base.metadata.create_all,
+                tables=[MarinaRecord.__table__, BerthRecord.__table__, BookingRecord.__table__]
+            )
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """Transactional async session scope"""
+        session = self._session_factory()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    async def seed(self, marinas: Iterable[Marina], berths: Iterable[Berth]) -> None:
+        """Insert marinas and berths (executemany)"""
+        marina_rows = [_to_mapping(m) for m in marinas]
+        berth_rows = [_to_mapping(b) for b in berths]
+
+        async with self._session() as session:
+            if marina_rows:
+                await session.execute(insert(MarinaRecord), marina_rows)
+            if berth_rows:
+                await session.execute(insert(BerthRecord), berth_rows)
+
+    async def get_marina_by_id(self, marina_id: str) -> Optional[Marina]:
+        """Get marina by ID"""
+        async with self._session() as session:
+            row = await session.get(MarinaRecord, marina_id)
+            return _to_marina(row) if row else None
+
+    async def get_all_marinas(self) -> List[Marina]:
+        """Get all marinas"""
+        async with self._session() as session:
+            rows = (await session.scalars(select(MarinaRecord))).all()
+            return [_to_marina(r) for r in rows]
+
+    async def search_available_berths(
+        self,
+        marina_id: Optional[str] = None,
+        min_length: Optional[float] = None,
+        max_length: Optional[float] = None,
+        check_in: Optional[str] = None,
+        check_out: Optional[str] = None,
+        needs_electricity: bool = False,
+        needs_water: bool = False
+    ) -> List[Berth]:
+        """Search for available berths with filters (results sorted by price)"""
+        query = _berth_search_query(
+            marina_id, min_length, max_length, check_in, check_out,
+            needs_electricity, needs_water
+        )
+
+        async with self._session() as session:
+            rows = (await session.scalars(query)).all()
+            return [_to_berth(r) for r in rows]
+
+    async def get_berth_by_id(self, berth_id: str) -> Optional[Berth]:
+        """Get berth by ID"""
+        async with self._session() as session:
+            row = await session.get(BerthRecord, berth_id)
+            return _to_berth(row) if row else None
+
+    async def create_booking(
+        self,
+        berth_id: str,
+        customer_name: str,
+        customer_email: str,
+        customer_phone: str,
+        boat_name: str,
+        boat_length: float,
+        check_in: str,
+        check_out: str,
+        services: List[str]
+    ) -> Booking:
+        """Create a new booking"""
+        check_in_dt, check_out_dt, nights = _parse_stay(check_in, check_out)
+        start, end = check_in_dt.isoformat(), check_out_dt.isoformat()
+
+        async with self._session() as session:
+            row = (await session.scalars(_locked_berth_query(berth_id))).first()
+            if not row:
+                raise BerthNotFoundError(f"Berth {berth_id} not found")
+
+            berth = _to_berth(row)
+            _check_berth_bookable(berth, boat_length)
+
+            if await session.scalar(select(_overlap_exists(berth_id, start, end))):
+                raise BerthNotAvailableError(
+                    f"Berth {berth_id} is already booked between {check_in} and {check_out}"
+                )
+
+            booking = _new_booking(
+                berth, customer_name, customer_email, customer_phone, boat_name,
+                boat_length, check_in_dt, check_out_dt, nights, services
+            )
+            session.add(BookingRecord(**_to_mapping(booking)))
+            _mark_if_ongoing(row, booking, check_in_dt, check_out_dt)
+
+        logger.info(f"Booking created: {booking.booking_id} for {nights} nights")
+
+        return booking
+
+    async def get_booking_by_id(self, booking_id: str) -> Optional[Booking]:
+        """Get booking by ID"""
+        async with self._session() as session:
+            row = await session.get(BookingRecord, booking_id)
+            return _to_booking(row) if row else None
+
+    async def get_bookings_by_marina(self, marina_id: str) -> List[Booking]:
+        """Get all bookings for a marina"""
+        async with self._session() as session:
+            rows = (await session.scalars(
+                select(BookingRecord)
+                .where(BookingRecord.marina_id == marina_id)
+                .order_by(BookingRecord.check_in)
+            )).all()
+            return [_to_booking(r) for r in rows]
+
+    async def get_all_berths(self) -> List[Berth]:
+        """Get all berths"""
+        async with self._session() as session:
+            rows = (await session.scalars(select(BerthRecord))).all()
+            return [_to_berth(r) for r in rows]
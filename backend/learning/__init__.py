@@ -12,6 +12,7 @@ This module provides advanced machine learning capabilities for Ada Maritime AI:
 
 from .models import (
     Experience,
+    ExperienceType,
     LearningStrategy,
     Prediction,
     SelfEdit,
@@ -28,7 +29,8 @@ from .gpu_accelerator import GPUAccelerator
 from .federated_learning import (
     FederatedLearningCoordinator,
     TenantModel,
-    GlobalModel
+    GlobalModel,
+    WeightLayout
 )
 from .ab_testing import (
     ABTestingFramework,
@@ -39,10 +41,12 @@ from .ab_testing import (
     ExperimentStatus,
     VariantType
 )
+from .sequential_testing import SequentialResult
 
 __all__ = [
     # Core models
     'Experience',
+    'ExperienceType',
     'LearningStrategy',
     'Prediction',
     'SelfEdit',
@@ -58,6 +62,7 @@ __all__ = [
     'FederatedLearningCoordinator',
     'TenantModel',
     'GlobalModel',
+    'WeightLayout',
     'ABTestingFramework',
     'Experiment',
     'Variant',
@@ -65,6 +70,7 @@ __all__ = [
     'ExperimentResult',
     'ExperimentStatus',
     'VariantType',
+    'SequentialResult',
 ]
 
 __version__ = '2.5.0'
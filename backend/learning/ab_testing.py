@@ -22,6 +22,9 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 from scipy import stats
 
+from .sequential_testing import SequentialResult, SequentialTest
+from .streaming_stats import StreamingStats
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +65,7 @@ class VariantMetrics:
     std_performance: float
     conversion_rate: float
     confidence_interval_95: tuple  # (lower, upper)
+    quantiles: Optional[Dict[str, float]] = None  # p50/p90/p95/p99 when histograms are enabled
 
 
 @dataclass
@@ -79,6 +83,7 @@ class Experiment:
     confidence_level: float  # e.g., 0.95 for 95%
     created_at: datetime
     created_by: str
+    sequential: bool = False  # Evaluate with mSPRT and stop early
 
 
 @dataclass
@@ -104,6 +109,7 @@ class ABTestingFramework:
     - Traffic allocation and bucketing
     - Feature flag integration
     - Automatic rollout recommendations
+    - Sequential (mSPRT) early stopping
     """
 
     DEFAULT_CONFIDENCE_LEVEL = 0.95
@@ -112,7 +118,12 @@ class ABTestingFramework:
     def __init__(
         self,
         confidence_level: float = DEFAULT_CONFIDENCE_LEVEL,
-        min_sample_size: int = DEFAULT_MIN_SAMPLE_SIZE
+        min_sample_size: int = DEFAULT_MIN_SAMPLE_SIZE,
+        histogram_bins: Optional[int] = None,
+        reservoir_size: int = 0,
+        sequential: bool = False,
+        sequential_tau: float = 0.1,
+        sequential_min_samples: int = 30
     ):
         """
         Initialize A/B testing framework
@@ -120,14 +131,27 @@ class ABTestingFramework:
         Args:
             confidence_level: Confidence level for statistical tests (e.g., 0.95)
             min_sample_size: Minimum samples per variant
+            histogram_bins: Track score quantiles with this many buckets per variant
+            reservoir_size: Keep a uniform sample of this many raw scores per
+                variant for export (0 disables)
+            sequential: Default for new experiments - evaluate after every
+                outcome and complete as soon as an mSPRT boundary is crossed
+            sequential_tau: Effect size (score units) the sequential test is tuned for
+            sequential_min_samples: Samples per variant before sequential checks start
         """
         self.confidence_level = confidence_level
         self.min_sample_size = min_sample_size
+        self.histogram_bins = histogram_bins
+        self.reservoir_size = reservoir_size
+        self.sequential = sequential
+        self.sequential_tau = sequential_tau
+        self.sequential_min_samples = sequential_min_samples
 
         # State
         self.experiments: Dict[str, Experiment] = {}
-        self.variant_data: Dict[str, Dict[str, List[float]]] = {}  # {exp_id: {variant_id: [scores]}}
+        self.variant_data: Dict[str, Dict[str, StreamingStats]] = {}  # {exp_id: {variant_id: stats}}
         self.user_assignments: Dict[str, Dict[str, str]] = {}  # {exp_id: {user_id: variant_id}}
+        self.sequential_tests: Dict[str, SequentialTest] = {}
 
         # Statistics
         self.stats = {
@@ -135,6 +159,7 @@ class ABTestingFramework:
             'running_experiments': 0,
             'completed_experiments': 0,
             'total_assignments': 0,
+            'early_stopped_experiments': 0,
         }
 
         logger.info(
@@ -150,7 +175,8 @@ class ABTestingFramework:
         target_metric: str,
         created_by: str,
         minimum_sample_size: Optional[int] = None,
-        confidence_level: Optional[float] = None
+        confidence_level: Optional[float] = None,
+        sequential: Optional[bool] = None
     ) -> Experiment:
         """
         Create new A/B test experiment
@@ -163,6 +189,7 @@ class ABTestingFramework:
             created_by: Creator identifier
             minimum_sample_size: Override minimum sample size
             confidence_level: Override confidence level
+            sequential: Override sequential (early stopping) mode
 
         Returns:
             Created experiment
@@ -192,10 +219,17 @@ class ABTestingFramework:
             confidence_level=confidence_level or self.confidence_level,
             created_at=datetime.now(),
             created_by=created_by,
+            sequential=self.sequential if sequential is None else sequential,
         )
 
         self.experiments[experiment_id] = experiment
-        self.variant_data[experiment_id] = {v.variant_id: [] for v in variants}
+        self.variant_data[experiment_id] = {
+            v.variant_id: StreamingStats(
+                histogram_bins=self.histogram_bins,
+                reservoir_size=self.reservoir_size
+            )
+            for v in variants
+        }
         self.user_assignments[experiment_id] = {}
 
         self.stats['total_experiments'] += 1
@@ -227,6 +261,19 @@ class ABTestingFramework:
         experiment.status = ExperimentStatus.RUNNING
         experiment.start_date = datetime.now()
 
+        if experiment.sequential:
+            control_id = next(
+                v.variant_id for v in experiment.variants if v.variant_type == VariantType.CONTROL
+            )
+            self.sequential_tests[experiment_id] = SequentialTest(
+                experiment_id=experiment_id,
+                control_id=control_id,
+                treatment_ids=[v.variant_id for v in experiment.variants if v.variant_id != control_id],
+                alpha=1 - experiment.confidence_level,
+                tau=self.sequential_tau,
+                min_samples=self.sequential_min_samples,
+            )
+
         self.stats['running_experiments'] += 1
 
         logger.info(f"Experiment started: {experiment.name}")
@@ -309,10 +356,43 @@ class ABTestingFramework:
         if variant_id not in self.variant_data[experiment_id]:
             return False
 
-        self.variant_data[experiment_id][variant_id].append(performance_score)
+        self.variant_data[experiment_id][variant_id].add(performance_score)
+
+        if experiment_id in self.sequential_tests:
+            self._evaluate_sequential(experiment_id)
 
         return True
 
+    def _evaluate_sequential(self, experiment_id: str) -> None:
+        """Update the experiment's mSPRT and complete it once a boundary is crossed"""
+        experiment = self.experiments[experiment_id]
+        if experiment.status != ExperimentStatus.RUNNING:
+            return
+
+        result = self.sequential_tests[experiment_id].update(self.variant_data[experiment_id])
+        if not result.stopped:
+            return
+
+        logger.info(
+            f"Sequential boundary crossed: {experiment.name}, winner={result.winner}, "
+            f"samples={result.samples_at_stop}, p={min(result.p_values.values()):.4f}"
+        )
+        if self.complete_experiment(experiment_id):
+            self.stats['early_stopped_experiments'] += 1
+
+    def get_sequential_result(self, experiment_id: str) -> Optional[SequentialResult]:
+        """
+        Current sequential analysis state of an experiment
+
+        Args:
+            experiment_id: Experiment identifier
+
+        Returns:
+            Always-valid p-values and decisions, or None if not sequential
+        """
+        test = self.sequential_tests.get(experiment_id)
+        return test.result if test is not None else None
+
     def get_variant_metrics(
         self,
         experiment_id: str,
@@ -336,14 +416,14 @@ class ABTestingFramework:
 
         scores = self.variant_data[experiment_id][variant_id]
 
-        if len(scores) == 0:
+        if scores.count == 0:
             return None
 
-        sample_count = len(scores)
-        success_count = sum(1 for s in scores if s > 0.5)
-        total_performance = sum(scores)
-        avg_performance = np.mean(scores)
-        std_performance = np.std(scores)
+        sample_count = scores.count
+        success_count = scores.success_count
+        total_performance = scores.total
+        avg_performance = scores.mean
+        std_performance = scores.std
         conversion_rate = success_count / sample_count
 
         # 95% confidence interval
@@ -362,13 +442,29 @@ class ABTestingFramework:
             std_performance=std_performance,
             conversion_rate=conversion_rate,
             confidence_interval_95=ci,
+            quantiles={
+                f"p{int(q * 100)}": scores.quantile(q) for q in (0.5, 0.9, 0.95, 0.99)
+            } if scores.histogram is not None else None,
         )
 
+    def get_variant_samples(self, experiment_id: str, variant_id: str) -> List[float]:
+        """
+        Reservoir sample of raw scores for a variant
+
+        Empty unless the framework was created with ``reservoir_size``.
+        """
+        variants = self.variant_data.get(experiment_id, {})
+        scores = variants.get(variant_id)
+        return scores.samples if scores is not None else []
+
     def analyze_experiment(self, experiment_id: str) -> Optional[ExperimentResult]:
         """
         Analyze experiment and determine winner
 
-        Uses t-test for continuous metrics, chi-square for binary
+        Uses t-test for continuous metrics, chi-square for binary. Once a
+        sequential experiment has crossed its mSPRT boundary, the result is
+        built from the sequential decision instead and the fixed-horizon
+        ``minimum_sample_size`` does not apply.
 
         Args:
             experiment_id: Experiment identifier
@@ -380,11 +476,17 @@ class ABTestingFramework:
             return None
 
         experiment = self.experiments[experiment_id]
+        sequential = self.get_sequential_result(experiment_id)
+        stopped_early = sequential is not None and sequential.stopped
 
         # Get metrics for all variants
         variant_metrics = {}
         for variant in experiment.variants:
             metrics = self.get_variant_metrics(experiment_id, variant.variant_id)
+            if stopped_early:
+                if metrics is not None:
+                    variant_metrics[variant.variant_id] = metrics
+                continue
             if metrics is None or metrics.sample_count < experiment.minimum_sample_size:
                 logger.warning(
                     f"Insufficient data for variant {variant.variant_id}: "
@@ -406,7 +508,12 @@ class ABTestingFramework:
         if control_variant_id is None:
             return None
 
-        control_scores = self.variant_data[experiment_id][control_variant_id]
+        control = self.variant_data[experiment_id][control_variant_id]
+
+        if stopped_early:
+            return self._sequential_experiment_result(
+                experiment, variant_metrics, control_variant_id, sequential
+            )
 
         # Compare each treatment to control
         best_variant_id = control_variant_id
@@ -415,18 +522,16 @@ class ABTestingFramework:
         max_effect_size = 0.0
 
         for treatment_id in treatment_variant_ids:
-            treatment_scores = self.variant_data[experiment_id][treatment_id]
-
-            # t-test for significance
-            t_stat, p_value = stats.ttest_ind(treatment_scores, control_scores)
+            treatment = self.variant_data[experiment_id][treatment_id]
 
-            # Cohen's d for effect size
-            pooled_std = np.sqrt(
-                (np.var(treatment_scores) + np.var(control_scores)) / 2
+            # t-test for significance (from the running moments)
+            t_stat, p_value = stats.ttest_ind_from_stats(
+                treatment.mean, np.sqrt(treatment.sample_variance), treatment.count,
+                control.mean, np.sqrt(control.sample_variance), control.count
             )
-            effect_size = abs(
-                (np.mean(treatment_scores) - np.mean(control_scores)) / pooled_std
-            ) if pooled_std > 0 else 0.0
+            p_value = float(p_value)
+
+            effect_size = self._effect_size(treatment, control)
 
             logger.debug(
                 f"Variant {treatment_id} vs control: p={p_value:.4f}, d={effect_size:.2f}"
@@ -475,6 +580,57 @@ class ABTestingFramework:
 
         return result
 
+    @staticmethod
+    def _effect_size(treatment: StreamingStats, control: StreamingStats) -> float:
+        """Cohen's d between two variants"""
+        pooled_std = np.sqrt((treatment.variance + control.variance) / 2)
+        return float(abs((treatment.mean - control.mean) / pooled_std)) if pooled_std > 0 else 0.0
+
+    def _sequential_experiment_result(
+        self,
+        experiment: Experiment,
+        variant_metrics: Dict[str, VariantMetrics],
+        control_variant_id: str,
+        sequential: SequentialResult
+    ) -> ExperimentResult:
+        """ExperimentResult for a sequential experiment that stopped at a boundary"""
+        variants = self.variant_data[experiment.experiment_id]
+        winner = sequential.winner
+
+        # The treatment that decided the test: the winner, or (if the control
+        # won) the treatment that lost most clearly
+        decisive_id = winner if winner != control_variant_id else min(
+            sequential.p_values, key=sequential.p_values.get
+        )
+        p_value = sequential.p_values[decisive_id]
+        effect_size = self._effect_size(variants[decisive_id], variants[control_variant_id])
+
+        if winner == control_variant_id:
+            recommendation = "Control performs best. No changes recommended."
+        else:
+            improvement = (variants[winner].mean - variants[control_variant_id].mean) * 100
+            recommendation = (
+                f"Roll out variant {winner}. "
+                f"Expected improvement: {improvement:.1f}%"
+            )
+        recommendation += f" (sequential test stopped early after {sequential.samples_at_stop} samples)"
+
+        logger.info(
+            f"Experiment analyzed (sequential): {experiment.name}, "
+            f"winner={winner}, p={p_value:.4f}"
+        )
+
+        return ExperimentResult(
+            experiment_id=experiment.experiment_id,
+            variant_metrics=variant_metrics,
+            winner=winner,
+            statistical_significance=True,
+            p_value=p_value,
+            effect_size=effect_size,
+            recommendation=recommendation,
+            completed_at=sequential.stopped_at or datetime.now(),
+        )
+
     def complete_experiment(self, experiment_id: str) -> bool:
         """
         Mark experiment as completed
@@ -533,6 +689,11 @@ class ABTestingFramework:
                 'result': asdict(result) if result else None,
                 'exported_at': datetime.now().isoformat(),
             }
+            if self.reservoir_size:
+                export_data['samples'] = {
+                    variant_id: scores.samples
+                    for variant_id, scores in self.variant_data[experiment_id].items()
+                }
 
             # Convert datetime objects to strings
             export_data['experiment']['created_at'] = export_data['experiment']['created_at'].isoformat()
@@ -544,6 +705,8 @@ class ABTestingFramework:
                 export_data['experiment']['end_date'].isoformat()
                 if export_data['experiment']['end_date'] else None
             )
+            if export_data['result']:
+                export_data['result']['completed_at'] = export_data['result']['completed_at'].isoformat()
 
             with open(filepath, 'w') as f:
                 json.dump(export_data, f, indent=2)
@@ -12,7 +12,7 @@ This is the main entry point for the learning system.
 """
 
 import logging
-from typing import Dict, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from .models import (
@@ -160,6 +160,70 @@ class ExperienceLearningPipeline:
 
         return prediction
 
+    def predict_batch(
+        self,
+        experiences: List[Experience],
+        target: str = "outcome",
+        chunk_size: int = 128
+    ) -> List[Optional[Prediction]]:
+        """
+        Predict many experiences, batching work per strategy
+
+        Experiences routed to TabPFN or Hybrid share one TabPFN batch call
+        (one distance-matrix pass per chunk); SEAL patterns are fetched
+        once per batch instead of once per experience.
+
+        Args:
+            experiences: Experiences to predict
+            target: Target variable to predict
+            chunk_size: Queries per TabPFN distance-matrix pass
+
+        Returns:
+            Predictions in input order (None where predict() would return None)
+        """
+        results: List[Optional[Prediction]] = [None] * len(experiences)
+        routed: Dict[LearningStrategy, List[int]] = {strategy: [] for strategy in LearningStrategy}
+
+        for i, experience in enumerate(experiences):
+            sample_count = self._get_sample_count(experience.experience_type)
+            routed[self._select_strategy(sample_count)].append(i)
+
+        tabpfn_indices = routed[LearningStrategy.TABPFN] + routed[LearningStrategy.HYBRID]
+        tabpfn_preds: Dict[int, Optional[Prediction]] = {}
+        if self.tabpfn and tabpfn_indices:
+            batch = self.tabpfn.predict_batch(
+                [experiences[i] for i in tabpfn_indices], target, chunk_size=chunk_size
+            )
+            tabpfn_preds = dict(zip(tabpfn_indices, batch))
+
+        hybrid_patterns = self.seal.get_patterns(min_confidence=0.6) if self.seal else []
+        seal_patterns = [p for p in hybrid_patterns if p.confidence >= 0.7]
+
+        for i in routed[LearningStrategy.TABPFN]:
+            results[i] = tabpfn_preds.get(i)
+
+        for i in routed[LearningStrategy.HYBRID]:
+            experience = experiences[i]
+            if not self.tabpfn or not self.seal:
+                results[i] = tabpfn_preds.get(i) or self._seal_prediction(experience, seal_patterns)
+            elif tabpfn_preds.get(i):
+                results[i] = self._enhance_with_patterns(tabpfn_preds[i], experience, hybrid_patterns)
+            else:
+                results[i] = self._seal_prediction(experience, seal_patterns)
+
+        for i in routed[LearningStrategy.SEAL]:
+            results[i] = self._seal_prediction(experiences[i], seal_patterns) if self.seal else None
+
+        for strategy, indices in routed.items():
+            self.strategy_usage[strategy] += sum(1 for i in indices if results[i])
+
+        logger.info(
+            f"Batch prediction: {len(experiences)} experiences "
+            f"({', '.join(f'{s.value}={len(ix)}' for s, ix in routed.items() if ix)})"
+        )
+
+        return results
+
     def get_recommended_strategy(self, experience_type: ExperienceType) -> Dict[str, Any]:
         """
         Get recommended strategy for experience type
@@ -344,8 +408,17 @@ class ExperienceLearningPipeline:
             return self._predict_with_seal(experience, target)
 
         # Enhance with SEAL insights
-        seal_patterns = self.seal.get_patterns(min_confidence=0.6)
+        return self._enhance_with_patterns(
+            tabpfn_pred, experience, self.seal.get_patterns(min_confidence=0.6)
+        )
 
+    def _enhance_with_patterns(
+        self,
+        tabpfn_pred: Prediction,
+        experience: Experience,
+        seal_patterns: List[Any]
+    ) -> Prediction:
+        """Adjust a TabPFN prediction with matching SEAL patterns (hybrid mode)"""
         # Check if any patterns apply
         applicable_patterns = [
             pattern for pattern in seal_patterns
@@ -373,7 +446,7 @@ class ExperienceLearningPipeline:
         tabpfn_pred.confidence = adjusted_confidence
         tabpfn_pred.strategy = LearningStrategy.HYBRID
 
-        logger.info(
+        logger.debug(
             f"Hybrid prediction: {tabpfn_pred.predicted_outcome} "
             f"(confidence: {adjusted_confidence:.2f}, patterns: {len(applicable_patterns)})"
         )
@@ -394,9 +467,14 @@ class ExperienceLearningPipeline:
             logger.warning("SEAL not enabled")
             return None
 
-        # Get relevant patterns
-        patterns = self.seal.get_patterns(min_confidence=0.7)
+        return self._seal_prediction(experience, self.seal.get_patterns(min_confidence=0.7))
 
+    def _seal_prediction(
+        self,
+        experience: Experience,
+        patterns: List[Any]
+    ) -> Optional[Prediction]:
+        """Build a SEAL prediction from pre-fetched patterns (confidence >= 0.7)"""
         # Find matching patterns
         matching_patterns = [
             pattern for pattern in patterns
@@ -428,7 +506,7 @@ class ExperienceLearningPipeline:
             ]
         )
 
-        logger.info(
+        logger.debug(
             f"SEAL prediction: {predicted_outcome} "
             f"(confidence: {confidence:.2f}, pattern: {best_pattern.pattern_id})"
         )
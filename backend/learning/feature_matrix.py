@@ -0,0 +1,262 @@
+"""
+Feature Matrix - Incrementally encoded training features for KNN search
+
+Keeps the feature dicts produced by TabPFNAdapter._extract_features in
+dense NumPy columns so nearest-neighbour queries are a handful of array
+operations instead of a Python loop over every training sample.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+# Cell kinds
+ABSENT = 0   # Key not present in the sample
+NUMERIC = 1  # int / float / bool
+STRING = 2   # Categorical, stored as a per-column ordinal code
+OTHER = 3    # None or any other type - always counts as a mismatch
+
+
+class FeatureMatrix:
+    """
+    Fixed-capacity ring buffer of encoded feature vectors
+
+    Each feature key gets a column. A cell stores its kind (absent /
+    numeric / string / other), the numeric value and the categorical code,
+    which is enough to reproduce the adapter's mixed-type distance exactly:
+
+    - key missing or None on either side: 1
+    - both numeric: squared difference (optionally divided by the column
+      variance when ``normalize_numeric`` is enabled)
+    - both strings: 0 if equal else 1
+    - anything else: 1
+
+    Once ``capacity`` rows are stored, new rows overwrite the oldest one.
+    """
+
+    def __init__(self, capacity: int, normalize_numeric: bool = False, initial_rows: int = 64):
+        self.capacity = capacity
+        self.normalize_numeric = normalize_numeric
+
+        self._columns: Dict[str, int] = {}
+        self._codes: List[Dict[str, int]] = []  # Per-column string -> ordinal
+        self._rows = min(initial_rows, capacity)
+        self._allocate(self._rows, 8)
+
+        self._items: List[Any] = [None] * self.capacity
+        self._size = 0
+        self._next_slot = 0
+        self._next_seq = 0
+
+    def _allocate(self, rows: int, cols: int) -> None:
+        self._kind = np.zeros((rows, cols), dtype=np.int8)
+        self._num = np.zeros((rows, cols), dtype=np.float64)
+        self._cat = np.full((rows, cols), -1, dtype=np.int32)
+        self._seq = np.zeros(rows, dtype=np.int64)
+        # Per-column running sums over numeric cells (for scaling)
+        self._col_count = np.zeros(cols, dtype=np.int64)
+        self._col_sum = np.zeros(cols, dtype=np.float64)
+        self._col_sumsq = np.zeros(cols, dtype=np.float64)
+
+    def _grow(self, rows: int, cols: int) -> None:
+        old = (self._kind, self._num, self._cat, self._seq,
+               self._col_count, self._col_sum, self._col_sumsq)
+        r, c = self._kind.shape
+        self._allocate(rows, cols)
+        self._kind[:r, :c] = old[0]
+        self._num[:r, :c] = old[1]
+        self._cat[:r, :c] = old[2]
+        self._seq[:r] = old[3]
+        self._col_count[:c] = old[4]
+        self._col_sum[:c] = old[5]
+        self._col_sumsq[:c] = old[6]
+        self._rows = rows
+
+    def _column(self, key: str) -> int:
+        col = self._columns.get(key)
+        if col is None:
+            col = self._columns[key] = len(self._columns)
+            self._codes.append({})
+            if col >= self._kind.shape[1]:
+                self._grow(self._rows, self._kind.shape[1] * 2)
+        return col
+
+    def add(self, features: Dict[str, Any], item: Any) -> None:
+        """Encode and store a feature dict, evicting the oldest row when full"""
+        slot = self._next_slot
+        if slot >= self._rows:
+            self._grow(min(self._rows * 2, self.capacity), self._kind.shape[1])
+
+        if self._items[slot] is not None:
+            self._clear_row(slot)
+
+        for key, value in features.items():
+            col = self._column(key)
+            if isinstance(value, (int, float)):
+                self._kind[slot, col] = NUMERIC
+                self._num[slot, col] = value
+                self._col_count[col] += 1
+                self._col_sum[col] += value
+                self._col_sumsq[col] += value * value
+            elif isinstance(value, str):
+                codes = self._codes[col]
+                self._kind[slot, col] = STRING
+                self._cat[slot, col] = codes.setdefault(value, len(codes))
+            else:
+                self._kind[slot, col] = OTHER
+
+        self._items[slot] = item
+        self._seq[slot] = self._next_seq
+        self._next_seq += 1
+        self._next_slot = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def _clear_row(self, slot: int) -> None:
+        numeric = self._kind[slot] == NUMERIC
+        values = self._num[slot, numeric]
+        self._col_count[numeric] -= 1
+        self._col_sum[numeric] -= values
+        self._col_sumsq[numeric] -= values * values
+
+        self._kind[slot] = ABSENT
+        self._num[slot] = 0.0
+        self._cat[slot] = -1
+        self._items[slot] = None
+
+    def _encode_query(self, features: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """Query vectors over known columns plus the count of unseen keys"""
+        cols = self._kind.shape[1]
+        kind = np.zeros(cols, dtype=np.int8)
+        num = np.zeros(cols, dtype=np.float64)
+        cat = np.full(cols, -2, dtype=np.int32)  # -2 never matches a stored code
+        unseen = 0
+
+        for key, value in features.items():
+            col = self._columns.get(key)
+            if col is None:
+                unseen += 1  # Absent from every stored row
+                continue
+            if isinstance(value, (int, float)):
+                kind[col] = NUMERIC
+                num[col] = value
+            elif isinstance(value, str):
+                kind[col] = STRING
+                cat[col] = self._codes[col].get(value, -2)
+            else:
+                kind[col] = OTHER
+
+        return kind, num, cat, unseen
+
+    def _column_variance(self) -> np.ndarray:
+        count = np.maximum(self._col_count, 1)
+        mean = self._col_sum / count
+        variance = self._col_sumsq / count - mean * mean
+        return np.where(variance > 1e-12, variance, 1.0)
+
+    def distances(self, features: Dict[str, Any]) -> np.ndarray:
+        """Distance from ``features`` to every stored row (slot order)"""
+        n = self._size
+        q_kind, q_num, q_cat, unseen = self._encode_query(features)
+        kind = self._kind[:n]
+
+        # Start from "key present on at least one side" = 1, then overwrite
+        # cells where both sides are comparable
+        cell = ((kind != ABSENT) | (q_kind != ABSENT)).astype(np.float64)
+
+        both_num = (kind == NUMERIC) & (q_kind == NUMERIC)
+        if both_num.any():
+            diff_sq = (self._num[:n] - q_num) ** 2
+            if self.normalize_numeric:
+                diff_sq /= self._column_variance()
+            cell = np.where(both_num, diff_sq, cell)
+
+        both_str = (kind == STRING) & (q_kind == STRING)
+        if both_str.any():
+            cell = np.where(both_str, self._cat[:n] != q_cat, cell)
+
+        return np.sqrt(cell.sum(axis=1) + unseen)
+
+    def distances_batch(self, queries: List[Dict[str, Any]]) -> np.ndarray:
+        """
+        Distance matrix (queries x stored rows) in one pass over the columns
+
+        Equivalent to stacking distances() per query, but the cost is one
+        broadcast per column instead of one full-matrix pass per query.
+        """
+        n = self._size
+        if not queries:
+            return np.zeros((0, n))
+
+        encoded = [self._encode_query(features) for features in queries]
+        q_kind = np.stack([e[0] for e in encoded])
+        q_num = np.stack([e[1] for e in encoded])
+        q_cat = np.stack([e[2] for e in encoded])
+        total = np.array([e[3] for e in encoded], dtype=np.float64)[:, None].repeat(n, axis=1)
+
+        variance = self._column_variance() if self.normalize_numeric else None
+        for col in range(len(self._columns)):
+            kind = self._kind[:n, col]
+            qk = q_kind[:, col]
+            row_present = kind != ABSENT
+            query_present = qk != ABSENT
+            if not query_present.any():
+                total += row_present
+                continue
+
+            cell = (row_present[None, :] | query_present[:, None]).astype(np.float64)
+
+            both_num = (kind == NUMERIC)[None, :] & (qk == NUMERIC)[:, None]
+            if both_num.any():
+                diff_sq = (self._num[:n, col][None, :] - q_num[:, col][:, None]) ** 2
+                if variance is not None:
+                    diff_sq /= variance[col]
+                cell = np.where(both_num, diff_sq, cell)
+
+            both_str = (kind == STRING)[None, :] & (qk == STRING)[:, None]
+            if both_str.any():
+                mismatch = self._cat[:n, col][None, :] != q_cat[:, col][:, None]
+                cell = np.where(both_str, mismatch, cell)
+
+            total += cell
+
+        return np.sqrt(total)
+
+    def _top_k(self, distances: np.ndarray, k: int) -> List[Tuple[Any, float]]:
+        if k < len(distances):
+            candidates = np.argpartition(distances, k - 1)[:k]
+        else:
+            candidates = np.arange(len(distances))
+
+        order = np.lexsort((self._seq[candidates], distances[candidates]))
+        return [
+            (self._items[slot], float(distances[slot]))
+            for slot in candidates[order]
+        ]
+
+    def nearest(self, features: Dict[str, Any], k: int) -> List[Tuple[Any, float]]:
+        """K closest stored items as (item, distance), ties broken by insertion order"""
+        if self._size == 0 or k <= 0:
+            return []
+
+        return self._top_k(self.distances(features), k)
+
+    def nearest_batch(self, queries: List[Dict[str, Any]], k: int) -> List[List[Tuple[Any, float]]]:
+        """nearest() for several queries sharing one distance-matrix pass"""
+        if self._size == 0 or k <= 0:
+            return [[] for _ in queries]
+        return [self._top_k(row, k) for row in self.distances_batch(queries)]
+
+    def clear(self) -> None:
+        """Drop all rows and columns"""
+        self._columns.clear()
+        self._codes.clear()
+        self._rows = min(64, self.capacity)
+        self._allocate(self._rows, 8)
+        self._items = [None] * self.capacity
+        self._size = 0
+        self._next_slot = 0
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return self._size
@@ -15,40 +15,93 @@ import logging
 import hashlib
 import json
 import numpy as np
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
-from collections import defaultdict
 
 from .models import Experience, Pattern, LearningStrategy
 
 logger = logging.getLogger(__name__)
 
 
+WeightsLike = Union[Dict[str, float], np.ndarray]
+
+
+class WeightLayout:
+    """
+    Fixed parameter order shared by every tenant of a coordinator
+
+    Maps weight names to positions in a dense float32 vector. New names are
+    appended, so vectors built under an older (shorter) layout stay valid
+    and are zero-padded on use - the same as a missing key contributing 0.
+    """
+
+    def __init__(self, keys: Optional[List[str]] = None):
+        self.keys: List[str] = []
+        self._index: Dict[str, int] = {}
+        for key in keys or []:
+            self._add(key)
+
+    def _add(self, key: str) -> int:
+        idx = self._index[key] = len(self.keys)
+        self.keys.append(key)
+        return idx
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def positions(self, keys: Any) -> List[int]:
+        """Vector positions of ``keys`` (extends the layout with new keys)"""
+        index = self._index
+        return [index[k] if k in index else self._add(k) for k in keys]
+
+    def to_vector(self, weights: Dict[str, float]) -> np.ndarray:
+        """Dense float32 vector for a weight dict (extends the layout with new keys)"""
+        positions = self.positions(weights)
+        vector = np.zeros(len(self.keys), dtype=np.float32)
+        vector[positions] = list(weights.values())
+        return vector
+
+    def to_dict(self, vector: np.ndarray) -> Dict[str, float]:
+        return dict(zip(self.keys, vector.tolist()))
+
+
 @dataclass
 class TenantModel:
     """Model update from a single tenant/marina"""
     tenant_id: str
     marina_name: str
-    model_weights: Dict[str, float]
+    weights: np.ndarray  # float32, aligned with weight_keys
+    weight_keys: List[str]  # Prefix of the coordinator's WeightLayout
     sample_count: int
     performance_metrics: Dict[str, float]
     timestamp: datetime
     privacy_budget: float  # Differential privacy budget spent
 
+    @property
+    def model_weights(self) -> Dict[str, float]:
+        """Weights as a name -> value dict"""
+        return dict(zip(self.weight_keys, self.weights.tolist()))
+
 
 @dataclass
 class GlobalModel:
     """Aggregated global model"""
     model_id: str
     version: int
-    aggregated_weights: Dict[str, float]
+    weight_keys: List[str]
+    weights: np.ndarray  # float32, aligned with weight_keys
     participating_tenants: List[str]
     total_samples: int
     avg_performance: float
     created_at: datetime
     privacy_guarantee: float  # Epsilon for differential privacy
 
+    @property
+    def aggregated_weights(self) -> Dict[str, float]:
+        """Weights as a name -> value dict"""
+        return dict(zip(self.weight_keys, self.weights.tolist()))
+
 
 class FederatedLearningCoordinator:
     """
@@ -70,7 +123,9 @@ class FederatedLearningCoordinator:
         self,
         privacy_epsilon: float = DEFAULT_PRIVACY_EPSILON,
         min_participants: int = DEFAULT_MIN_PARTICIPANTS,
-        enable_privacy: bool = True
+        enable_privacy: bool = True,
+        weight_keys: Optional[List[str]] = None,
+        seed: Optional[int] = None
     ):
         """
         Initialize federated learning coordinator
@@ -79,10 +134,15 @@ class FederatedLearningCoordinator:
             privacy_epsilon: Privacy budget (smaller = more private)
             min_participants: Minimum participants for aggregation
             enable_privacy: Enable differential privacy
+            weight_keys: Parameter order for array submissions (grows from
+                dict submissions when omitted)
+            seed: Seed for the differential privacy noise generator
         """
         self.privacy_epsilon = privacy_epsilon
         self.min_participants = min_participants
         self.enable_privacy = enable_privacy
+        self.layout = WeightLayout(weight_keys)
+        self._rng = np.random.default_rng(seed)
 
         # State
         self.tenant_models: Dict[str, TenantModel] = {}
@@ -132,7 +192,7 @@ class FederatedLearningCoordinator:
         tenant_id: str,
         marina_name: str,
         experiences: List[Experience],
-        model_weights: Dict[str, float],
+        model_weights: WeightsLike,
         performance_metrics: Dict[str, float]
     ) -> bool:
         """
@@ -142,7 +202,8 @@ class FederatedLearningCoordinator:
             tenant_id: Tenant identifier
             marina_name: Marina name
             experiences: Local training experiences
-            model_weights: Local model weights
+            model_weights: Local model weights, as a dict or as an array in
+                ``layout.keys`` order
             performance_metrics: Performance metrics
 
         Returns:
@@ -153,11 +214,27 @@ class FederatedLearningCoordinator:
             logger.warning(f"Tenant {tenant_id} not opted in, rejecting submission")
             return False
 
+        # Noise goes only on the parameters the tenant submitted; positions
+        # it left out stay 0, like a missing key
+        submitted: Optional[List[int]] = None
+        if isinstance(model_weights, dict):
+            submitted = self.layout.positions(model_weights)
+            model_weights = self.layout.to_vector(model_weights)
+        else:
+            model_weights = np.asarray(model_weights, dtype=np.float32)
+            if model_weights.ndim != 1 or len(model_weights) > len(self.layout):
+                logger.warning(
+                    f"Tenant {tenant_id} submitted {model_weights.shape} weights, "
+                    f"layout has {len(self.layout)} parameters"
+                )
+                return False
+
         # Apply differential privacy
         if self.enable_privacy:
             model_weights = self._apply_differential_privacy(
                 model_weights,
-                self.privacy_epsilon
+                self.privacy_epsilon,
+                positions=submitted
             )
             privacy_budget = self.privacy_epsilon
         else:
@@ -167,7 +244,8 @@ class FederatedLearningCoordinator:
         tenant_model = TenantModel(
             tenant_id=tenant_id,
             marina_name=marina_name,
-            model_weights=model_weights,
+            weights=model_weights,
+            weight_keys=self.layout.keys[:len(model_weights)],
             sample_count=len(experiences),
             performance_metrics=performance_metrics,
             timestamp=datetime.now(),
@@ -188,27 +266,31 @@ class FederatedLearningCoordinator:
 
     def _apply_differential_privacy(
         self,
-        weights: Dict[str, float],
-        epsilon: float
-    ) -> Dict[str, float]:
+        weights: np.ndarray,
+        epsilon: float,
+        positions: Optional[List[int]] = None
+    ) -> np.ndarray:
         """
         Apply differential privacy (Laplace mechanism) to model weights
 
         Args:
             weights: Original weights
             epsilon: Privacy parameter
+            positions: Only perturb these entries (default: all)
 
         Returns:
             Noisy weights with privacy guarantee
         """
-        noisy_weights = {}
-
-        for key, value in weights.items():
-            # Laplace noise: scale = sensitivity / epsilon
-            # Assuming sensitivity = 1 for normalized weights
-            noise_scale = 1.0 / epsilon
-            noise = np.random.laplace(0, noise_scale)
-            noisy_weights[key] = value + noise
+        # Laplace noise: scale = sensitivity / epsilon
+        # Assuming sensitivity = 1 for normalized weights
+        noise_scale = 1.0 / epsilon
+        if positions is None:
+            noise = self._rng.laplace(0.0, noise_scale, size=weights.shape)
+            noisy_weights = weights + noise.astype(np.float32)
+        else:
+            noise = self._rng.laplace(0.0, noise_scale, size=len(positions))
+            noisy_weights = weights.copy()
+            noisy_weights[positions] += noise.astype(np.float32)
 
         logger.debug(f"Applied differential privacy: epsilon={epsilon:.2f}")
 
@@ -253,32 +335,35 @@ class FederatedLearningCoordinator:
             for tm in self.tenant_models.values()
         )
 
-        # Aggregate weights
-        aggregated_weights: Dict[str, float] = defaultdict(float)
+        # Stack tenant vectors (older, shorter layouts are zero-padded)
+        n_params = len(self.layout)
+        stacked = np.zeros((len(self.tenant_models), n_params), dtype=np.float32)
+        tenant_weights = np.empty(len(self.tenant_models), dtype=np.float32)
         participating_tenants = []
         total_privacy_budget = 0.0
 
-        for tenant_id, tenant_model in self.tenant_models.items():
+        for row, (tenant_id, tenant_model) in enumerate(self.tenant_models.items()):
             # Performance-weighted contribution
             sample_weight = tenant_model.sample_count / total_samples
             performance_weight = (
                 tenant_model.performance_metrics.get('avg_performance', 0.5) /
                 (total_performance / len(self.tenant_models))
             )
-            tenant_weight = (sample_weight + performance_weight) / 2.0
-
-            # Add weighted contribution
-            for key, value in tenant_model.model_weights.items():
-                aggregated_weights[key] += value * tenant_weight
+            tenant_weights[row] = (sample_weight + performance_weight) / 2.0
+            stacked[row, :len(tenant_model.weights)] = tenant_model.weights
 
             participating_tenants.append(tenant_id)
             total_privacy_budget += tenant_model.privacy_budget
 
+        # Weighted sum of all tenants in one pass
+        aggregated_weights = tenant_weights @ stacked
+
         # Create global model
         global_model = GlobalModel(
             model_id=self._generate_model_id(),
             version=len(self.global_models) + 1,
-            aggregated_weights=dict(aggregated_weights),
+            weight_keys=list(self.layout.keys),
+            weights=aggregated_weights,
             participating_tenants=participating_tenants,
             total_samples=total_samples,
             avg_performance=total_performance / len(self.tenant_models),
@@ -345,6 +430,28 @@ class FederatedLearningCoordinator:
 
         return global_model.aggregated_weights
 
+    def get_global_model_array(self, tenant_id: str) -> Optional[np.ndarray]:
+        """
+        Get global model weights for a tenant as a float32 array
+
+        The array is aligned with ``get_global_model().weight_keys``.
+
+        Args:
+            tenant_id: Requesting tenant
+
+        Returns:
+            Weight array or None if tenant not authorized
+        """
+        if tenant_id not in self.opt_in_tenants:
+            logger.warning(f"Unauthorized access attempt by tenant {tenant_id}")
+            return None
+
+        global_model = self.get_global_model()
+        if not global_model:
+            return None
+
+        return global_model.weights
+
     def get_cross_marina_patterns(
         self,
         min_marinas: int = 2,
@@ -427,10 +534,12 @@ class FederatedLearningCoordinator:
             with open(filepath, 'r') as f:
                 model_dict = json.load(f)
 
+            weights = model_dict['weights']
             global_model = GlobalModel(
                 model_id=model_dict['model_id'],
                 version=model_dict['version'],
-                aggregated_weights=model_dict['weights'],
+                weight_keys=list(weights),
+                weights=np.fromiter(weights.values(), dtype=np.float32, count=len(weights)),
                 participating_tenants=model_dict['participants'],
                 total_samples=model_dict['total_samples'],
                 avg_performance=model_dict['avg_performance'],
@@ -438,7 +547,7 @@ class FederatedLearningCoordinator:
                 privacy_guarantee=model_dict['privacy_guarantee'],
             )
 
-            self.global_models.append(global_model)
+            self._adopt_global_model(global_model)
 
             logger.info(f"Global model imported from {filepath}")
             return True
@@ -447,6 +556,100 @@ class FederatedLearningCoordinator:
             logger.error(f"Error importing model: {e}")
             return False
 
+    def export_global_model_npz(self, filepath: str) -> bool:
+        """
+        Export global model to a compact binary ``.npz`` file
+
+        Weights are stored as a float32 array next to the key order;
+        metadata is stored as JSON, so loading never needs pickle.
+
+        Args:
+            filepath: Output file path
+
+        Returns:
+            True if export successful
+        """
+        global_model = self.get_global_model()
+        if not global_model:
+            logger.warning("No global model to export")
+            return False
+
+        try:
+            metadata = {
+                'model_id': global_model.model_id,
+                'version': global_model.version,
+                'participants': global_model.participating_tenants,
+                'total_samples': global_model.total_samples,
+                'avg_performance': global_model.avg_performance,
+                'created_at': global_model.created_at.isoformat(),
+                'privacy_guarantee': global_model.privacy_guarantee,
+            }
+
+            with open(filepath, 'wb') as f:
+                np.savez(
+                    f,
+                    keys=np.array(global_model.weight_keys, dtype=str),
+                    weights=global_model.weights.astype(np.float32, copy=False),
+                    metadata=np.array(json.dumps(metadata)),
+                )
+
+            logger.info(f"Global model exported to {filepath}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error exporting model: {e}")
+            return False
+
+    def import_global_model_npz(self, filepath: str) -> bool:
+        """
+        Import global model from a ``.npz`` file written by export_global_model_npz
+
+        Args:
+            filepath: Input file path
+
+        Returns:
+            True if import successful
+        """
+        try:
+            with np.load(filepath, allow_pickle=False) as data:
+                keys = data['keys'].tolist()
+                weights = data['weights'].astype(np.float32, copy=False)
+                metadata = json.loads(data['metadata'].item())
+
+            if len(keys) != len(weights):
+                raise ValueError(f"{len(keys)} keys for {len(weights)} weights")
+
+            global_model = GlobalModel(
+                model_id=metadata['model_id'],
+                version=metadata['version'],
+                weight_keys=keys,
+                weights=weights,
+                participating_tenants=metadata['participants'],
+                total_samples=metadata['total_samples'],
+                avg_performance=metadata['avg_performance'],
+                created_at=datetime.fromisoformat(metadata['created_at']),
+                privacy_guarantee=metadata['privacy_guarantee'],
+            )
+
+            self._adopt_global_model(global_model)
+
+            logger.info(f"Global model imported from {filepath}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error importing model: {e}")
+            return False
+
+    def _adopt_global_model(self, global_model: GlobalModel) -> None:
+        """Append an imported model and extend the layout with its weight keys"""
+        self.layout.positions(global_model.weight_keys)
+        if self.layout.keys[:len(global_model.weight_keys)] != global_model.weight_keys:
+            logger.warning(
+                f"Imported model {global_model.model_id} orders its weights differently "
+                f"from this coordinator; array submissions follow layout.keys"
+            )
+        self.global_models.append(global_model)
+
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get federated learning statistics
@@ -460,6 +663,7 @@ class FederatedLearningCoordinator:
             **self.stats,
             'opt_in_tenants': len(self.opt_in_tenants),
             'pending_models': len(self.tenant_models),
+            'model_parameters': len(self.layout),
             'global_model_version': latest_model.version if latest_model else 0,
             'last_aggregation': self.last_aggregation.isoformat() if self.last_aggregation else None,
         }
@@ -0,0 +1,217 @@
+"""
+Pattern Store - Bounded storage for SEAL v2 detected patterns
+
+Keeps memory proportional to the number of distinct patterns rather than
+to traffic: example experience IDs are reservoir-sampled, idle patterns
+decay and are evicted by an incremental compaction pass, and a sorted
+confidence index answers threshold queries without scanning.
+"""
+
+import random
+import sys
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from .models import Pattern
+
+
+class PatternStore:
+    """
+    Dict-like pattern store keyed by pattern signature
+
+    - ``observe`` records one occurrence of a pattern: exact occurrence
+      counters, reservoir-sampled ``example_experience_ids`` (at most
+      ``max_examples``) and interned keys
+    - ``compact_step`` visits a few patterns per call in round-robin order,
+      decays the confidence of patterns not seen for a while (half-life of
+      ``half_life`` observations) and evicts those that fall below
+      ``evict_below``, so compaction cost is spread across inserts. Each
+      key is queued at most once, and keys removed outside compaction are
+      purged from the queue once they outnumber live patterns
+    - a list sorted by confidence backs ``at_least`` / ``count_at_least``
+    """
+
+    def __init__(
+        self,
+        max_examples: int = 20,
+        half_life: int = 5000,
+        evict_below: float = 0.05,
+        compaction_batch: int = 2,
+        seed: Optional[int] = None
+    ):
+        self.max_examples = max_examples
+        self.half_life = half_life
+        self.evict_below = evict_below
+        self.compaction_batch = compaction_batch
+
+        self._patterns: Dict[str, Pattern] = {}
+        self._last_seen: Dict[str, int] = {}
+        self._base_confidence: Dict[str, float] = {}  # Confidence when last observed
+        # (confidence, key) kept sorted ascending
+        self._index: List[Tuple[float, str]] = []
+        self._rotation: Deque[str] = deque()
+        self._queued: Set[str] = set()  # Keys in _rotation, live or removed
+        self._rng = random.Random(seed)
+        self.tick = 0
+        self.evicted = 0
+
+    # ------------------------------------------------------------------ mapping
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._patterns
+
+    def __getitem__(self, key: str) -> Pattern:
+        return self._patterns[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._patterns)
+
+    def get(self, key: str) -> Optional[Pattern]:
+        return self._patterns.get(key)
+
+    def values(self):
+        return self._patterns.values()
+
+    def items(self):
+        return self._patterns.items()
+
+    # ------------------------------------------------------------------ updates
+
+    def add(self, key: str, pattern: Pattern, experience_id: Optional[str] = None) -> Pattern:
+        """Insert a new pattern (its first observation)"""
+        key = sys.intern(key)
+        self.tick += 1
+        if experience_id is not None:
+            pattern.example_experience_ids = [experience_id]
+        self._patterns[key] = pattern
+        self._last_seen[key] = self.tick
+        self._base_confidence[key] = pattern.confidence
+        if key not in self._queued:
+            self._queued.add(key)
+            self._rotation.append(key)
+        insort(self._index, (pattern.confidence, key))
+        return pattern
+
+    def observe(self, key: str, experience_id: str) -> Pattern:
+        """Record another occurrence of an existing pattern (caller updates confidence)"""
+        pattern = self._patterns[key]
+        self.tick += 1
+        self._last_seen[key] = self.tick
+
+        pattern.occurrences += 1
+        pattern.total_observations += 1
+        pattern.frequency = pattern.occurrences / pattern.total_observations
+        self._sample_example(pattern, experience_id)
+        return pattern
+
+    def _sample_example(self, pattern: Pattern, experience_id: str) -> None:
+        """Reservoir sampling (Algorithm R) over all occurrences"""
+        examples = pattern.example_experience_ids
+        if len(examples) < self.max_examples:
+            examples.append(experience_id)
+            return
+        slot = self._rng.randrange(pattern.occurrences)
+        if slot < self.max_examples:
+            examples[slot] = experience_id
+
+    def set_confidence(self, key: str, confidence: float) -> None:
+        """Set a pattern's (undecayed) confidence"""
+        self._base_confidence[key] = confidence
+        self._reindex(key, confidence)
+
+    def _reindex(self, key: str, confidence: float) -> None:
+        pattern = self._patterns[key]
+        if confidence == pattern.confidence:
+            return
+        self._index_remove(pattern.confidence, key)
+        pattern.confidence = confidence
+        insort(self._index, (confidence, key))
+
+    def remove(self, key: str) -> Optional[Pattern]:
+        pattern = self._patterns.pop(key, None)
+        if pattern is not None:
+            self._index_remove(pattern.confidence, key)
+            del self._last_seen[key]
+            del self._base_confidence[key]
+            self._purge_rotation()
+        return pattern
+
+    def _index_remove(self, confidence: float, key: str) -> None:
+        i = bisect_left(self._index, (confidence, key))
+        if i < len(self._index) and self._index[i] == (confidence, key):
+            del self._index[i]
+
+    # ------------------------------------------------------------------ queries
+
+    def at_least(self, min_confidence: float) -> List[Pattern]:
+        """Patterns with confidence >= min_confidence, highest first"""
+        start = bisect_left(self._index, (min_confidence, ""))
+        return [self._patterns[key] for _, key in reversed(self._index[start:])]
+
+    def count_at_least(self, min_confidence: float) -> int:
+        return len(self._index) - bisect_left(self._index, (min_confidence, ""))
+
+    def prune_below(self, min_confidence: float) -> int:
+        """Remove every pattern with confidence < min_confidence"""
+        end = bisect_left(self._index, (min_confidence, ""))
+        for _, key in self._index[:end]:
+            del self._patterns[key]
+            del self._last_seen[key]
+            del self._base_confidence[key]
+        del self._index[:end]
+        self._purge_rotation()
+        return end
+
+    def _purge_rotation(self) -> None:
+        """Drop removed keys from the compaction queue once they are the majority"""
+        if len(self._rotation) > 2 * len(self._patterns) + 16:
+            self._rotation = deque(key for key in self._rotation if key in self._patterns)
+            self._queued = set(self._rotation)
+
+    # --------------------------------------------------------------- compaction
+
+    def compact_step(self) -> int:
+        """
+        Visit up to ``compaction_batch`` patterns; decay idle ones, evict faded ones
+
+        Returns:
+            Number of patterns evicted
+        """
+        evicted = 0
+        for _ in range(min(self.compaction_batch, len(self._rotation))):
+            if not self._rotation:
+                break  # Purged by an eviction in this pass
+            key = self._rotation.popleft()
+            pattern = self._patterns.get(key)
+            if pattern is None:
+                self._queued.discard(key)  # Pruned since it was queued
+                continue
+
+            # Decay in 1/16 half-life steps so repeated visits to an idle
+            # pattern leave the index untouched until the next step
+            steps = (self.tick - self._last_seen[key]) * 16 // self.half_life
+            if steps:
+                decayed = self._base_confidence[key] * 0.5 ** (steps / 16)
+                if decayed < self.evict_below:
+                    self._queued.discard(key)
+                    self.remove(key)
+                    evicted += 1
+                    continue
+                self._reindex(key, decayed)
+
+            self._rotation.append(key)
+
+        self.evicted += evicted
+        return evicted
+
+    def clear(self) -> None:
+        self._patterns.clear()
+        self._last_seen.clear()
+        self._base_confidence.clear()
+        self._index.clear()
+        self._rotation.clear()
+        self._queued.clear()
@@ -0,0 +1,195 @@
+"""
+Prediction Cache - Bounded LRU cache for TabPFN predictions
+
+Keys are SHA-256 digests of the full feature vector, so they are stable
+across processes and can be shared between API workers through an
+optional SQLite store.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..utils.lru_cache import TTLCache
+from .models import Prediction
+
+logger = logging.getLogger(__name__)
+
+
+def feature_digest(features: Dict[str, Any], target: str) -> str:
+    """
+    Content-stable cache key for a feature dict
+
+    Uses canonical JSON (sorted keys) over every feature, unlike the
+    built-in ``hash()`` which is salted per process.
+    """
+    canonical = json.dumps(
+        [target, features], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SQLitePredictionStore:
+    """
+    SQLite-backed prediction store shared by workers on one host
+
+    Rows older than ``ttl_seconds`` are ignored on read and purged, together
+    with the oldest rows beyond ``max_rows``, every ``prune_interval`` writes.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: Optional[float] = 300.0,
+        max_rows: int = 100_000,
+        prune_interval: int = 256
+    ):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_rows = max_rows
+        self.prune_interval = prune_interval
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, timeout=5.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS predictions (
+                cache_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                stored_at REAL NOT NULL
+            )
+        """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_predictions_stored_at ON predictions(stored_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Tuple[Prediction, float]]:
+        """Return ``(prediction, age_seconds)`` or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, stored_at FROM predictions WHERE cache_key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        age = time.time() - row[1]
+        if self.ttl_seconds is not None and age >= self.ttl_seconds:
+            return None
+        return Prediction.model_validate_json(row[0]), age
+
+    def set(self, key: str, prediction: Prediction) -> None:
+        payload = prediction.model_dump_json()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO predictions (cache_key, payload, stored_at) VALUES (?, ?, ?)",
+                (key, payload, time.time())
+            )
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % self.prune_interval == 0:
+                self._prune()
+
+    def _prune(self) -> None:
+        if self.ttl_seconds is not None:
+            self._conn.execute(
+                "DELETE FROM predictions WHERE stored_at < ?", (time.time() - self.ttl_seconds,)
+            )
+        self._conn.execute(
+            """
+            DELETE FROM predictions WHERE cache_key IN (
+                SELECT cache_key FROM predictions ORDER BY stored_at DESC LIMIT -1 OFFSET ?
+            )
+        """,
+            (self.max_rows,)
+        )
+        self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM predictions")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM predictions").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class PredictionCache:
+    """
+    Two-level prediction cache: in-process LRU + optional shared store
+
+    Lookups try the local LRU first, then the shared store (promoting hits
+    into the local LRU). Writes go to both. Cached predictions are returned
+    as copies, so callers may adjust confidence or reasoning freely.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttl_seconds: Optional[float] = 300.0,
+        shared_store: Optional[SQLitePredictionStore] = None
+    ):
+        self._local: TTLCache[Prediction] = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+        self.shared_store = shared_store
+        self.shared_hits = 0
+        self.shared_errors = 0
+
+    def get(self, key: str) -> Optional[Prediction]:
+        """Return a copy of the cached prediction marked ``from_cache``, or None"""
+        entry = self._local.get_with_age(key)
+
+        if entry is None and self.shared_store is not None:
+            try:
+                entry = self.shared_store.get(key)
+            except sqlite3.Error as e:
+                self.shared_errors += 1
+                logger.warning(f"Shared prediction cache read failed: {e}")
+            if entry is not None:
+                self.shared_hits += 1
+                self._local.set(key, entry[0])
+
+        if entry is None:
+            return None
+
+        prediction, age = entry
+        return prediction.model_copy(
+            deep=True, update={'from_cache': True, 'cache_age_seconds': age}
+        )
+
+    def set(self, key: str, prediction: Prediction) -> None:
+        self._local.set(key, prediction.model_copy(deep=True))
+        if self.shared_store is not None:
+            try:
+                self.shared_store.set(key, prediction)
+            except sqlite3.Error as e:
+                self.shared_errors += 1
+                logger.warning(f"Shared prediction cache write failed: {e}")
+
+    def clear(self) -> None:
+        """Drop local entries (the shared store is left to other workers)"""
+        self._local.clear()
+
+    def __len__(self) -> int:
+        return len(self._local)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self._local.get_stats()
+        stats['shared'] = self.shared_store is not None
+        stats['shared_hits'] = self.shared_hits
+        stats['shared_errors'] = self.shared_errors
+        return stats
@@ -0,0 +1,70 @@
+"""
+Rolling Window - Fixed-size window of scores with O(1) mean and variance
+"""
+
+from collections import deque
+from typing import Deque, Iterator
+
+
+class RollingWindow:
+    """
+    Last ``size`` values with running sum and sum of squares
+
+    ``append`` evicts the oldest value once full, so ``mean`` and
+    ``variance`` cost O(1) regardless of how many values were seen. The
+    running sums are recomputed from the buffer every ``size`` evictions
+    to stop floating-point drift on always-on workers.
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.size = size
+        self._values: Deque[float] = deque(maxlen=size)
+        self._sum = 0.0
+        self._sumsq = 0.0
+        self._evictions = 0
+
+    def append(self, value: float) -> None:
+        if len(self._values) == self.size:
+            oldest = self._values[0]
+            self._sum -= oldest
+            self._sumsq -= oldest * oldest
+            self._evictions += 1
+
+        self._values.append(value)
+        self._sum += value
+        self._sumsq += value * value
+
+        if self._evictions >= self.size:
+            self._sum = sum(self._values)
+            self._sumsq = sum(v * v for v in self._values)
+            self._evictions = 0
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window (0.0 when empty)"""
+        return self._sum / len(self._values) if self._values else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the window (0.0 when empty)"""
+        n = len(self._values)
+        if n == 0:
+            return 0.0
+        mean = self._sum / n
+        return max(0.0, self._sumsq / n - mean * mean)
+
+    def is_full(self) -> bool:
+        return len(self._values) == self.size
+
+    def clear(self) -> None:
+        self._values.clear()
+        self._sum = self._sumsq = 0.0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._values)
@@ -13,9 +13,10 @@ Reference: SEAL v2 commit fa4ceab (Nov 13, 2025)
 """
 
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from itertools import islice
+from typing import Deque, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from .models import (
     Experience,
@@ -26,6 +27,8 @@ from .models import (
     ExperienceType,
     LearningStatistics
 )
+from .rolling_window import RollingWindow
+from .pattern_store import PatternStore
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +53,20 @@ class SEALv2Manager:
     # Pattern detection thresholds
     PATTERN_MIN_OCCURRENCES = 3
     PATTERN_CONFIDENCE_THRESHOLD = 0.7
+    PATTERN_MAX_EXAMPLES = 20        # Reservoir size for example_experience_ids
+    PATTERN_HALF_LIFE = 5000         # Experiences before an idle pattern's confidence halves
+    PATTERN_EVICT_CONFIDENCE = 0.05  # Idle patterns decayed below this are dropped
 
     # Performance thresholds
     HIGH_PERFORMANCE_THRESHOLD = 0.7
     LOW_PERFORMANCE_THRESHOLD = 0.3
 
+    # Bounded storage (ring buffers keep memory flat on long-running workers)
+    MAX_EXPERIENCES = 10000
+    MAX_REWARD_HISTORY = 1000
+    PERFORMANCE_WINDOW = 10   # Self-edit trigger / plateau detection
+    STATISTICS_WINDOW = 50    # Average performance in get_statistics
+
     def __init__(
         self,
         learning_rate: float = DEFAULT_LEARNING_RATE,
@@ -70,21 +82,31 @@ class SEALv2Manager:
         self.learning_rate = learning_rate
         self.exploration_rate = exploration_rate
 
-        # Experience storage
-        self.experiences: List[Experience] = []
+        # Experience storage (most recent MAX_EXPERIENCES)
+        self.experiences: Deque[Experience] = deque(maxlen=self.MAX_EXPERIENCES)
+
+        # Rolling performance windows
+        self._score_windows: Dict[int, RollingWindow] = {
+            size: RollingWindow(size)
+            for size in (self.PERFORMANCE_WINDOW, self.STATISTICS_WINDOW)
+        }
 
         # Self-edit tracking
         self.self_edits: List[SelfEdit] = []
         self.pending_self_edits: List[SelfEdit] = []
 
         # Pattern tracking
-        self.patterns: Dict[str, Pattern] = {}
+        self.patterns = PatternStore(
+            max_examples=self.PATTERN_MAX_EXAMPLES,
+            half_life=self.PATTERN_HALF_LIFE,
+            evict_below=self.PATTERN_EVICT_CONFIDENCE
+        )
 
         # Skill progression
         self.skills: Dict[str, SkillProgress] = {}
 
         # RL state
-        self.reward_history: List[float] = []
+        self.reward_history: Deque[float] = deque(maxlen=self.MAX_REWARD_HISTORY)
         self.convergence_velocity: float = 0.0
         self.learning_cycles: int = 0
 
@@ -104,6 +126,8 @@ class SEALv2Manager:
             experience: Experience to record
         """
         self.experiences.append(experience)
+        for window in self._score_windows.values():
+            window.append(experience.performance_score)
         self.stats.total_experiences += 1
 
         # Update type counter
@@ -119,8 +143,9 @@ class SEALv2Manager:
         # Extract learnings
         self._extract_learnings(experience)
 
-        # Detect patterns
+        # Detect patterns, then decay/evict a few idle ones
         self._detect_patterns(experience)
+        self.patterns.compact_step()
 
         # Check if self-edit is needed
         self._check_self_edit_trigger(experience)
@@ -145,7 +170,7 @@ class SEALv2Manager:
         """
         # Determine edit type based on situation
         sample_count = len(self.experiences)
-        recent_performance = self._get_recent_performance(window=10)
+        recent_performance = self._get_recent_performance(window=self.PERFORMANCE_WINDOW)
 
         if sample_count < 10:
             # Low sample count → Data augmentation
@@ -161,7 +186,7 @@ class SEALv2Manager:
             }
             expected_improvement = 0.3
 
-        elif self._is_learning_plateaued(recent_performance):
+        elif self._is_learning_plateaued():
             # Plateaued learning → Hyperparameter adjustment
             edit_type = SelfEditType.HYPERPARAMETER_ADJUSTMENT
             directive = (
@@ -286,10 +311,8 @@ class SEALv2Manager:
 
         # Update convergence velocity (rate of improvement)
         if len(self.reward_history) >= 2:
-            recent_rewards = self.reward_history[-10:]
-            if len(recent_rewards) >= 2:
-                # Simple derivative
-                self.convergence_velocity = recent_rewards[-1] - recent_rewards[-2]
+            # Simple derivative
+            self.convergence_velocity = self.reward_history[-1] - self.reward_history[-2]
 
         # Adaptive learning rate based on convergence
         if self.convergence_velocity > 0.1:
@@ -340,24 +363,20 @@ class SEALv2Manager:
             min_confidence: Minimum confidence threshold
 
         Returns:
-            List of patterns meeting confidence threshold
+            List of patterns meeting confidence threshold, highest confidence first
         """
-        return [
-            pattern for pattern in self.patterns.values()
-            if pattern.confidence >= min_confidence
-        ]
+        return self.patterns.at_least(min_confidence)
 
     def get_statistics(self) -> LearningStatistics:
         """Get learning statistics"""
         # Update dynamic stats
-        self.stats.average_performance = self._get_recent_performance(window=50)
+        self.stats.average_performance = self._get_recent_performance(window=self.STATISTICS_WINDOW)
         self.stats.total_self_edits = len(self.self_edits)
         self.stats.applied_self_edits = sum(1 for se in self.self_edits if se.applied)
         self.stats.total_patterns = len(self.patterns)
-        self.stats.high_confidence_patterns = len([
-            p for p in self.patterns.values()
-            if p.confidence >= self.PATTERN_CONFIDENCE_THRESHOLD
-        ])
+        self.stats.high_confidence_patterns = self.patterns.count_at_least(
+            self.PATTERN_CONFIDENCE_THRESHOLD
+        )
         self.stats.last_learning_cycle = datetime.now()
 
         return self.stats
@@ -425,24 +444,23 @@ class SEALv2Manager:
 
         if pattern_key not in self.patterns:
             # New pattern
-            self.patterns[pattern_key] = Pattern(
-                pattern_type=experience.experience_type.value,
-                description=f"Pattern in {experience.experience_type.value}: {pattern_key}",
-                conditions=experience.context.copy(),
-                occurrences=1,
-                total_observations=1,
-                frequency=1.0,
-                confidence=0.5,  # Low initial confidence
-                example_experience_ids=[experience.experience_id]
+            self.patterns.add(
+                pattern_key,
+                Pattern(
+                    pattern_type=experience.experience_type.value,
+                    description=f"Pattern in {experience.experience_type.value}: {pattern_key}",
+                    conditions=experience.context.copy(),
+                    occurrences=1,
+                    total_observations=1,
+                    frequency=1.0,
+                    confidence=0.5  # Low initial confidence
+                ),
+                experience.experience_id
             )
         else:
             # Existing pattern - update
-            pattern = self.patterns[pattern_key]
-            pattern.occurrences += 1
-            pattern.total_observations += 1
-            pattern.frequency = pattern.occurrences / pattern.total_observations
-            pattern.confidence = min(1.0, pattern.frequency * (pattern.occurrences / 10))
-            pattern.example_experience_ids.append(experience.experience_id)
+            pattern = self.patterns.observe(pattern_key, experience.experience_id)
+            self.patterns.set_confidence(pattern_key, self._pattern_confidence(pattern))
 
             # Check if pattern is significant
             if (pattern.occurrences >= self.PATTERN_MIN_OCCURRENCES and
@@ -456,6 +474,11 @@ class SEALv2Manager:
 
         return None
 
+    @staticmethod
+    def _pattern_confidence(pattern: Pattern) -> float:
+        """Undecayed confidence from occurrence counts"""
+        return min(1.0, pattern.frequency * (pattern.occurrences / 10))
+
     def _generate_pattern_key(self, experience: Experience) -> str:
         """Generate pattern key from experience context"""
         # Use key context elements to generate pattern signature
@@ -476,7 +499,7 @@ class SEALv2Manager:
     def _check_self_edit_trigger(self, experience: Experience):
         """Check if self-edit should be triggered"""
         # Calculate performance gap
-        recent_perf = self._get_recent_performance(window=10)
+        recent_perf = self._get_recent_performance(window=self.PERFORMANCE_WINDOW)
         target_perf = 0.8  # Target performance
         performance_gap = max(0, target_perf - recent_perf)
 
@@ -501,20 +524,23 @@ class SEALv2Manager:
         if should_trigger and performance_gap > 0:
             self.generate_self_edit(trigger_reason, performance_gap)
 
-    def _get_recent_performance(self, window: int = 10) -> float:
+    def _get_recent_performance(self, window: int = PERFORMANCE_WINDOW) -> float:
         """Get average performance from recent experiences"""
+        rolling = self._score_windows.get(window)
+        if rolling is not None:
+            return rolling.mean
+
         if not self.experiences:
             return 0.0
-
-        recent = self.experiences[-window:]
+        recent = list(islice(reversed(self.experiences), window))
         return sum(exp.performance_score for exp in recent) / len(recent)
 
     def _is_learning_plateaued(self, recent_performance: Optional[List[float]] = None) -> bool:
         """Check if learning has plateaued"""
         if recent_performance is None:
-            if len(self.experiences) < 10:
-                return False
-            recent_performance = [exp.performance_score for exp in self.experiences[-10:]]
+            rolling = self._score_windows[self.PERFORMANCE_WINDOW]
+            # Low variance = plateaued
+            return rolling.is_full() and rolling.variance < 0.01
 
         if len(recent_performance) < 5:
             return False
@@ -547,15 +573,6 @@ class SEALv2Manager:
 
     def _prune_patterns(self, confidence_threshold: float):
         """Remove low-confidence patterns"""
-        before_count = len(self.patterns)
-
-        self.patterns = {
-            key: pattern
-            for key, pattern in self.patterns.items()
-            if pattern.confidence >= confidence_threshold
-        }
-
-        after_count = len(self.patterns)
-        pruned = before_count - after_count
+        pruned = self.patterns.prune_below(confidence_threshold)
 
         logger.info(f"Pruned {pruned} low-confidence patterns (threshold: {confidence_threshold})")
@@ -0,0 +1,131 @@
+"""
+Sequential Testing - Always-valid A/B comparisons for early stopping
+
+Implements the mixture sequential probability ratio test (mSPRT) for a
+difference in means. Its p-value stays valid however often it is checked,
+so experiments can be evaluated after every outcome and stopped as soon as
+a boundary is crossed, instead of waiting for a fixed sample size.
+"""
+
+import math
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from .streaming_stats import StreamingStats
+
+
+def msprt_p_value(mean_diff: float, variance: float, tau_sq: float) -> float:
+    """
+    1 / Lambda for a normal mixture (prior N(0, tau_sq)) over the mean difference
+
+    Args:
+        mean_diff: Observed treatment - control mean
+        variance: Variance of ``mean_diff`` (s_t^2 / n_t + s_c^2 / n_c)
+        tau_sq: Mixture variance - the scale of effects the test is tuned for
+
+    Returns:
+        Single-step p-value (callers keep the running minimum)
+    """
+    if variance <= 0:
+        return 1.0
+    log_lr = (
+        0.5 * math.log(variance / (variance + tau_sq))
+        + mean_diff * mean_diff * tau_sq / (2 * variance * (variance + tau_sq))
+    )
+    if log_lr <= 0:
+        return 1.0
+    return math.exp(-log_lr)
+
+
+@dataclass
+class SequentialResult:
+    """Sequential analysis state of one experiment"""
+    experiment_id: str
+    alpha: float  # Per-comparison threshold (Bonferroni over treatments)
+    p_values: Dict[str, float] = field(default_factory=dict)  # Always-valid, per treatment
+    decisions: Dict[str, str] = field(default_factory=dict)  # treatment -> "winner" / "loser"
+    stopped: bool = False
+    winner: Optional[str] = None
+    stopped_at: Optional[datetime] = None
+    samples_at_stop: int = 0
+
+
+class SequentialTest:
+    """
+    mSPRT comparison of every treatment against the control
+
+    ``update`` is O(number of treatments) and uses only the running moments
+    in StreamingStats. A treatment is decided once its always-valid p-value
+    drops below ``alpha / len(treatments)``; the test stops when a treatment
+    wins or when every treatment has lost to the control.
+    """
+
+    def __init__(
+        self,
+        experiment_id: str,
+        control_id: str,
+        treatment_ids: List[str],
+        alpha: float,
+        tau: float = 0.1,
+        min_samples: int = 30
+    ):
+        """
+        Args:
+            experiment_id: Experiment identifier
+            control_id: Control variant ID
+            treatment_ids: Treatment variant IDs
+            alpha: Overall significance level
+            tau: Mixture standard deviation (expected effect size on the score scale)
+            min_samples: Samples per variant before variances are trusted
+        """
+        self.control_id = control_id
+        self.treatment_ids = list(treatment_ids)
+        self.tau_sq = tau * tau
+        self.min_samples = min_samples
+        self.result = SequentialResult(
+            experiment_id=experiment_id,
+            alpha=alpha / max(1, len(self.treatment_ids)),
+            p_values={t: 1.0 for t in self.treatment_ids},
+        )
+
+    def update(self, variants: Dict[str, StreamingStats]) -> SequentialResult:
+        """Re-evaluate undecided treatments; returns the (possibly stopped) result"""
+        result = self.result
+        if result.stopped:
+            return result
+
+        control = variants[self.control_id]
+        if control.count < self.min_samples:
+            return result
+
+        for treatment_id in self.treatment_ids:
+            if treatment_id in result.decisions:
+                continue
+            treatment = variants[treatment_id]
+            if treatment.count < self.min_samples:
+                continue
+
+            mean_diff = treatment.mean - control.mean
+            variance = (
+                treatment.sample_variance / treatment.count
+                + control.sample_variance / control.count
+            )
+            p_value = min(result.p_values[treatment_id], msprt_p_value(mean_diff, variance, self.tau_sq))
+            result.p_values[treatment_id] = p_value
+
+            if p_value <= result.alpha:
+                result.decisions[treatment_id] = "winner" if mean_diff > 0 else "loser"
+
+        winners = [t for t, d in result.decisions.items() if d == "winner"]
+        if winners:
+            result.winner = max(winners, key=lambda t: variants[t].mean)
+        elif len(result.decisions) == len(self.treatment_ids):
+            result.winner = self.control_id
+        else:
+            return result
+
+        result.stopped = True
+        result.stopped_at = datetime.now()
+        result.samples_at_stop = sum(s.count for s in variants.values())
+        return result
@@ -0,0 +1,162 @@
+"""
+Streaming Statistics - O(1) accumulators for A/B test variant scores
+
+Replaces per-variant score lists: Welford's algorithm gives an exact,
+numerically stable running mean and variance, an optional fixed-bucket
+histogram answers quantile queries, and an optional reservoir keeps a
+uniform raw sample for export.
+"""
+
+import math
+import random
+from typing import Any, Dict, List, Optional
+
+
+class ScoreHistogram:
+    """
+    Fixed-width histogram over ``[low, high]``
+
+    Values outside the range are clamped into the first / last bucket.
+    Quantiles are interpolated within a bucket, so the error is at most
+    one bucket width.
+    """
+
+    def __init__(self, bins: int = 100, low: float = 0.0, high: float = 1.0):
+        if bins <= 0 or high <= low:
+            raise ValueError("histogram needs bins > 0 and high > low")
+        self.bins = bins
+        self.low = low
+        self.high = high
+        self._width = (high - low) / bins
+        self.counts: List[int] = [0] * bins
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        index = int((value - self.low) / self._width)
+        self.counts[min(max(index, 0), self.bins - 1)] += 1
+        self.count += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1), None if empty"""
+        if self.count == 0:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                fraction = (rank - seen) / bucket_count
+                return self.low + (index + fraction) * self._width
+            seen += bucket_count
+        return self.high
+
+
+class StreamingStats:
+    """
+    Running count, mean, variance, success count and extrema of a score stream
+
+    ``add`` and every read are O(1). ``variance`` is the population
+    variance (numpy's default); ``sample_variance`` uses n - 1.
+    """
+
+    __slots__ = (
+        "success_threshold", "count", "success_count", "total", "mean", "_m2",
+        "min", "max", "histogram", "reservoir_size", "_reservoir", "_rng"
+    )
+
+    def __init__(
+        self,
+        success_threshold: float = 0.5,
+        histogram_bins: Optional[int] = None,
+        histogram_range: tuple = (0.0, 1.0),
+        reservoir_size: int = 0,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            success_threshold: Scores strictly above this count as successes
+            histogram_bins: Enable a quantile histogram with this many buckets
+            histogram_range: (low, high) covered by the histogram
+            reservoir_size: Keep a uniform sample of up to this many raw scores
+            seed: Seed for reservoir sampling
+        """
+        self.success_threshold = success_threshold
+        self.count = 0
+        self.success_count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+        self.histogram = ScoreHistogram(histogram_bins, *histogram_range) if histogram_bins else None
+        self.reservoir_size = reservoir_size
+        self._reservoir: List[float] = []
+        self._rng = random.Random(seed) if reservoir_size else None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.success_threshold:
+            self.success_count += 1
+
+        # Welford update
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if self.histogram is not None:
+            self.histogram.add(value)
+        if self.reservoir_size:
+            self._sample(value)
+
+    def _sample(self, value: float) -> None:
+        """Reservoir sampling (Algorithm R)"""
+        if len(self._reservoir) < self.reservoir_size:
+            self._reservoir.append(value)
+            return
+        slot = self._rng.randrange(self.count)
+        if slot < self.reservoir_size:
+            self._reservoir[slot] = value
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0.0 when empty)"""
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        """Unbiased (n - 1) variance (0.0 with fewer than two values)"""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate quantile from the histogram (None if disabled or empty)"""
+        return self.histogram.quantile(q) if self.histogram is not None else None
+
+    @property
+    def samples(self) -> List[float]:
+        """Reservoir sample of raw scores (empty if disabled)"""
+        return list(self._reservoir)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "success_count": self.success_count,
+            "total": self.total,
+            "mean": self.mean,
+            "std": self.std,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    def __len__(self) -> int:
+        return self.count
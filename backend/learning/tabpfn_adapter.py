@@ -12,11 +12,13 @@ Reference: "Advancing the State of the Art in Tabular Foundation Models"
 
 import math
 import logging
-from typing import Dict, List, Optional, Any, Tuple, Literal
+from typing import Deque, Dict, List, Optional, Any, Tuple, Literal
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 
 from .models import Experience, Prediction, LearningStrategy
+from .feature_matrix import FeatureMatrix
+from .prediction_cache import PredictionCache, SQLitePredictionStore, feature_digest
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +29,8 @@ class TabPFNAdapter:
 
     Features:
     - K-nearest neighbor simulation (production would use actual TabPFN API)
-    - Intelligent caching for performance
+      over an incrementally encoded NumPy feature matrix
+    - Bounded LRU + TTL prediction cache, optionally shared between workers
     - Model distillation support (MLP, XGBoost, Random Forest)
     - Automatic confidence thresholds based on sample count
     """
@@ -39,17 +42,36 @@ class TabPFNAdapter:
     MAX_FEATURES = 2000      # Maximum features
     K_NEIGHBORS = 5          # K for KNN simulation
 
-    def __init__(self, enable_caching: bool = True):
+    def __init__(
+        self,
+        enable_caching: bool = True,
+        normalize_numeric: bool = False,
+        cache_size: int = 4096,
+        cache_ttl_seconds: float = 300.0,
+        shared_cache_path: Optional[str] = None
+    ):
         """
         Initialize TabPFN adapter
 
         Args:
             enable_caching: Enable prediction caching for performance
+            normalize_numeric: Scale numeric feature differences by column variance
+            cache_size: Max predictions kept in the in-process LRU
+            cache_ttl_seconds: Prediction cache TTL
+            shared_cache_path: SQLite file shared by workers (None = in-process only)
         """
-        self.training_data: List[Experience] = []
+        # Most recent MAX_SAMPLES experiences (FIFO eviction is O(1))
+        self.training_data: Deque[Experience] = deque(maxlen=self.MAX_SAMPLES)
+        self.feature_matrix = FeatureMatrix(self.MAX_SAMPLES, normalize_numeric=normalize_numeric)
         self.enable_caching = enable_caching
-        self.prediction_cache: Dict[str, Tuple[Prediction, datetime]] = {}
-        self.cache_ttl_seconds = 300  # 5 minutes
+        self.cache_ttl_seconds = cache_ttl_seconds
+        shared_store = (
+            SQLitePredictionStore(shared_cache_path, ttl_seconds=cache_ttl_seconds)
+            if enable_caching and shared_cache_path else None
+        )
+        self.prediction_cache = PredictionCache(
+            max_size=cache_size, ttl_seconds=cache_ttl_seconds, shared_store=shared_store
+        )
 
         # Statistics
         self.stats = {
@@ -75,14 +97,13 @@ class TabPFNAdapter:
         Args:
             experience: Experience to add as training data
         """
+        if len(self.training_data) == self.MAX_SAMPLES:
+            logger.debug(f"Removed oldest sample {self.training_data[0].experience_id} (max samples reached)")
+
         self.training_data.append(experience)
+        self.feature_matrix.add(self._extract_features(experience), experience)
         self.stats['training_samples'] = len(self.training_data)
 
-        # Limit training data size (FIFO removal)
-        if len(self.training_data) > self.MAX_SAMPLES:
-            removed = self.training_data.pop(0)
-            logger.debug(f"Removed oldest sample {removed.experience_id} (max samples reached)")
-
         logger.debug(f"Added training sample {experience.experience_id} (total: {len(self.training_data)})")
 
     def predict(
@@ -105,8 +126,9 @@ class TabPFNAdapter:
         self.stats['predictions'] += 1
 
         # Check cache
+        features = self._extract_features(experience)
         if self.enable_caching:
-            cache_key = self._generate_cache_key(experience, target)
+            cache_key = self._generate_cache_key(experience, target, features)
             cached = self._check_cache(cache_key)
             if cached:
                 self.stats['cache_hits'] += 1
@@ -119,12 +141,100 @@ class TabPFNAdapter:
             logger.warning("Insufficient training data for prediction (need at least 1 sample)")
             return None
 
-        # Convert experience to feature vector
-        features = self._extract_features(experience)
-
         # Find K-nearest neighbors
         neighbors = self._find_k_nearest_neighbors(features, self.K_NEIGHBORS)
 
+        prediction = self._build_prediction(neighbors, target, confidence_threshold)
+
+        if prediction is None:
+            return None
+
+        # Cache prediction
+        if self.enable_caching:
+            self._cache_prediction(cache_key, prediction)
+
+        logger.info(
+            f"TabPFN prediction: {prediction.predicted_outcome} (confidence: {prediction.confidence:.2f}, "
+            f"samples: {len(self.training_data)})"
+        )
+
+        return prediction
+
+    def predict_batch(
+        self,
+        experiences: List[Experience],
+        target: str = "outcome",
+        confidence_threshold: float = 0.6,
+        chunk_size: int = 128
+    ) -> List[Optional[Prediction]]:
+        """
+        Predict many experiences with one distance-matrix pass per chunk
+
+        Features are extracted once per experience; cache hits are served
+        without touching the feature matrix.
+
+        Args:
+            experiences: Experiences to predict
+            target: Target variable to predict
+            confidence_threshold: Minimum confidence threshold
+            chunk_size: Queries per distance-matrix pass (bounds memory to
+                chunk_size x training samples)
+
+        Returns:
+            Predictions in input order (None where predict() would return None)
+        """
+        results: List[Optional[Prediction]] = [None] * len(experiences)
+        pending: List[Tuple[int, Dict[str, Any], Optional[str]]] = []
+
+        for i, experience in enumerate(experiences):
+            self.stats['predictions'] += 1
+            features = self._extract_features(experience)
+            cache_key = None
+
+            if self.enable_caching:
+                cache_key = self._generate_cache_key(experience, target, features)
+                cached = self._check_cache(cache_key)
+                if cached:
+                    self.stats['cache_hits'] += 1
+                    results[i] = cached
+                    continue
+
+            self.stats['cache_misses'] += 1
+            pending.append((i, features, cache_key))
+
+        if not pending:
+            return results
+
+        if len(self.training_data) < 1:
+            logger.warning("Insufficient training data for prediction (need at least 1 sample)")
+            return results
+
+        for start in range(0, len(pending), max(1, chunk_size)):
+            chunk = pending[start:start + chunk_size]
+            neighbor_lists = self.feature_matrix.nearest_batch(
+                [features for _, features, _ in chunk], self.K_NEIGHBORS
+            )
+
+            for (i, _, cache_key), neighbors in zip(chunk, neighbor_lists):
+                prediction = self._build_prediction(neighbors, target, confidence_threshold)
+                if prediction and cache_key is not None:
+                    self._cache_prediction(cache_key, prediction)
+                results[i] = prediction
+
+        logger.info(
+            f"TabPFN batch prediction: {len(experiences)} experiences "
+            f"({len(pending)} computed, {len(experiences) - len(pending)} cached)"
+        )
+
+        return results
+
+    def _build_prediction(
+        self,
+        neighbors: List[Tuple[Experience, float]],
+        target: str,
+        confidence_threshold: float
+    ) -> Optional[Prediction]:
+        """Turn K nearest neighbors into a Prediction (None below threshold)"""
         if not neighbors:
             logger.warning("No neighbors found for prediction")
             return None
@@ -139,7 +249,6 @@ class TabPFNAdapter:
             )
             return None
 
-        # Create prediction object
         prediction = Prediction(
             predicted_outcome=predicted_outcome,
             confidence=confidence,
@@ -151,15 +260,6 @@ class TabPFNAdapter:
             from_cache=False
         )
 
-        # Cache prediction
-        if self.enable_caching:
-            self._cache_prediction(cache_key, prediction)
-
-        logger.info(
-            f"TabPFN prediction: {predicted_outcome} (confidence: {confidence:.2f}, "
-            f"samples: {len(self.training_data)})"
-        )
-
         return prediction
 
     def _extract_features(self, experience: Experience) -> Dict[str, Any]:
@@ -201,6 +301,10 @@ class TabPFNAdapter:
         """
         Find K-nearest neighbors using Euclidean distance
 
+        Distances to all training samples are computed in one vectorized
+        pass over the feature matrix and the top K selected with
+        argpartition; see _calculate_distance for the per-pair definition.
+
         Args:
             query_features: Query feature vector
             k: Number of neighbors
@@ -208,16 +312,7 @@ class TabPFNAdapter:
         Returns:
             List of (experience, distance) tuples
         """
-        distances = []
-
-        for training_exp in self.training_data:
-            training_features = self._extract_features(training_exp)
-            distance = self._calculate_distance(query_features, training_features)
-            distances.append((training_exp, distance))
-
-        # Sort by distance and return top K
-        distances.sort(key=lambda x: x[1])
-        return distances[:k]
+        return self.feature_matrix.nearest(query_features, k)
 
     def _calculate_distance(
         self,
@@ -347,36 +442,28 @@ class TabPFNAdapter:
 
         return ", ".join(common[:3]) if common else ""
 
-    def _generate_cache_key(self, experience: Experience, target: str) -> str:
-        """Generate cache key for prediction"""
-        features = self._extract_features(experience)
-        # Simple hash of features
-        feature_str = "_".join(f"{k}:{v}" for k, v in sorted(features.items())[:5])
-        return f"{target}_{hash(feature_str)}"
+    def _generate_cache_key(
+        self,
+        experience: Experience,
+        target: str,
+        features: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Generate a content-stable cache key over the full feature vector"""
+        if features is None:
+            features = self._extract_features(experience)
+        return feature_digest(features, target)
 
     def _check_cache(self, cache_key: str) -> Optional[Prediction]:
         """Check if prediction is in cache"""
-        if cache_key in self.prediction_cache:
-            prediction, cached_at = self.prediction_cache[cache_key]
-
-            # Check TTL
-            age = (datetime.now() - cached_at).total_seconds()
-            if age < self.cache_ttl_seconds:
-                prediction.from_cache = True
-                prediction.cache_age_seconds = age
-                logger.debug(f"Cache hit: {cache_key} (age: {age:.1f}s)")
-                return prediction
-            else:
-                # Expired
-                del self.prediction_cache[cache_key]
-                logger.debug(f"Cache expired: {cache_key}")
-
-        return None
+        prediction = self.prediction_cache.get(cache_key)
+        if prediction is not None:
+            logger.debug(f"Cache hit: {cache_key[:12]} (age: {prediction.cache_age_seconds:.1f}s)")
+        return prediction
 
     def _cache_prediction(self, cache_key: str, prediction: Prediction):
         """Cache prediction"""
-        self.prediction_cache[cache_key] = (prediction, datetime.now())
-        logger.debug(f"Cached prediction: {cache_key}")
+        self.prediction_cache.set(cache_key, prediction)
+        logger.debug(f"Cached prediction: {cache_key[:12]}")
 
     def is_suitable_for_tabpfn(self, sample_count: Optional[int] = None) -> bool:
         """
@@ -468,6 +555,8 @@ class TabPFNAdapter:
             'cache_hits': self.stats['cache_hits'],
             'cache_misses': self.stats['cache_misses'],
             'cache_hit_rate': cache_hit_rate,
+            'cache_evictions': self.prediction_cache.get_stats()['evictions'],
+            'cache': self.prediction_cache.get_stats(),
             'distilled_model': self.distilled_model_type,
             'max_samples': self.MAX_SAMPLES,
             'max_features': self.MAX_FEATURES,
@@ -476,6 +565,7 @@ class TabPFNAdapter:
     def reset(self):
         """Reset adapter state"""
         self.training_data.clear()
+        self.feature_matrix.clear()
         self.prediction_cache.clear()
         self.stats = {
             'predictions': 0,
@@ -11,12 +11,13 @@ Date: November 2025
 import logging
 import requests
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 import time
 import json
 
-from .models import Experience, Prediction
+from .models import Experience, Prediction, LearningStrategy
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,8 @@ class TabPFNAPIClient:
     MAX_RETRIES = 3
     CIRCUIT_BREAKER_THRESHOLD = 5  # failures before opening circuit
     CIRCUIT_BREAKER_TIMEOUT = 60  # seconds before retry
+    BATCH_CHUNK_SIZE = 256  # queries per /predict request in predict_batch
+    BATCH_MAX_CONCURRENCY = 4  # parallel /predict requests in predict_batch
 
     def __init__(
         self,
@@ -77,6 +80,7 @@ class TabPFNAPIClient:
         # KNN fallback
         from .tabpfn_adapter import TabPFNAdapter
         self.fallback_adapter = TabPFNAdapter(enable_caching=True) if enable_fallback else None
+        self._fallback_training_ids: List[str] = []  # What fallback_adapter was trained on
 
         logger.info(
             f"TabPFN API client initialized (url={self.api_url}, "
@@ -176,8 +180,9 @@ class TabPFNAPIClient:
 
         try:
             # Convert experiences to tabular format
-            X_train, y_train = self._experiences_to_arrays(training_data, target)
-            X_query, _ = self._experiences_to_arrays([query_experience], target)
+            columns = self._feature_columns([*training_data, query_experience])
+            X_train, y_train = self._experiences_to_arrays(training_data, target, columns)
+            X_query, _ = self._experiences_to_arrays([query_experience], target, columns)
 
             # Make API request with retry
             response = self._make_request_with_retry({
@@ -198,7 +203,7 @@ class TabPFNAPIClient:
             self._update_latency(latency_ms)
             self._record_success()
 
-            logger.debug(f"TabPFN API prediction: {prediction.predicted_value} (confidence: {prediction.confidence:.2f}, latency: {latency_ms:.1f}ms)")
+            logger.debug(f"TabPFN API prediction: {prediction.predicted_outcome} (confidence: {prediction.confidence:.2f}, latency: {latency_ms:.1f}ms)")
 
             return prediction
 
@@ -207,6 +212,98 @@ class TabPFNAPIClient:
             self._record_failure()
             return self._fallback_predict(training_data, query_experience, target, confidence_threshold)
 
+    def predict_batch(
+        self,
+        training_data: List[Experience],
+        query_experiences: List[Experience],
+        target: str = "outcome",
+        confidence_threshold: float = 0.6,
+        chunk_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> List[Optional[Prediction]]:
+        """
+        Predict many experiences with one API request per chunk
+
+        The training set is encoded once and shared by every chunk; chunks
+        are sent concurrently. Chunks that fail fall back to the KNN
+        adapter's batch path.
+
+        Args:
+            training_data: List of training experiences
+            query_experiences: Experiences to predict
+            target: Target variable to predict
+            confidence_threshold: Minimum confidence threshold
+            chunk_size: Queries per request (default BATCH_CHUNK_SIZE)
+            max_concurrency: Parallel requests (default BATCH_MAX_CONCURRENCY)
+
+        Returns:
+            Predictions in input order (None where confidence is too low)
+        """
+        if not query_experiences:
+            return []
+
+        chunk_size = max(1, chunk_size or self.BATCH_CHUNK_SIZE)
+        max_concurrency = max(1, max_concurrency or self.BATCH_MAX_CONCURRENCY)
+        chunks = [
+            (start, query_experiences[start:start + chunk_size])
+            for start in range(0, len(query_experiences), chunk_size)
+        ]
+        self.stats['api_calls'] += len(chunks)
+
+        if self._check_circuit_breaker() or not self.api_key:
+            logger.warning("TabPFN API unavailable (circuit breaker open or no API key), using fallback")
+            return self._fallback_predict_batch(training_data, query_experiences, target, confidence_threshold)
+
+        columns = self._feature_columns([*training_data, *query_experiences])
+        X_train, y_train = self._experiences_to_arrays(training_data, target, columns)
+        X_train_list, y_train_list = X_train.tolist(), y_train.tolist()
+
+        def send(chunk: List[Experience]) -> Tuple[Optional[Dict[str, Any]], float]:
+            X_query, _ = self._experiences_to_arrays(chunk, target, columns)
+            start_time = time.time()
+            response = self._make_request_with_retry({
+                'X_train': X_train_list,
+                'y_train': y_train_list,
+                'X_query': X_query.tolist(),
+                'confidence_threshold': confidence_threshold,
+            })
+            return response, (time.time() - start_time) * 1000
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(chunks))) as pool:
+            futures = [pool.submit(send, chunk) for _, chunk in chunks]
+
+            results: List[Optional[Prediction]] = [None] * len(query_experiences)
+            failed: List[Tuple[int, List[Experience]]] = []
+
+            for (start, chunk), future in zip(chunks, futures):
+                try:
+                    response, latency_ms = future.result()
+                    if response is None:
+                        raise ValueError("No response from TabPFN API")
+                    predictions = self._parse_batch_response(response, chunk, target)
+                except Exception as e:
+                    logger.error(f"TabPFN API batch error: {e}")
+                    self._record_failure()
+                    failed.append((start, chunk))
+                    continue
+
+                self._record_success()
+                self._update_latency(latency_ms)
+                for offset, prediction in enumerate(predictions):
+                    if prediction.confidence >= confidence_threshold:
+                        results[start + offset] = prediction
+
+        if failed:
+            fallback_queries = [exp for _, chunk in failed for exp in chunk]
+            fallback_results = iter(self._fallback_predict_batch(
+                training_data, fallback_queries, target, confidence_threshold
+            ))
+            for start, chunk in failed:
+                for offset in range(len(chunk)):
+                    results[start + offset] = next(fallback_results)
+
+        return results
+
     def _make_request_with_retry(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Make API request with exponential backoff retry
@@ -251,10 +348,28 @@ class TabPFNAPIClient:
 
         return None
 
+    @staticmethod
+    def _raw_features(exp: Experience) -> Dict[str, Any]:
+        """Combine context, metrics, and vessel_state as features"""
+        features = {}
+        features.update(exp.context)
+        features.update(exp.metrics)
+        if exp.vessel_state:
+            features.update(exp.vessel_state)
+        return features
+
+    def _feature_columns(self, experiences: List[Experience]) -> List[str]:
+        """Sorted union of feature keys, so every row has the same width"""
+        keys = set()
+        for exp in experiences:
+            keys.update(self._raw_features(exp))
+        return sorted(keys)
+
     def _experiences_to_arrays(
         self,
         experiences: List[Experience],
-        target: str
+        target: str,
+        columns: Optional[List[str]] = None
     ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Convert experiences to numpy arrays for API
@@ -262,33 +377,32 @@ class TabPFNAPIClient:
         Args:
             experiences: List of experiences
             target: Target variable name
+            columns: Shared column layout (missing values become 0.0)
 
         Returns:
             Tuple of (X, y) numpy arrays
         """
+        if columns is None:
+            columns = self._feature_columns(experiences)
+
         # Extract features from experiences
         X = []
         y = []
 
         for exp in experiences:
-            # Combine context, metrics, and vessel_state as features
-            features = {}
-            features.update(exp.context)
-            features.update(exp.metrics)
-            if exp.vessel_state:
-                features.update(exp.vessel_state)
+            features = self._raw_features(exp)
 
             # Convert to numeric features
             feature_vec = []
-            for key in sorted(features.keys()):
-                val = features[key]
+            for key in columns:
+                val = features.get(key)
                 if isinstance(val, (int, float)):
-                    feature_vec.append(val)
-                elif isinstance(val, bool):
-                    feature_vec.append(1.0 if val else 0.0)
+                    feature_vec.append(float(val))
                 elif isinstance(val, str):
                     # Simple hash for categorical
                     feature_vec.append(hash(val) % 1000 / 1000.0)
+                else:
+                    feature_vec.append(0.0)
 
             X.append(feature_vec)
 
@@ -331,15 +445,40 @@ class TabPFNAPIClient:
 
         return Prediction(
             prediction_id=f"tabpfn_{experience.experience_id}_{datetime.now().strftime('%Y%m%d%H%M%S%f')}",
-            experience_id=experience.experience_id,
-            predicted_value=predicted_outcome,
+            predicted_outcome=predicted_outcome,
             confidence=confidence,
             probabilities=probabilities,
             strategy=LearningStrategy.TABPFN,
-            model_version="tabpfn-2.5-api",
             sample_count=response.get('training_samples', 0),
+            reasoning="TabPFN-2.5 API (tabpfn-2.5-api)",
         )
 
+    def _parse_batch_response(
+        self,
+        response: Dict[str, Any],
+        experiences: List[Experience],
+        target: str
+    ) -> List[Prediction]:
+        """
+        Parse a multi-query API response
+
+        Expects ``{"predictions": [{"prediction", "confidence", ...}, ...]}``
+        in query order; a single-prediction body is accepted for one query.
+        """
+        items = response.get('predictions')
+        if items is None and len(experiences) == 1:
+            items = [response]
+        if items is None or len(items) != len(experiences):
+            raise ValueError(
+                f"Expected {len(experiences)} predictions, got {len(items) if items is not None else 0}"
+            )
+
+        training_samples = response.get('training_samples', 0)
+        return [
+            self._parse_response({'training_samples': training_samples, **item}, exp, target)
+            for item, exp in zip(items, experiences)
+        ]
+
     def _fallback_predict(
         self,
         training_data: List[Experience],
@@ -366,13 +505,51 @@ class TabPFNAPIClient:
         self.stats['fallback_uses'] += 1
         logger.info(f"Using KNN fallback (fallback uses: {self.stats['fallback_uses']})")
 
-        # Add training data to fallback
-        for exp in training_data:
-            self.fallback_adapter.add_training_sample(exp)
+        self._train_fallback(training_data)
 
         # Predict using fallback
         return self.fallback_adapter.predict(query_experience, target, confidence_threshold)
 
+    def _fallback_predict_batch(
+        self,
+        training_data: List[Experience],
+        query_experiences: List[Experience],
+        target: str,
+        confidence_threshold: float
+    ) -> List[Optional[Prediction]]:
+        """Use the KNN fallback's batch path (training data loaded once)"""
+        if not self.enable_fallback or not self.fallback_adapter:
+            logger.error("Fallback disabled and API unavailable")
+            return [None] * len(query_experiences)
+
+        self.stats['fallback_uses'] += 1
+        logger.info(
+            f"Using KNN fallback for {len(query_experiences)} queries "
+            f"(fallback uses: {self.stats['fallback_uses']})"
+        )
+
+        self._train_fallback(training_data)
+
+        return self.fallback_adapter.predict_batch(query_experiences, target, confidence_threshold)
+
+    def _train_fallback(self, training_data: List[Experience]):
+        """
+        Bring the fallback adapter's training set in line with ``training_data``
+
+        Only experiences appended since the last call are added; a different
+        training set resets the adapter first, so repeated fallbacks never
+        duplicate training rows.
+        """
+        ids = [exp.experience_id for exp in training_data]
+        known = self._fallback_training_ids
+        if ids[:len(known)] != known:
+            self.fallback_adapter.reset()
+            known = []
+
+        for exp in training_data[len(known):]:
+            self.fallback_adapter.add_training_sample(exp)
+        self._fallback_training_ids = ids
+
     def _update_latency(self, latency_ms: float):
         """Update average latency metric"""
         if self.stats['api_successes'] == 1:
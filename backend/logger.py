@@ -37,5 +37,10 @@ def setup_logger(
     return logger
 
 
+def get_logger(name: str) -> logging.Logger:
+    """Get a module logger with the standard handler and format"""
+    return setup_logger(name)
+
+
 # Default logger
 logger = setup_logger("ada_maritime")
@@ -3,15 +3,19 @@ Email Notification Service
 Sends compliance alerts, permit notifications, and violation warnings
 """
 
-import smtplib
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Union
 import os
 import logging
 
+from .email_templates import register_default_templates
+from .mail_queue import MailQueue, OutboundEmail, SMTPConnectionPool, is_connection_error
+from .templates import TemplateEngine
+
 logger = logging.getLogger(__name__)
 
 # SMTP Configuration from environment
@@ -20,10 +24,18 @@ SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
 SMTP_USER = os.getenv("SMTP_USER", "")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
 SMTP_FROM = os.getenv("SMTP_FROM", "Ada Maritime AI <noreply@adamaritime.ai>")
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "true").lower() != "false"
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "2"))
 
 
 class EmailService:
-    """Email notification service for Ada Maritime AI"""
+    """
+    Email notification service for Ada Maritime AI
+
+    ``send_email`` delivers synchronously; ``enqueue_email`` hands the
+    message to a background MailQueue. Both reuse logged-in sessions from
+    one SMTP connection pool instead of connecting per message.
+    """
 
     def __init__(
         self,
@@ -31,7 +43,14 @@ class EmailService:
         smtp_port: int = SMTP_PORT,
         smtp_user: str = SMTP_USER,
         smtp_password: str = SMTP_PASSWORD,
-        from_email: str = SMTP_FROM
+        from_email: str = SMTP_FROM,
+        use_tls: bool = SMTP_STARTTLS,
+        pool_size: int = SMTP_POOL_SIZE,
+        queue_size: int = 1000,
+        batch_size: int = 20,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        templates: Optional[TemplateEngine] = None
     ):
         self.smtp_host = smtp_host
         self.smtp_port = smtp_port
@@ -39,6 +58,51 @@ class EmailService:
         self.smtp_password = smtp_password
         self.from_email = from_email
 
+        self.pool = SMTPConnectionPool(
+            smtp_host, smtp_port, smtp_user, smtp_password,
+            use_tls=use_tls, size=pool_size
+        )
+        self.mail_queue = MailQueue(
+            self.pool,
+            max_size=queue_size,
+            batch_size=batch_size,
+            max_retries=max_retries,
+            backoff_base=retry_backoff
+        )
+        self.templates = templates or register_default_templates(TemplateEngine())
+
+    def _build_message(
+        self,
+        to_emails: List[str],
+        subject: str,
+        body_html: str,
+        body_text: Optional[str] = None,
+        attachments: Optional[List[Dict[str, Any]]] = None
+    ) -> MIMEMultipart:
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = self.from_email
+        msg["To"] = ", ".join(to_emails)
+
+        # Add plain text version
+        if body_text:
+            msg.attach(MIMEText(body_text, "plain"))
+
+        # Add HTML version
+        msg.attach(MIMEText(body_html, "html"))
+
+        # Add attachments
+        if attachments:
+            for attachment in attachments:
+                part = MIMEApplication(
+                    attachment["content"],
+                    Name=attachment["filename"]
+                )
+                part["Content-Disposition"] = f'attachment; filename="{attachment["filename"]}"'
+                msg.attach(part)
+
+        return msg
+
     def send_email(
         self,
         to_emails: List[str],
@@ -61,33 +125,18 @@ class EmailService:
             True if email sent successfully
         """
         try:
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = subject
-            msg["From"] = self.from_email
-            msg["To"] = ", ".join(to_emails)
-
-            # Add plain text version
-            if body_text:
-                msg.attach(MIMEText(body_text, "plain"))
-
-            # Add HTML version
-            msg.attach(MIMEText(body_html, "html"))
-
-            # Add attachments
-            if attachments:
-                for attachment in attachments:
-                    part = MIMEApplication(
-                        attachment["content"],
-                        Name=attachment["filename"]
-                    )
-                    part["Content-Disposition"] = f'attachment; filename="{attachment["filename"]}"'
-                    msg.attach(part)
-
-            # Send email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.smtp_user, self.smtp_password)
-                server.sendmail(self.from_email, to_emails, msg.as_string())
+            msg = self._build_message(to_emails, subject, body_html, body_text, attachments)
+            content = msg.as_string()
+
+            # A pooled session may have been dropped by the server; reconnect once
+            for attempt in range(2):
+                try:
+                    with self.pool.connection() as server:
+                        server.sendmail(self.from_email, to_emails, content)
+                    break
+                except Exception as e:
+                    if attempt or not is_connection_error(e):
+                        raise
 
             logger.info(f"Email sent to {to_emails}: {subject}")
             return True
@@ -96,6 +145,117 @@ class EmailService:
             logger.error(f"Failed to send email: {e}")
             return False
 
+    async def enqueue_email(
+        self,
+        to_emails: List[str],
+        subject: str,
+        body_html: str,
+        body_text: Optional[str] = None,
+        attachments: Optional[List[Dict[str, Any]]] = None,
+        wait: bool = False
+    ) -> Any:
+        """
+        Queue email for background delivery
+
+        Args:
+            to_emails: List of recipient email addresses
+            subject: Email subject
+            body_html: HTML email body
+            body_text: Plain text email body (optional)
+            attachments: List of attachments [{filename, content, mimetype}]
+            wait: Wait for delivery (including retries) and return its result
+
+        Returns:
+            Message ID, or True/False for delivery when ``wait`` is set
+        """
+        msg = self._build_message(to_emails, subject, body_html, body_text, attachments)
+        email = OutboundEmail(
+            message_id=self.mail_queue.next_message_id(),
+            from_addr=self.from_email,
+            to_addrs=list(to_emails),
+            content=msg.as_string(),
+            subject=subject,
+        )
+        if wait:
+            email.result = asyncio.get_running_loop().create_future()
+
+        await self.mail_queue.put(email)
+
+        if wait:
+            return await email.result
+        return email.message_id
+
+    def _render_outbound(
+        self,
+        template: str,
+        to_emails: List[str],
+        params: Dict[str, Any],
+        language: Optional[str]
+    ) -> OutboundEmail:
+        """Render and MIME-encode one bulk message (runs in a worker thread)"""
+        email = self.templates.render(template, params, language)
+        msg = self._build_message(to_emails, email.subject, email.html, email.text)
+        return OutboundEmail(
+            message_id=self.mail_queue.next_message_id(),
+            from_addr=self.from_email,
+            to_addrs=to_emails,
+            content=msg.as_string(),
+            subject=email.subject,
+        )
+
+    async def send_bulk(
+        self,
+        template: str,
+        recipients_with_params: Iterable[Tuple[Union[str, List[str]], Dict[str, Any]]],
+        language: Optional[str] = None,
+        workers: int = 4
+    ) -> List[str]:
+        """
+        Render one template for many recipients and queue the results
+
+        Rendering and MIME encoding run in a thread pool; each message is
+        queued as soon as it is ready, so delivery overlaps rendering.
+
+        Args:
+            template: Template name (e.g. "insurance_expiry_warning")
+            recipients_with_params: (recipient or recipients, template params) pairs
+            language: Template language (engine default if omitted)
+            workers: Rendering threads
+
+        Returns:
+            Message IDs in input order
+        """
+        loop = asyncio.get_running_loop()
+        self.templates.get(template, language)  # Compile up front; unknown names fail fast
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="email-render") as pool:
+            pending = [
+                loop.run_in_executor(
+                    pool, self._render_outbound, template,
+                    [to] if isinstance(to, str) else list(to), params, language
+                )
+                for to, params in recipients_with_params
+            ]
+            message_ids = []
+            for rendered in pending:
+                email = await rendered
+                await self.mail_queue.put(email)
+                message_ids.append(email.message_id)
+
+        logger.info(f"Queued {len(message_ids)} '{template}' emails")
+        return message_ids
+
+    async def flush(self) -> None:
+        """Wait until all queued email is delivered or has failed"""
+        await self.mail_queue.flush()
+
+    async def close(self) -> None:
+        """Deliver queued email, then stop the sender and close SMTP sessions"""
+        await self.mail_queue.close(flush=True)
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        return self.mail_queue.get_stats()
+
     # === Compliance Notifications ===
 
     def send_violation_alert(
@@ -115,77 +275,10 @@ class EmailService:
         Returns:
             True if sent successfully
         """
-        severity_emoji = {
-            "critical": "🚨",
-            "high": "⚠️",
-            "medium": "⚡",
-            "low": "ℹ️"
-        }
-
-        emoji = severity_emoji.get(violation.get("severity", "medium"), "⚠️")
-
-        subject = f"{emoji} Compliance Violation - Article {violation.get('article_number')}"
-
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; color: #333;">
-            <div style="background-color: #f44336; color: white; padding: 20px; border-radius: 5px;">
-                <h2>{emoji} Compliance Violation Detected</h2>
-            </div>
-
-            <div style="padding: 20px;">
-                <h3>Violation Details</h3>
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Marina:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{marina_name}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Article:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{violation.get('article_number')}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Severity:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{violation.get('severity', 'N/A').upper()}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Description:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{violation.get('description', 'N/A')}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Detected:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{violation.get('detected_at', 'N/A')}</td>
-                    </tr>
-                </table>
-
-                <div style="margin-top: 20px; padding: 15px; background-color: #fff3cd; border-left: 4px solid #ffc107;">
-                    <strong>Required Actions:</strong>
-                    <ul>
-                        {"".join([f"<li>{action}</li>" for action in violation.get('required_actions', [])])}
-                    </ul>
-                </div>
-
-                <p style="margin-top: 20px;">
-                    <strong>Response Time Required:</strong> {violation.get('response_time_hours', 'N/A')} hours
-                </p>
-
-                <div style="margin-top: 30px; text-align: center;">
-                    <a href="http://dashboard.adamaritime.ai/violations/{violation.get('violation_id')}"
-                       style="background-color: #2196F3; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px;">
-                        View Details & Resolve
-                    </a>
-                </div>
-            </div>
-
-            <div style="margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; font-size: 12px; color: #666;">
-                Ada Maritime AI - Compliance Management System<br>
-                This is an automated notification. Please do not reply to this email.
-            </div>
-        </body>
-        </html>
-        """
-
-        return self.send_email(to_emails, subject, html_body)
+        email = self.templates.render(
+            "violation_alert", {"violation": violation, "marina_name": marina_name}
+        )
+        return self.send_email(to_emails, email.subject, email.html)
 
     def send_insurance_expiry_warning(
         self,
@@ -208,65 +301,13 @@ class EmailService:
         Returns:
             True if sent successfully
         """
-        subject = f"⚠️ Insurance Expiring Soon - {vessel_name}"
-
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; color: #333;">
-            <div style="background-color: #ff9800; color: white; padding: 20px; border-radius: 5px;">
-                <h2>⚠️ Insurance Renewal Required</h2>
-            </div>
-
-            <div style="padding: 20px;">
-                <p>Dear Vessel Owner,</p>
-
-                <p>This is a reminder that the insurance policy for <strong>{vessel_name}</strong>
-                is expiring in <strong>{days_until_expiry} days</strong>.</p>
-
-                <h3>Vessel Details</h3>
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Vessel Name:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{vessel_name}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Registration:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{vessel_registration}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Expiry Date:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{expiry_date}</td>
-                    </tr>
-                </table>
-
-                <div style="margin-top: 20px; padding: 15px; background-color: #ffebee; border-left: 4px solid #f44336;">
-                    <strong>⚠️ Important Notice:</strong><br>
-                    Per Article E.2.1 of the Marina Operation Regulations, vessels without valid insurance
-                    are not permitted to remain in the marina. Please renew your insurance policy before
-                    the expiry date to avoid service interruption.
-                </div>
-
-                <p style="margin-top: 20px;">
-                    To update your insurance information, please contact the marina office or
-                    upload your renewed policy through the marina portal.
-                </p>
-
-                <div style="margin-top: 30px; text-align: center;">
-                    <a href="http://dashboard.adamaritime.ai/insurance/renew"
-                       style="background-color: #4CAF50; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px;">
-                        Upload Renewed Policy
-                    </a>
-                </div>
-            </div>
-
-            <div style="margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; font-size: 12px; color: #666;">
-                Ada Maritime AI - Compliance Management System
-            </div>
-        </body>
-        </html>
-        """
-
-        return self.send_email(to_emails, subject, html_body)
+        email = self.templates.render("insurance_expiry_warning", {
+            "vessel_name": vessel_name,
+            "vessel_registration": vessel_registration,
+            "expiry_date": expiry_date,
+            "days_until_expiry": days_until_expiry,
+        })
+        return self.send_email(to_emails, email.subject, email.html)
 
     def send_permit_approved(
         self,
@@ -285,71 +326,10 @@ class EmailService:
         Returns:
             True if sent successfully
         """
-        subject = f"✅ Hot Work Permit Approved - {permit.get('work_location')}"
-
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; color: #333;">
-            <div style="background-color: #4CAF50; color: white; padding: 20px; border-radius: 5px;">
-                <h2>✅ Hot Work Permit Approved</h2>
-            </div>
-
-            <div style="padding: 20px;">
-                <p>Your hot work permit request has been approved.</p>
-
-                <h3>Permit Details</h3>
-                <table style="width: 100%; border-collapse: collapse;">
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Permit ID:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{permit.get('permit_id')}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Location:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{permit.get('work_location')}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Work Description:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{permit.get('work_description')}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Scheduled Start:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{permit.get('scheduled_start')}</td>
-                    </tr>
-                    <tr>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Scheduled End:</strong></td>
-                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{permit.get('scheduled_end')}</td>
-                    </tr>
-                </table>
-
-                <div style="margin-top: 20px; padding: 15px; background-color: #fff3cd; border-left: 4px solid #ffc107;">
-                    <strong>⚠️ Safety Requirements (Article E.5.5):</strong>
-                    <ul>
-                        <li>Fire watch must be present at all times</li>
-                        <li>Fire extinguisher must be readily available</li>
-                        <li>Area must be clear of flammable materials</li>
-                        <li>Work must be completed by scheduled end time</li>
-                        <li>Notify marina office when work begins and ends</li>
-                    </ul>
-                </div>
-
-                {"<p style='margin-top: 15px; color: #d32f2f;'><strong>🔥 Fire Watch Required:</strong> A designated fire watch person must be present during all hot work activities.</p>" if permit.get('fire_watch_required') else ""}
-
-                <div style="margin-top: 30px; text-align: center;">
-                    <a href="http://dashboard.adamaritime.ai/permits/{permit.get('permit_id')}"
-                       style="background-color: #2196F3; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px;">
-                        View Permit Details
-                    </a>
-                </div>
-            </div>
-
-            <div style="margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; font-size: 12px; color: #666;">
-                Ada Maritime AI - Permit Management System
-            </div>
-        </body>
-        </html>
-        """
-
-        return self.send_email(to_emails, subject, html_body)
+        email = self.templates.render(
+            "permit_approved", {"permit": permit, "marina_name": marina_name}
+        )
+        return self.send_email(to_emails, email.subject, email.html)
 
     def send_daily_compliance_report(
         self,
@@ -368,65 +348,10 @@ class EmailService:
         Returns:
             True if sent successfully
         """
-        subject = f"📊 Daily Compliance Report - {marina_name} - {datetime.now().strftime('%Y-%m-%d')}"
-
-        summary = audit_summary.get("summary", {})
-        violations_by_severity = summary.get("by_severity", {})
-
-        html_body = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif; color: #333;">
-            <div style="background-color: #1976D2; color: white; padding: 20px; border-radius: 5px;">
-                <h2>📊 Daily Compliance Report</h2>
-                <p>{marina_name} - {datetime.now().strftime('%B %d, %Y')}</p>
-            </div>
-
-            <div style="padding: 20px;">
-                <h3>Summary</h3>
-                <div style="display: flex; justify-content: space-around; margin: 20px 0;">
-                    <div style="text-align: center; padding: 15px; background-color: #f44336; color: white; border-radius: 5px; min-width: 100px;">
-                        <div style="font-size: 32px; font-weight: bold;">{violations_by_severity.get('critical', 0)}</div>
-                        <div>Critical</div>
-                    </div>
-                    <div style="text-align: center; padding: 15px; background-color: #ff9800; color: white; border-radius: 5px; min-width: 100px;">
-                        <div style="font-size: 32px; font-weight: bold;">{violations_by_severity.get('high', 0)}</div>
-                        <div>High</div>
-                    </div>
-                    <div style="text-align: center; padding: 15px; background-color: #ffc107; color: white; border-radius: 5px; min-width: 100px;">
-                        <div style="font-size: 32px; font-weight: bold;">{violations_by_severity.get('medium', 0)}</div>
-                        <div>Medium</div>
-                    </div>
-                    <div style="text-align: center; padding: 15px; background-color: #2196F3; color: white; border-radius: 5px; min-width: 100px;">
-                        <div style="font-size: 32px; font-weight: bold;">{violations_by_severity.get('low', 0)}</div>
-                        <div>Low</div>
-                    </div>
-                </div>
-
-                <h3>Statistics</h3>
-                <ul>
-                    <li>Total Active Violations: <strong>{summary.get('total_active_violations', 0)}</strong></li>
-                    <li>Resolved Today: <strong>{summary.get('resolved_today', 0)}</strong></li>
-                    <li>New Violations: <strong>{summary.get('new_violations', 0)}</strong></li>
-                    <li>Active Hot Work Permits: <strong>{summary.get('active_permits', 0)}</strong></li>
-                    <li>Insurance Expiring Soon: <strong>{summary.get('insurance_expiring_soon', 0)}</strong></li>
-                </ul>
-
-                <div style="margin-top: 30px; text-align: center;">
-                    <a href="http://dashboard.adamaritime.ai/compliance/report"
-                       style="background-color: #4CAF50; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px;">
-                        View Full Report
-                    </a>
-                </div>
-            </div>
-
-            <div style="margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; font-size: 12px; color: #666;">
-                Ada Maritime AI - Automated Daily Report
-            </div>
-        </body>
-        </html>
-        """
-
-        return self.send_email(to_emails, subject, html_body)
+        email = self.templates.render(
+            "daily_compliance_report", {"marina_name": marina_name, "audit_summary": audit_summary}
+        )
+        return self.send_email(to_emails, email.subject, email.html)
 
 
 # Singleton instance
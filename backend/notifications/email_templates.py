@@ -0,0 +1,340 @@
+"""
+Compliance and Permit Email Templates
+HTML sources for EmailService, registered with a TemplateEngine
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+
+from .templates import TemplateEngine
+
+SEVERITY_EMOJI = {
+    "critical": "🚨",
+    "high": "⚠️",
+    "medium": "⚡",
+    "low": "ℹ️"
+}
+
+FIRE_WATCH_NOTICE = (
+    "<p style='margin-top: 15px; color: #d32f2f;'><strong>🔥 Fire Watch Required:</strong> "
+    "A designated fire watch person must be present during all hot work activities.</p>"
+)
+
+
+# === Violation alert ===
+
+VIOLATION_ALERT_SUBJECT = "{emoji} Compliance Violation - Article {article_number}"
+
+VIOLATION_ALERT_HTML = """
+        <html>
+        <body style="font-family: Arial, sans-serif; color: #333;">
+            <div style="background-color: #f44336; color: white; padding: 20px; border-radius: 5px;">
+                <h2>{emoji} Compliance Violation Detected</h2>
+            </div>
+
+            <div style="padding: 20px;">
+                <h3>Violation Details</h3>
+                <table style="width: 100%; border-collapse: collapse;">
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Marina:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{marina_name}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Article:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{article_number}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Severity:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{severity}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Description:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{description}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Detected:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{detected_at}</td>
+                    </tr>
+                </table>
+
+                <div style="margin-top: 20px; padding: 15px; background-color: #fff3cd; border-left: 4px solid #ffc107;">
+                    <strong>Required Actions:</strong>
+                    <ul>
+                        {required_actions}
+                    </ul>
+                </div>
+
+                <p style="margin-top: 20px;">
+                    <strong>Response Time Required:</strong> {response_time_hours} hours
+                </p>
+
+                <div style="margin-top: 30px; text-align: center;">
+                    <a href="http://dashboard.adamaritime.ai/violations/{violation_id}"
+                       style="background-color: #2196F3; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px;">
+                        View Details & Resolve
+                    </a>
+                </div>
+            </div>
+
+            <div style="margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; font-size: 12px; color: #666;">
+                Ada Maritime AI - Compliance Management System<br>
+                This is an automated notification. Please do not reply to this email.
+            </div>
+        </body>
+        </html>
+        """
+
+
+def violation_alert_context(params: Dict[str, Any]) -> Dict[str, Any]:
+    """params: violation, marina_name"""
+    violation = params["violation"]
+    return {
+        "emoji": SEVERITY_EMOJI.get(violation.get("severity", "medium"), "⚠️"),
+        "marina_name": params["marina_name"],
+        "article_number": violation.get("article_number"),
+        "severity": violation.get("severity", "N/A").upper(),
+        "description": violation.get("description", "N/A"),
+        "detected_at": violation.get("detected_at", "N/A"),
+        "required_actions": "".join(
+            f"<li>{action}</li>" for action in violation.get("required_actions", [])
+        ),
+        "response_time_hours": violation.get("response_time_hours", "N/A"),
+        "violation_id": violation.get("violation_id"),
+    }
+
+
+# === Insurance expiry warning ===
+
+INSURANCE_EXPIRY_SUBJECT = "⚠️ Insurance Expiring Soon - {vessel_name}"
+
+INSURANCE_EXPIRY_HTML = """
+        <html>
+        <body style="font-family: Arial, sans-serif; color: #333;">
+            <div style="background-color: #ff9800; color: white; padding: 20px; border-radius: 5px;">
+                <h2>⚠️ Insurance Renewal Required</h2>
+            </div>
+
+            <div style="padding: 20px;">
+                <p>Dear Vessel Owner,</p>
+
+                <p>This is a reminder that the insurance policy for <strong>{vessel_name}</strong>
+                is expiring in <strong>{days_until_expiry} days</strong>.</p>
+
+                <h3>Vessel Details</h3>
+                <table style="width: 100%; border-collapse: collapse;">
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Vessel Name:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{vessel_name}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Registration:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{vessel_registration}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Expiry Date:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{expiry_date}</td>
+                    </tr>
+                </table>
+
+                <div style="margin-top: 20px; padding: 15px; background-color: #ffebee; border-left: 4px solid #f44336;">
+                    <strong>⚠️ Important Notice:</strong><br>
+                    Per Article E.2.1 of the Marina Operation Regulations, vessels without valid insurance
+                    are not permitted to remain in the marina. Please renew your insurance policy before
+                    the expiry date to avoid service interruption.
+                </div>
+
+                <p style="margin-top: 20px;">
+                    To update your insurance information, please contact the marina office or
+                    upload your renewed policy through the marina portal.
+                </p>
+
+                <div style="margin-top: 30px; text-align: center;">
+                    <a href="http://dashboard.adamaritime.ai/insurance/renew"
+                       style="background-color: #4CAF50; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px;">
+                        Upload Renewed Policy
+                    </a>
+                </div>
+            </div>
+
+            <div style="margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; font-size: 12px; color: #666;">
+                Ada Maritime AI - Compliance Management System
+            </div>
+        </body>
+        </html>
+        """
+
+
+# === Hot work permit approved ===
+
+PERMIT_APPROVED_SUBJECT = "✅ Hot Work Permit Approved - {work_location}"
+
+PERMIT_APPROVED_HTML = """
+        <html>
+        <body style="font-family: Arial, sans-serif; color: #333;">
+            <div style="background-color: #4CAF50; color: white; padding: 20px; border-radius: 5px;">
+                <h2>✅ Hot Work Permit Approved</h2>
+            </div>
+
+            <div style="padding: 20px;">
+                <p>Your hot work permit request has been approved.</p>
+
+                <h3>Permit Details</h3>
+                <table style="width: 100%; border-collapse: collapse;">
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Permit ID:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{permit_id}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Location:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{work_location}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Work Description:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{work_description}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Scheduled Start:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{scheduled_start}</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;"><strong>Scheduled End:</strong></td>
+                        <td style="padding: 10px; border-bottom: 1px solid #ddd;">{scheduled_end}</td>
+                    </tr>
+                </table>
+
+                <div style="margin-top: 20px; padding: 15px; background-color: #fff3cd; border-left: 4px solid #ffc107;">
+                    <strong>⚠️ Safety Requirements (Article E.5.5):</strong>
+                    <ul>
+                        <li>Fire watch must be present at all times</li>
+                        <li>Fire extinguisher must be readily available</li>
+                        <li>Area must be clear of flammable materials</li>
+                        <li>Work must be completed by scheduled end time</li>
+                        <li>Notify marina office when work begins and ends</li>
+                    </ul>
+                </div>
+
+                {fire_watch_notice}
+
+                <div style="margin-top: 30px; text-align: center;">
+                    <a href="http://dashboard.adamaritime.ai/permits/{permit_id}"
+                       style="background-color: #2196F3; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px;">
+                        View Permit Details
+                    </a>
+                </div>
+            </div>
+
+            <div style="margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; font-size: 12px; color: #666;">
+                Ada Maritime AI - Permit Management System
+            </div>
+        </body>
+        </html>
+        """
+
+
+def permit_approved_context(params: Dict[str, Any]) -> Dict[str, Any]:
+    """params: permit, marina_name"""
+    permit = params["permit"]
+    return {
+        "permit_id": permit.get("permit_id"),
+        "work_location": permit.get("work_location"),
+        "work_description": permit.get("work_description"),
+        "scheduled_start": permit.get("scheduled_start"),
+        "scheduled_end": permit.get("scheduled_end"),
+        "fire_watch_notice": FIRE_WATCH_NOTICE if permit.get("fire_watch_required") else "",
+    }
+
+
+# === Daily compliance report ===
+
+DAILY_REPORT_SUBJECT = "📊 Daily Compliance Report - {marina_name} - {report_date}"
+
+DAILY_REPORT_HTML = """
+        <html>
+        <body style="font-family: Arial, sans-serif; color: #333;">
+            <div style="background-color: #1976D2; color: white; padding: 20px; border-radius: 5px;">
+                <h2>📊 Daily Compliance Report</h2>
+                <p>{marina_name} - {report_date_long}</p>
+            </div>
+
+            <div style="padding: 20px;">
+                <h3>Summary</h3>
+                <div style="display: flex; justify-content: space-around; margin: 20px 0;">
+                    <div style="text-align: center; padding: 15px; background-color: #f44336; color: white; border-radius: 5px; min-width: 100px;">
+                        <div style="font-size: 32px; font-weight: bold;">{critical}</div>
+                        <div>Critical</div>
+                    </div>
+                    <div style="text-align: center; padding: 15px; background-color: #ff9800; color: white; border-radius: 5px; min-width: 100px;">
+                        <div style="font-size: 32px; font-weight: bold;">{high}</div>
+                        <div>High</div>
+                    </div>
+                    <div style="text-align: center; padding: 15px; background-color: #ffc107; color: white; border-radius: 5px; min-width: 100px;">
+                        <div style="font-size: 32px; font-weight: bold;">{medium}</div>
+                        <div>Medium</div>
+                    </div>
+                    <div style="text-align: center; padding: 15px; background-color: #2196F3; color: white; border-radius: 5px; min-width: 100px;">
+                        <div style="font-size: 32px; font-weight: bold;">{low}</div>
+                        <div>Low</div>
+                    </div>
+                </div>
+
+                <h3>Statistics</h3>
+                <ul>
+                    <li>Total Active Violations: <strong>{total_active_violations}</strong></li>
+                    <li>Resolved Today: <strong>{resolved_today}</strong></li>
+                    <li>New Violations: <strong>{new_violations}</strong></li>
+                    <li>Active Hot Work Permits: <strong>{active_permits}</strong></li>
+                    <li>Insurance Expiring Soon: <strong>{insurance_expiring_soon}</strong></li>
+                </ul>
+
+                <div style="margin-top: 30px; text-align: center;">
+                    <a href="http://dashboard.adamaritime.ai/compliance/report"
+                       style="background-color: #4CAF50; color: white; padding: 12px 24px; text-decoration: none; border-radius: 5px;">
+                        View Full Report
+                    </a>
+                </div>
+            </div>
+
+            <div style="margin-top: 30px; padding: 20px; background-color: #f5f5f5; text-align: center; font-size: 12px; color: #666;">
+                Ada Maritime AI - Automated Daily Report
+            </div>
+        </body>
+        </html>
+        """
+
+
+def daily_report_context(params: Dict[str, Any]) -> Dict[str, Any]:
+    """params: marina_name, audit_summary"""
+    summary = params["audit_summary"].get("summary", {})
+    by_severity = summary.get("by_severity", {})
+    now = datetime.now()
+    return {
+        "marina_name": params["marina_name"],
+        "report_date": now.strftime("%Y-%m-%d"),
+        "report_date_long": now.strftime("%B %d, %Y"),
+        **{level: by_severity.get(level, 0) for level in ("critical", "high", "medium", "low")},
+        **{
+            key: summary.get(key, 0)
+            for key in (
+                "total_active_violations", "resolved_today", "new_violations",
+                "active_permits", "insurance_expiring_soon",
+            )
+        },
+    }
+
+
+def register_default_templates(engine: TemplateEngine) -> TemplateEngine:
+    """Register the compliance and permit templates (English)"""
+    engine.register(
+        "violation_alert", VIOLATION_ALERT_SUBJECT, VIOLATION_ALERT_HTML,
+        context=violation_alert_context
+    )
+    engine.register("insurance_expiry_warning", INSURANCE_EXPIRY_SUBJECT, INSURANCE_EXPIRY_HTML)
+    engine.register(
+        "permit_approved", PERMIT_APPROVED_SUBJECT, PERMIT_APPROVED_HTML,
+        context=permit_approved_context
+    )
+    engine.register(
+        "daily_compliance_report", DAILY_REPORT_SUBJECT, DAILY_REPORT_HTML,
+        context=daily_report_context
+    )
+    return engine
@@ -0,0 +1,305 @@
+"""
+Outbound Mail Queue
+Pooled SMTP connections and a background sender with batching and retries
+"""
+
+import asyncio
+import itertools
+import logging
+import random
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def is_connection_error(exc: BaseException) -> bool:
+    """True if the SMTP session is unusable after ``exc``"""
+    if isinstance(exc, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError)):
+        return True
+    # SMTPException subclasses OSError; plain OSErrors are socket failures
+    return isinstance(exc, OSError) and not isinstance(exc, smtplib.SMTPException)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """True if delivery may succeed on retry (4xx replies, dropped connections)"""
+    if is_connection_error(exc):
+        return True
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 400 <= exc.smtp_code < 500
+    return False
+
+
+class SMTPConnectionPool:
+    """
+    Thread-safe pool of logged-in SMTP sessions
+
+    At most ``size`` sessions exist at once. Sessions idle for longer than
+    ``max_idle`` seconds are replaced on checkout, and any session that
+    raises while checked out is closed instead of being returned, so the
+    next checkout reconnects.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str = "",
+        password: str = "",
+        use_tls: bool = True,
+        size: int = 2,
+        timeout: float = 30.0,
+        max_idle: float = 60.0
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.use_tls = use_tls
+        self.size = size
+        self.timeout = timeout
+        self.max_idle = max_idle
+
+        self._idle: List[tuple] = []  # (server, last_used), most recent last
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self.connects = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                server.starttls()
+            if self.user:
+                server.login(self.user, self.password)
+        except Exception:
+            server.close()
+            raise
+        self.connects += 1
+        return server
+
+    @staticmethod
+    def _discard(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """Check out a session for the duration of the ``with`` block"""
+        self._slots.acquire()
+        try:
+            server = None
+            with self._lock:
+                while self._idle:
+                    candidate, last_used = self._idle.pop()
+                    if time.monotonic() - last_used < self.max_idle:
+                        server = candidate
+                        break
+                    self._discard(candidate)
+            if server is None:
+                server = self._connect()
+
+            try:
+                yield server
+            except BaseException:
+                self._discard(server)
+                raise
+
+            with self._lock:
+                self._idle.append((server, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        """Quit all idle sessions"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self._discard(server)
+
+
+@dataclass
+class OutboundEmail:
+    """A rendered message waiting for delivery"""
+    message_id: str
+    from_addr: str
+    to_addrs: List[str]
+    content: str
+    subject: str = ""
+    attempts: int = 0
+    last_error: Optional[str] = None
+    result: Optional["asyncio.Future[bool]"] = field(default=None, repr=False)
+
+
+class MailQueue:
+    """
+    Background sender for OutboundEmail
+
+    ``workers`` tasks each take up to ``batch_size`` queued messages and
+    deliver them over one pooled session in a worker thread, so SMTP I/O
+    never blocks the event loop. Transient failures are retried up to
+    ``max_retries`` times with exponential backoff and jitter; permanent
+    failures (5xx) are logged and dropped.
+    """
+
+    def __init__(
+        self,
+        pool: SMTPConnectionPool,
+        max_size: int = 1000,
+        batch_size: int = 20,
+        workers: Optional[int] = None,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0
+    ):
+        self.pool = pool
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.workers = workers or pool.size
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self._queue: Optional["asyncio.Queue[OutboundEmail]"] = None
+        self._tasks: List["asyncio.Task[None]"] = []
+        self._retry_handles: Dict[str, asyncio.TimerHandle] = {}
+        self._pending = 0
+        self._idle: Optional[asyncio.Event] = None
+        self._ids = itertools.count(1)
+
+        self.stats = {"enqueued": 0, "sent": 0, "failed": 0, "retries": 0, "batches": 0}
+
+    def next_message_id(self) -> str:
+        return f"mail-{int(time.time())}-{next(self._ids)}"
+
+    def _ensure_started(self) -> "asyncio.Queue[OutboundEmail]":
+        """Create the queue and sender tasks on the running loop"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+            self._idle = asyncio.Event()
+            self._idle.set()
+        self._tasks = [t for t in self._tasks if not t.done()]
+        while len(self._tasks) < self.workers:
+            self._tasks.append(asyncio.ensure_future(self._sender()))
+        return self._queue
+
+    async def put(self, email: OutboundEmail) -> None:
+        """Queue a message (waits while the queue is full)"""
+        queue = self._ensure_started()
+        self._pending += 1
+        self._idle.clear()
+        self.stats["enqueued"] += 1
+        await queue.put(email)
+
+    async def _sender(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            try:
+                outcomes = await asyncio.to_thread(self._deliver_batch, batch)
+            except Exception as e:  # Defensive: _deliver_batch reports per message
+                outcomes = [e] * len(batch)
+
+            self.stats["batches"] += 1
+            for email, error in zip(batch, outcomes):
+                self._handle_outcome(email, error)
+                queue.task_done()
+
+    def _deliver_batch(self, batch: List[OutboundEmail]) -> List[Optional[BaseException]]:
+        """Send a batch over one session (runs in a worker thread)"""
+        outcomes: List[Optional[BaseException]] = []
+        try:
+            with self.pool.connection() as server:
+                for email in batch:
+                    try:
+                        server.sendmail(email.from_addr, email.to_addrs, email.content)
+                        outcomes.append(None)
+                    except smtplib.SMTPException as e:
+                        if is_connection_error(e):
+                            raise
+                        outcomes.append(e)
+        except Exception as e:
+            # Connection lost (or never made): everything not yet sent shares the error
+            outcomes.extend([e] * (len(batch) - len(outcomes)))
+        return outcomes
+
+    def _handle_outcome(self, email: OutboundEmail, error: Optional[BaseException]) -> None:
+        email.attempts += 1
+        if error is None:
+            self.stats["sent"] += 1
+            logger.info(f"Email sent to {email.to_addrs}: {email.subject}")
+            self._finish(email, True)
+            return
+
+        email.last_error = str(error)
+        if is_transient(error) and email.attempts <= self.max_retries:
+            delay = min(self.backoff_max, self.backoff_base * 2 ** (email.attempts - 1))
+            delay *= random.uniform(0.5, 1.0)
+            self.stats["retries"] += 1
+            logger.warning(
+                f"Email {email.message_id} failed ({error}), retry {email.attempts}/"
+                f"{self.max_retries} in {delay:.1f}s"
+            )
+            loop = asyncio.get_running_loop()
+            self._retry_handles[email.message_id] = loop.call_later(delay, self._requeue, email)
+            return
+
+        self.stats["failed"] += 1
+        logger.error(f"Failed to send email {email.message_id} to {email.to_addrs}: {error}")
+        self._finish(email, False)
+
+    def _requeue(self, email: OutboundEmail) -> None:
+        self._retry_handles.pop(email.message_id, None)
+        try:
+            self._queue.put_nowait(email)
+        except asyncio.QueueFull:
+            # Retry again later rather than blocking the loop callback
+            loop = asyncio.get_running_loop()
+            self._retry_handles[email.message_id] = loop.call_later(
+                self.backoff_base, self._requeue, email
+            )
+
+    def _finish(self, email: OutboundEmail, sent: bool) -> None:
+        if email.result is not None and not email.result.done():
+            email.result.set_result(sent)
+        self._pending -= 1
+        if self._pending == 0:
+            self._idle.set()
+
+    async def flush(self) -> None:
+        """Wait until every queued message is sent or has failed permanently"""
+        if self._idle is not None:
+            self._ensure_started()
+            await self._idle.wait()
+
+    async def close(self, flush: bool = True) -> None:
+        """Stop the senders (after delivering queued mail when ``flush``) and the pool"""
+        if flush:
+            await self.flush()
+        for handle in self._retry_handles.values():
+            handle.cancel()
+        self._retry_handles.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await asyncio.to_thread(self.pool.close)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "pending": self._pending,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "connections_opened": self.pool.connects,
+        }
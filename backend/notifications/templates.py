@@ -0,0 +1,158 @@
+"""
+Email Template Engine
+Templates compiled once per language and rendered by filling placeholders
+"""
+
+import threading
+from dataclasses import dataclass
+from string import Formatter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Maps the caller's params to the template's placeholder values
+ContextBuilder = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+@dataclass
+class RenderedEmail:
+    """Output of TemplateEngine.render"""
+    subject: str
+    html: str
+    text: Optional[str] = None
+
+
+class CompiledText:
+    """
+    A ``str.format``-style source split into static fragments and slots
+
+    The source is parsed once; rendering only formats the slot values and
+    joins them with the precomputed static fragments. A source without
+    placeholders renders to the cached string itself.
+    """
+
+    __slots__ = ("fragments", "fields", "static")
+
+    def __init__(self, source: str):
+        self.fragments: List[str] = []
+        self.fields: List[Tuple[str, Optional[str], str]] = []  # (name, conversion, spec)
+        for literal, name, spec, conversion in Formatter().parse(source):
+            self.fragments.append(literal)
+            if name is not None:
+                self.fields.append((name, conversion, spec or ""))
+        self.static: Optional[str] = "".join(self.fragments) if not self.fields else None
+
+    def render(self, values: Dict[str, Any]) -> str:
+        if self.static is not None:
+            return self.static
+
+        parts = []
+        for literal, (name, conversion, spec) in zip(self.fragments, self.fields):
+            value = values[name]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            elif conversion == "a":
+                value = ascii(value)
+            parts.append(literal)
+            parts.append(format(value, spec) if spec else str(value))
+        if len(self.fragments) > len(self.fields):
+            parts.append(self.fragments[-1])
+        return "".join(parts)
+
+
+class CompiledTemplate:
+    """Subject, HTML and optional text bodies of one template in one language"""
+
+    __slots__ = ("name", "language", "subject", "html", "text", "context")
+
+    def __init__(
+        self,
+        name: str,
+        language: str,
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        context: Optional[ContextBuilder] = None
+    ):
+        self.name = name
+        self.language = language
+        self.subject = CompiledText(subject)
+        self.html = CompiledText(html)
+        self.text = CompiledText(text) if text is not None else None
+        self.context = context
+
+    def render(self, params: Dict[str, Any]) -> RenderedEmail:
+        values = self.context(params) if self.context else params
+        return RenderedEmail(
+            subject=self.subject.render(values),
+            html=self.html.render(values),
+            text=self.text.render(values) if self.text is not None else None,
+        )
+
+
+class TemplateEngine:
+    """
+    Registry of email templates keyed by (name, language)
+
+    Sources are compiled on first use and kept for the life of the engine,
+    so bulk sends pay the parsing cost once per template and language.
+    Languages without a registered variant fall back to
+    ``default_language``. Safe to render from several threads.
+    """
+
+    def __init__(self, default_language: str = "en"):
+        self.default_language = default_language
+        self._sources: Dict[Tuple[str, str], Tuple[str, str, Optional[str], Optional[ContextBuilder]]] = {}
+        self._compiled: Dict[Tuple[str, str], CompiledTemplate] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        name: str,
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        context: Optional[ContextBuilder] = None,
+        language: Optional[str] = None
+    ) -> None:
+        """
+        Add or replace a template
+
+        Args:
+            name: Template name
+            subject: Subject source (``str.format`` placeholders)
+            html: HTML body source
+            text: Plain text body source (optional)
+            context: Builds placeholder values from render params (optional)
+            language: Language of this variant (default_language if omitted)
+        """
+        key = (name, language or self.default_language)
+        with self._lock:
+            self._sources[key] = (subject, html, text, context)
+            # Drop this variant and any other language that fell back to it
+            self._compiled = {k: v for k, v in self._compiled.items() if k[0] != name}
+
+    def get(self, name: str, language: Optional[str] = None) -> CompiledTemplate:
+        """Compiled template for ``language``, falling back to the default language"""
+        language = language or self.default_language
+        key = (name, language)
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            return compiled
+
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is None:
+                source_key = key if key in self._sources else (name, self.default_language)
+                if source_key not in self._sources:
+                    raise KeyError(f"Unknown email template: {name}")
+                subject, html, text, context = self._sources[source_key]
+                compiled = CompiledTemplate(name, source_key[1], subject, html, text, context)
+                self._compiled[key] = compiled
+        return compiled
+
+    def render(self, name: str, params: Dict[str, Any], language: Optional[str] = None) -> RenderedEmail:
+        return self.get(name, language).render(params)
+
+    def __contains__(self, name: str) -> bool:
+        return any(n == name for n, _ in self._sources)
@@ -1,16 +1,21 @@
 """Big-5 Super Agent Orchestrator - Refactored"""
 
+import asyncio
 import json
+import threading
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
-from anthropic import Anthropic
-
 from ..config import get_config
 from ..logger import setup_logger
 from ..exceptions import OrchestratorError, SkillExecutionError
 from ..learning import ExperienceLearningPipeline, Experience, ExperienceType
+from .llm_client import create_async_client, create_message
+from .plan_cache import PlanCache
+from .plan_executor import PlanExecutor
+from .execution_stats import ExecutionHistory
+from .experience_queue import ExperienceQueue
 
 
 logger = setup_logger(__name__)
@@ -49,13 +54,33 @@ class Big5Orchestrator:
     Now includes autonomous learning through SEAL v2 + TabPFN-2.5.
     """
 
-    def __init__(self, api_key: Optional[str] = None, enable_learning: bool = True) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        enable_learning: bool = True,
+        plan_cache_size: int = 512,
+        plan_cache_ttl_seconds: float = 3600.0,
+        max_parallel_skills: int = 8,
+        skill_timeout_seconds: Optional[float] = 60.0,
+        history_capacity: int = 1000,
+        experience_queue_size: int = 10000,
+        experience_batch_size: int = 64,
+        experience_overflow_policy: str = "drop_oldest"
+    ) -> None:
         """
         Initialize the orchestrator
 
         Args:
             api_key: Anthropic API key
             enable_learning: Enable SEAL v2 learning capabilities
+            plan_cache_size: Max cached execution plans (0 disables the cache)
+            plan_cache_ttl_seconds: Lifetime of a cached execution plan
+            max_parallel_skills: Max skills of one plan running concurrently
+            skill_timeout_seconds: Default per-skill timeout (None = no limit)
+            history_capacity: Skill results kept in the execution history ring buffer
+            experience_queue_size: Max experiences waiting for the learning consumer
+            experience_batch_size: Experiences processed per learning micro-batch
+            experience_overflow_policy: "drop_oldest", "drop_newest" or "block"
         """
         config = get_config()
 
@@ -64,13 +89,28 @@ class Big5Orchestrator:
             raise OrchestratorError("ANTHROPIC_API_KEY is required")
 
         try:
-            self.client = Anthropic(api_key=self.api_key)
+            self.client = create_async_client(self.api_key)
         except Exception as e:
             logger.error(f"Failed to initialize Anthropic client: {e}")
             raise OrchestratorError(f"Client initialization failed: {e}")
 
         self.skills: Dict[str, Any] = {}
-        self.execution_history: List[SkillResult] = []
+        self.skills_version = 0  # Bumped on register_skill; part of the plan cache key
+        self.execution_history = ExecutionHistory(capacity=history_capacity)
+
+        # Repeated intents skip the LLM round-trip
+        self.plan_cache: Optional[PlanCache] = (
+            PlanCache(max_size=plan_cache_size, ttl_seconds=plan_cache_ttl_seconds)
+            if plan_cache_size > 0 else None
+        )
+
+        # Independent plan steps run concurrently along the dependency DAG
+        self.plan_executor = PlanExecutor(
+            execute_skill=self.execute_skill,
+            result_factory=SkillResult,
+            max_concurrency=max_parallel_skills,
+            skill_timeout_seconds=skill_timeout_seconds
+        )
 
         # SEAL v2 Learning Pipeline
         self.enable_learning = enable_learning
@@ -85,6 +125,16 @@ class Big5Orchestrator:
             self.learning_pipeline = None
             logger.info("Big5Orchestrator initialized (learning disabled)")
 
+        # Experiences are learned from in background micro-batches; the lock
+        # serialises the consumer thread with the learning read methods below
+        self._learning_lock = threading.Lock()
+        self.experience_queue: ExperienceQueue[Dict[str, Any]] = ExperienceQueue(
+            process_batch=self._process_experience_batch,
+            max_size=experience_queue_size,
+            batch_size=experience_batch_size,
+            overflow_policy=experience_overflow_policy
+        )
+
     def register_skill(self, skill_name: str, skill_handler: Any) -> None:
         """Register a skill handler"""
         if not hasattr(skill_handler, 'execute'):
@@ -93,6 +143,7 @@ class Big5Orchestrator:
             )
         
         self.skills[skill_name] = skill_handler
+        self.skills_version += 1
         logger.info(f"Registered skill: {skill_name}")
 
     def get_available_skills(self) -> List[str]:
@@ -103,9 +154,15 @@ class Big5Orchestrator:
         self,
         skill_name: str,
         params: Dict[str, Any],
-        context: AgentContext
+        context: AgentContext,
+        timeout: Optional[float] = None
     ) -> SkillResult:
-        """Execute a specific skill with error handling"""
+        """
+        Execute a specific skill with error handling
+
+        Args:
+            timeout: Seconds before the skill is cancelled and reported as failed
+        """
         start_time = datetime.now()
         
         logger.info(f"Executing skill: {skill_name} with params: {params}")
@@ -115,7 +172,18 @@ class Big5Orchestrator:
                 raise SkillExecutionError(f"Skill '{skill_name}' not found")
 
             skill_handler = self.skills[skill_name]
-            result_data = await skill_handler.execute(params, context)
+            deadline = asyncio.timeout(timeout)
+            try:
+                async with deadline:
+                    result_data = await skill_handler.execute(params, context)
+            except TimeoutError:
+                # Only our deadline is a timeout; a TimeoutError raised by
+                # the skill itself is reported as that skill's error
+                if timeout is None or not deadline.expired():
+                    raise
+                raise SkillExecutionError(
+                    f"Skill '{skill_name}' timed out after {timeout:g}s"
+                )
 
             execution_time = (datetime.now() - start_time).total_seconds()
 
@@ -129,9 +197,9 @@ class Big5Orchestrator:
 
             self.execution_history.append(result)
 
-            # SEAL v2: Record successful experience for learning
+            # SEAL v2: Queue successful experience for learning
             if self.enable_learning and self.learning_pipeline:
-                self._record_experience(
+                await self._queue_experience(
                     skill_name=skill_name,
                     params=params,
                     context=context,
@@ -162,9 +230,9 @@ class Big5Orchestrator:
 
             self.execution_history.append(result)
 
-            # SEAL v2: Record failure experience for learning
+            # SEAL v2: Queue failure experience for learning
             if self.enable_learning and self.learning_pipeline:
-                self._record_experience(
+                await self._queue_experience(
                     skill_name=skill_name,
                     params=params,
                     context=context,
@@ -175,14 +243,27 @@ class Big5Orchestrator:
 
             return result
 
-    def process_natural_language(
+    async def process_natural_language(
         self,
         user_input: str,
         context: AgentContext
     ) -> Dict[str, Any]:
-        """Process natural language and determine execution plan"""
+        """
+        Process natural language and determine execution plan
+
+        Uses the async client under the process-wide LLM concurrency limit,
+        so a slow LLM round-trip never blocks other requests on the loop.
+        """
         
         logger.info(f"Processing NL input: {user_input[:50]}...")
+
+        if self.plan_cache:
+            cached_plan = self.plan_cache.get(
+                user_input, context.language, self.skills_version, context.marina_id
+            )
+            if cached_plan is not None:
+                logger.info(f"Execution plan served from cache: {cached_plan.get('intent')}")
+                return cached_plan
         
         skills_desc = "\n".join([
             f"- {name}: {handler.description}"
@@ -205,17 +286,24 @@ Respond in JSON format:
     "intent": "brief description",
     "skills_to_execute": [
         {{
+            "id": "step1",
             "skill_name": "skill_name",
             "params": {{}},
-            "priority": 1
+            "priority": 1,
+            "depends_on": []
         }}
     ],
     "response_language": "tr" or "en"
 }}
+
+Steps listing "depends_on" wait only for those step ids ([] = start at
+once). Steps without "depends_on" wait for every step with a lower
+"priority" number; steps of equal priority run in parallel.
 """
 
         try:
-            message = self.client.messages.create(
+            message = await create_message(
+                self.client,
                 model="claude-sonnet-4-20250514",
                 max_tokens=2000,
                 system=system_prompt,
@@ -229,6 +317,12 @@ Respond in JSON format:
             execution_plan = json.loads(response_text)
             
             logger.info(f"Execution plan created: {execution_plan.get('intent')}")
+
+            if self.plan_cache and execution_plan.get("skills_to_execute"):
+                self.plan_cache.put(
+                    user_input, context.language, self.skills_version, execution_plan,
+                    marina_id=context.marina_id
+                )
             
             return execution_plan
             
@@ -240,6 +334,8 @@ Respond in JSON format:
                 "response_language": context.language,
                 "raw_response": response_text
             }
+        except OrchestratorError:
+            raise
         except Exception as e:
             logger.error(f"NL processing failed: {e}", exc_info=True)
             raise OrchestratorError(f"Failed to process request: {e}")
@@ -255,17 +351,13 @@ Respond in JSON format:
 
         try:
             # Understand intent
-            execution_plan = self.process_natural_language(user_input, context)
-
-            # Execute skills
-            results = []
-            for skill_spec in execution_plan.get("skills_to_execute", []):
-                result = await self.execute_skill(
-                    skill_name=skill_spec["skill_name"],
-                    params=skill_spec["params"],
-                    context=context
-                )
-                results.append(result)
+            execution_plan = await self.process_natural_language(user_input, context)
+
+            # Execute skills (independent steps concurrently)
+            results = await self.plan_executor.run(
+                execution_plan.get("skills_to_execute", []),
+                context
+            )
 
             # Aggregate response
             return {
@@ -281,17 +373,59 @@ Respond in JSON format:
 
     def get_execution_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent execution history"""
-        return [asdict(r) for r in self.execution_history[-limit:]]
+        return [asdict(r) for r in self.execution_history.recent(limit)]
+
+    def get_skill_stats(self, skill_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Per-skill latency/success aggregates (count, p50/p95/p99, ...)
+
+        Covers every execution since the last clear_history(), not just the
+        buffered results.
+        """
+        return self.execution_history.get_skill_stats(skill_name)
+
+    def get_plan_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Hit/miss/eviction counters of the execution-plan cache"""
+        return self.plan_cache.get_stats() if self.plan_cache else None
 
     def clear_history(self) -> None:
         """Clear execution history"""
-        self.execution_history = []
+        self.execution_history.clear()
         logger.info("Execution history cleared")
 
+    async def shutdown(self) -> None:
+        """Flush queued learning experiences and stop the background consumer"""
+        await self.experience_queue.close(flush=True)
+        logger.info(
+            f"Experience queue closed ({self.experience_queue.processed} processed, "
+            f"{self.experience_queue.dropped} dropped)"
+        )
+
     # ========================================================================
     # SEAL v2 Learning Methods
     # ========================================================================
 
+    async def _queue_experience(self, **record: Any) -> None:
+        """Hand a skill execution to the background learning consumer"""
+        await self.experience_queue.put(record)
+
+    def _process_experience_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Consumer side: build and learn from a micro-batch (worker thread)"""
+        with self._learning_lock:
+            for record in records:
+                try:
+                    self._record_experience(**record)
+                except Exception as e:
+                    logger.error(f"Failed to record experience for {record.get('skill_name')}: {e}")
+
+    async def flush_experiences(self) -> None:
+        """Wait until every queued experience has been learned from"""
+        await self.experience_queue.flush()
+
+    def get_experience_queue_stats(self) -> Dict[str, Any]:
+        """Queue depth and submitted/processed/dropped counters"""
+        return self.experience_queue.get_stats()
+
     def _record_experience(
         self,
         skill_name: str,
@@ -304,7 +438,7 @@ Respond in JSON format:
         """
         Record skill execution as learning experience
 
-        This is called automatically after each skill execution.
+        Runs on the experience queue's consumer after each skill execution.
         """
         # Map skill names to experience types
         experience_type_mapping = {
@@ -372,7 +506,8 @@ Respond in JSON format:
         if not self.enable_learning or not self.learning_pipeline:
             return None
 
-        return self.learning_pipeline.get_combined_statistics()
+        with self._learning_lock:
+            return self.learning_pipeline.get_combined_statistics()
 
     def get_learning_patterns(self, min_confidence: float = 0.7) -> List[Dict[str, Any]]:
         """
@@ -387,7 +522,8 @@ Respond in JSON format:
         if not self.enable_learning or not self.learning_pipeline or not self.learning_pipeline.seal:
             return []
 
-        patterns = self.learning_pipeline.seal.get_patterns(min_confidence=min_confidence)
+        with self._learning_lock:
+            patterns = self.learning_pipeline.seal.get_patterns(min_confidence=min_confidence)
 
         return [
             {
@@ -409,7 +545,8 @@ Respond in JSON format:
         if not self.enable_learning or not self.learning_pipeline or not self.learning_pipeline.seal:
             return []
 
-        pending = self.learning_pipeline.seal.get_pending_self_edits()
+        with self._learning_lock:
+            pending = self.learning_pipeline.seal.get_pending_self_edits()
 
         return [
             {
@@ -437,13 +574,14 @@ Respond in JSON format:
             return False
 
         # Find the self-edit
-        pending = self.learning_pipeline.seal.get_pending_self_edits()
-        for edit in pending:
-            if edit.edit_id == edit_id:
-                success = self.learning_pipeline.seal.apply_self_edit(edit)
-                if success:
-                    logger.info(f"Manually applied self-edit: {edit_id}")
-                return success
+        with self._learning_lock:
+            pending = self.learning_pipeline.seal.get_pending_self_edits()
+            for edit in pending:
+                if edit.edit_id == edit_id:
+                    success = self.learning_pipeline.seal.apply_self_edit(edit)
+                    if success:
+                        logger.info(f"Manually applied self-edit: {edit_id}")
+                    return success
 
         logger.warning(f"Self-edit not found: {edit_id}")
         return False
@@ -465,7 +603,8 @@ Respond in JSON format:
 
             # Add learning progress if available
             if self.enable_learning and self.learning_pipeline and self.learning_pipeline.seal:
-                skill_progress = self.learning_pipeline.seal.get_skill_progress(name)
+                with self._learning_lock:
+                    skill_progress = self.learning_pipeline.seal.get_skill_progress(name)
                 if skill_progress:
                     info["learning"] = {
                         "level": skill_progress.level,
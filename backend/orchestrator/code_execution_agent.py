@@ -12,10 +12,10 @@ from typing import Dict, Any, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "mcp-code-execution"))
 
 from runtime import CodeExecutionRuntime, ExecutionResult
-from anthropic import Anthropic
 
 from backend.config import get_config
 from backend.logger import get_logger
+from backend.orchestrator.llm_client import create_async_client, create_message
 
 
 logger = get_logger(__name__)
@@ -44,16 +44,19 @@ class CodeExecutionAgent:
 
         # Initialize Anthropic client
         app_config = get_config()
-        self.client = Anthropic(api_key=app_config.api.anthropic_api_key)
+        self.client = create_async_client(app_config.api.anthropic_api_key)
 
         self.model = "claude-sonnet-4-20250514"
 
         logger.info("Code execution agent initialized")
 
-    def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Execute task using code execution approach.
 
+        LLM calls are awaited under the process-wide concurrency limit and
+        timeout, so the event loop keeps serving other requests meanwhile.
+
         Args:
             task: Task definition with:
                 - query: User query/request
@@ -87,7 +90,8 @@ class CodeExecutionAgent:
             iterations += 1
 
             # Get code from Claude
-            response = self.client.messages.create(
+            response = await create_message(
+                self.client,
                 model=self.model,
                 max_tokens=4000,
                 system=system_prompt,
@@ -110,7 +114,7 @@ class CodeExecutionAgent:
             logger.info(f"Executing generated code (iteration {iterations})")
 
             # Execute code
-            exec_result = self.runtime.execute(
+            exec_result = await self.runtime.execute_async(
                 code,
                 context=context,
                 validate=True,
@@ -245,6 +249,7 @@ Write Python code to complete the user's request efficiently.
     def get_metrics(self) -> Dict[str, Any]:
         """Get execution metrics for current session"""
         history = self.runtime.get_execution_history()
+        runtime_metrics = self.runtime.get_metrics()
 
         return {
             "total_executions": len(history),
@@ -257,5 +262,7 @@ Write Python code to complete the user's request efficiently.
             ),
             "tools_used": list(set(
                 tool for r in history for tool in r.tools_used
-            ))
+            )),
+            "code_cache": runtime_metrics["code_cache"],
+            "sandbox_workers": runtime_metrics["workers"]
         }
@@ -0,0 +1,155 @@
+"""Bounded execution history and streaming per-skill latency statistics"""
+
+import math
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+
+class LatencySketch:
+    """
+    Streaming quantile sketch with bounded relative error
+
+    Values are counted in logarithmic buckets (bucket i covers
+    (gamma^(i-1), gamma^i]), so any quantile is reported within
+    ``relative_accuracy`` of the true value. Memory grows with the log of
+    the value range, not with the number of samples.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-6) -> None:
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.buckets: Dict[int, int] = {}
+        self.zero_count = 0  # Values below min_value
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value < self.min_value:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate q-quantile (0 <= q <= 1), None if empty"""
+        if self.count == 0:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Midpoint of the bucket in relative terms
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class SkillStats:
+    """O(1)-update aggregates for one skill"""
+
+    __slots__ = ("count", "successes", "total_time", "min_time", "max_time", "last_error", "sketch")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.successes = 0
+        self.total_time = 0.0
+        self.min_time = math.inf
+        self.max_time = 0.0
+        self.last_error: Optional[str] = None
+        self.sketch = LatencySketch()
+
+    def record(self, success: bool, execution_time: float, error: Optional[str] = None) -> None:
+        self.count += 1
+        if success:
+            self.successes += 1
+        else:
+            self.last_error = error
+        self.total_time += execution_time
+        self.min_time = min(self.min_time, execution_time)
+        self.max_time = max(self.max_time, execution_time)
+        self.sketch.add(execution_time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "successes": self.successes,
+            "failures": self.count - self.successes,
+            "success_rate": self.successes / self.count if self.count else 0.0,
+            "avg_seconds": self.total_time / self.count if self.count else 0.0,
+            "min_seconds": self.min_time if self.count else 0.0,
+            "max_seconds": self.max_time,
+            "p50_seconds": self.sketch.quantile(0.50),
+            "p95_seconds": self.sketch.quantile(0.95),
+            "p99_seconds": self.sketch.quantile(0.99),
+            "last_error": self.last_error,
+        }
+
+
+class ExecutionHistory:
+    """
+    Fixed-capacity ring buffer of SkillResults plus per-skill aggregates
+
+    The buffer keeps only the most recent ``capacity`` results; the
+    aggregates cover every execution since the last reset, so latency and
+    success rates can be read without scanning history.
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.capacity = capacity
+        self._buffer: Deque[Any] = deque(maxlen=capacity)
+        self._stats: Dict[str, SkillStats] = {}
+        self._total = SkillStats()
+
+    def append(self, result: Any) -> None:
+        """Record a SkillResult"""
+        self._buffer.append(result)
+        stats = self._stats.get(result.skill_name)
+        if stats is None:
+            stats = self._stats[result.skill_name] = SkillStats()
+        stats.record(result.success, result.execution_time, result.error)
+        self._total.record(result.success, result.execution_time, result.error)
+
+    def recent(self, limit: int = 10) -> List[Any]:
+        """
+        Most recent results, oldest first (copies at most ``limit`` items)
+
+        ``limit <= 0`` keeps the ``history[-limit:]`` slice semantics the
+        plain list had, so ``recent(0)`` returns every buffered result.
+        """
+        if limit <= 0:
+            return list(self._buffer)[-limit:]
+        newest_first = list(islice(reversed(self._buffer), limit))
+        newest_first.reverse()
+        return newest_first
+
+    def clear(self) -> None:
+        """Drop buffered results and aggregates"""
+        self._buffer.clear()
+        self._stats.clear()
+        self._total = SkillStats()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._buffer)
+
+    def get_skill_stats(self, skill_name: Optional[str] = None) -> Dict[str, Any]:
+        """Aggregates for one skill, or for all skills plus a total"""
+        if skill_name is not None:
+            stats = self._stats.get(skill_name)
+            return stats.to_dict() if stats else SkillStats().to_dict()
+
+        return {
+            "total": self._total.to_dict(),
+            "skills": {name: stats.to_dict() for name, stats in self._stats.items()},
+            "buffered": len(self._buffer),
+            "capacity": self.capacity,
+        }
@@ -0,0 +1,204 @@
+"""Bounded async queue that moves learning work off the request path"""
+
+import asyncio
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+from ..logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+
+class ExperienceQueue(Generic[T]):
+    """
+    Bounded queue drained by one background consumer in micro-batches
+
+    ``put`` returns as soon as the item is queued; the consumer collects up
+    to ``batch_size`` items (waiting at most ``max_batch_delay`` seconds
+    for stragglers) and hands them to ``process_batch`` in a worker thread,
+    so CPU-bound learning never runs on the event loop.
+
+    When the queue is full, ``overflow_policy`` decides:
+
+    - ``drop_oldest``: discard the oldest queued item (default - keeps the
+      freshest experiences)
+    - ``drop_newest``: discard the incoming item
+    - ``block``: wait up to ``put_timeout`` seconds for space (back-pressure),
+      then drop the incoming item
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], Any],
+        max_size: int = 10000,
+        batch_size: int = 64,
+        max_batch_delay: float = 0.05,
+        overflow_policy: str = "drop_oldest",
+        put_timeout: Optional[float] = 1.0
+    ) -> None:
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow_policy must be one of {', '.join(OVERFLOW_POLICIES)}"
+            )
+        self.process_batch = process_batch
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.max_batch_delay = max_batch_delay
+        self.overflow_policy = overflow_policy
+        self.put_timeout = put_timeout
+
+        self._queue: Optional["asyncio.Queue[T]"] = None
+        self._consumer: Optional["asyncio.Task[None]"] = None
+        self._closed = False
+
+        self.submitted = 0
+        self.processed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    def _ensure_started(self) -> "asyncio.Queue[T]":
+        """Create the queue and consumer on the running loop"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+        if self._consumer is None or self._consumer.done():
+            self._consumer = asyncio.ensure_future(self._consume())
+        return self._queue
+
+    async def put(self, item: T) -> bool:
+        """
+        Queue an item for background processing
+
+        Returns:
+            False if the incoming item was dropped
+        """
+        self.submitted += 1
+        if self._closed:
+            self.dropped += 1
+            return False
+
+        queue = self._ensure_started()
+
+        if self.overflow_policy == "block":
+            try:
+                await asyncio.wait_for(queue.put(item), timeout=self.put_timeout)
+                return True
+            except asyncio.TimeoutError:
+                self._drop("queue full after back-pressure timeout")
+                return False
+
+        try:
+            queue.put_nowait(item)
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        if self.overflow_policy == "drop_newest":
+            self._drop("queue full")
+            return False
+
+        # drop_oldest
+        queue.get_nowait()
+        queue.task_done()
+        queue.put_nowait(item)
+        self._drop("queue full, oldest experience discarded")
+        return True
+
+    def _drop(self, reason: str) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            logger.warning(f"Experience dropped ({reason}); {self.dropped} dropped so far")
+
+    async def _consume(self) -> None:
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.max_batch_delay
+            try:
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+                        except asyncio.TimeoutError:
+                            break
+            except asyncio.CancelledError:
+                # Closed without flushing while collecting: the batch is discarded
+                self.dropped += len(batch)
+                for _ in batch:
+                    queue.task_done()
+                raise
+
+            work = asyncio.ensure_future(self._process(queue, batch))
+            try:
+                await asyncio.shield(work)
+            except asyncio.CancelledError:
+                # The batch is already in a worker thread: let it finish and be counted
+                await work
+                raise
+
+    async def _process(self, queue: "asyncio.Queue[T]", batch: List[T]) -> None:
+        try:
+            await asyncio.to_thread(self.process_batch, batch)
+            self.processed += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            logger.error(f"Experience batch of {len(batch)} failed: {e}", exc_info=True)
+        finally:
+            self.batches += 1
+            for _ in batch:
+                queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued item has been processed"""
+        if self._queue is not None:
+            if self._consumer is None or self._consumer.done():
+                self._ensure_started()
+            await self._queue.join()
+
+    async def close(self, flush: bool = True) -> None:
+        """
+        Stop accepting items and stop the consumer
+
+        Args:
+            flush: Process queued items first (otherwise they are discarded;
+                a batch already being processed still completes)
+        """
+        self._closed = True
+        if flush:
+            await self.flush()
+        if self._consumer is not None:
+            self._consumer.cancel()
+            try:
+                await self._consumer
+            except asyncio.CancelledError:
+                pass
+            self._consumer = None
+
+        if self._queue is not None and not flush:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                self._queue.task_done()
+                self.dropped += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "max_size": self.max_size,
+            "batch_size": self.batch_size,
+            "overflow_policy": self.overflow_policy,
+            "submitted": self.submitted,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
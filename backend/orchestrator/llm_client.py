@@ -0,0 +1,62 @@
+"""Shared async LLM access - bounded concurrency and timeouts per process"""
+
+import asyncio
+import weakref
+from typing import Any, Optional
+
+from anthropic import AsyncAnthropic
+
+from ..config import get_config
+from ..logger import setup_logger
+from ..exceptions import OrchestratorError
+
+
+logger = setup_logger(__name__)
+
+# One limiter for every agent on the event loop (created lazily); a
+# semaphore cannot be shared across loops, so each loop gets its own
+_llm_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def create_async_client(api_key: str) -> AsyncAnthropic:
+    """Create an async Anthropic client using the configured timeout"""
+    config = get_config()
+    return AsyncAnthropic(api_key=api_key, timeout=config.api.llm_timeout_seconds)
+
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Limiter for in-flight LLM requests on the running event loop"""
+    loop = asyncio.get_running_loop()
+    semaphore = _llm_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _llm_semaphores[loop] = asyncio.Semaphore(get_config().api.llm_max_concurrency)
+    return semaphore
+
+
+async def create_message(
+    client: AsyncAnthropic,
+    timeout: Optional[float] = None,
+    **kwargs: Any
+) -> Any:
+    """
+    Call ``client.messages.create`` without blocking the event loop
+
+    Waits for a slot under the per-process concurrency limit, then awaits
+    the request with an overall timeout (queueing time included).
+
+    Raises:
+        OrchestratorError: If the request times out
+    """
+    timeout = timeout if timeout is not None else get_config().api.llm_timeout_seconds
+
+    async def _call() -> Any:
+        async with get_llm_semaphore():
+            return await client.messages.create(**kwargs)
+
+    try:
+        return await asyncio.wait_for(_call(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.error(f"LLM request timed out after {timeout:g}s")
+        raise OrchestratorError(f"LLM request timed out after {timeout:g}s")
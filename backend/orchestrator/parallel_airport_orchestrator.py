@@ -373,18 +373,12 @@ class ParallelAirportOrchestrator(Big5Orchestrator):
 
     def get_orchestrator_stats(self) -> Dict[str, Any]:
         """Get orchestrator statistics"""
-        total_executions = len(self.execution_history)
-        successful = sum(1 for r in self.execution_history if r.success)
-        failed = total_executions - successful
-
-        if total_executions > 0:
-            avg_execution_time = sum(
-                r.execution_time for r in self.execution_history
-            ) / total_executions
-            success_rate = (successful / total_executions) * 100
-        else:
-            avg_execution_time = 0
-            success_rate = 0
+        totals = self.execution_history.get_skill_stats()["total"]
+        total_executions = totals["count"]
+        successful = totals["successes"]
+        failed = totals["failures"]
+        avg_execution_time = totals["avg_seconds"]
+        success_rate = totals["success_rate"] * 100
 
         return {
             "total_executions": total_executions,
@@ -0,0 +1,108 @@
+"""Execution-plan cache for natural-language requests"""
+
+import copy
+import hashlib
+import re
+import unicodedata
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from ..utils.lru_cache import TTLCache
+
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s.!?,;:]+$")
+# Turkish dotted/dotless i: "KALAMIŞ".casefold() gives "kalamiş", and
+# "İ".casefold() gives "i" + combining dot, so fold both onto plain "i"
+_TURKISH_I = str.maketrans({"ı": "i", "\u0307": None})
+# Requests whose plan (dates in the params) depends on the current day;
+# matched against normalised text, so Turkish "ı" is already "i"
+_DATE_RELATIVE = re.compile(
+    r"\b(today|tonight|tomorrow|yesterday|now|currently"
+    r"|this (morning|afternoon|evening|week|weekend|month)"
+    r"|(next|last) (week|weekend|month)"
+    r"|monday|tuesday|wednesday|thursday|friday|saturday|sunday"
+    r"|bugün\w*|yarin\w*|dün(kü|den|e)?\b|şimdi\w*|şu an\w*"
+    r"|bu (sabah|akşam|gece|hafta|ay)\w*|haftaya|(gelecek|geçen) (hafta|ay)\w*"
+    r"|pazartesi|sali|çarşamba|perşembe|cuma\w*|pazar\b)"
+)
+
+
+def normalize_request(user_input: str) -> str:
+    """
+    Normalise a user request for cache lookup
+
+    Case, Unicode form, repeated whitespace and trailing punctuation do not
+    change the intent ("Show today's arrivals at Kalamış!" and
+    "show today's arrivals at kalamış" share a plan).
+    """
+    text = unicodedata.normalize("NFKC", user_input).casefold().translate(_TURKISH_I)
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+class PlanCache:
+    """
+    LRU + TTL cache of LLM execution plans
+
+    Keys combine the normalised request, the response language, the
+    marina the request is about and the skill-registry version, so
+    registering a skill invalidates every plan built against the old
+    skill list. Plans for date-relative requests ("today's arrivals",
+    "yarın") expire at midnight at the latest, since the dates in their
+    params are only right for the day they were planned.
+    """
+
+    def __init__(self, max_size: int = 512, ttl_seconds: float = 3600.0) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._cache: TTLCache[Dict[str, Any]] = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def make_key(
+        user_input: str,
+        language: str,
+        registry_version: int,
+        marina_id: Optional[str] = None
+    ) -> str:
+        raw = f"{registry_version}\x1f{language}\x1f{marina_id or ''}\x1f{normalize_request(user_input)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def entry_ttl(self, user_input: str, now: Optional[datetime] = None) -> float:
+        """TTL for a plan: the cache TTL, capped at midnight for date-relative requests"""
+        if not _DATE_RELATIVE.search(normalize_request(user_input)):
+            return self.ttl_seconds
+        now = now or datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return min(self.ttl_seconds, (midnight - now).total_seconds())
+
+    def get(
+        self,
+        user_input: str,
+        language: str,
+        registry_version: int,
+        marina_id: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached plan, or None"""
+        plan = self._cache.get(self.make_key(user_input, language, registry_version, marina_id))
+        return copy.deepcopy(plan) if plan is not None else None
+
+    def put(
+        self,
+        user_input: str,
+        language: str,
+        registry_version: int,
+        plan: Dict[str, Any],
+        marina_id: Optional[str] = None
+    ) -> None:
+        """Cache a plan (stored as a copy so callers may mutate theirs)"""
+        self._cache.set(
+            self.make_key(user_input, language, registry_version, marina_id),
+            copy.deepcopy(plan),
+            ttl_seconds=self.entry_ttl(user_input)
+        )
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return self._cache.get_stats()
@@ -0,0 +1,222 @@
+"""Dependency-aware parallel executor for multi-skill execution plans"""
+
+import asyncio
+import math
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from ..logger import setup_logger
+from ..exceptions import OrchestratorError
+
+
+logger = setup_logger(__name__)
+
+
+class PlanExecutor:
+    """
+    Run the ``skills_to_execute`` steps of an execution plan as a DAG
+
+    Each step may declare ``id`` and ``depends_on`` (step ids, skill names
+    or 0-based step indices). A step without ``depends_on`` waits for every
+    step of a lower ``priority`` (lower runs first), so priority tiers run
+    in order while steps of one tier run concurrently; ``depends_on``
+    replaces that implicit ordering with explicit edges. A step whose
+    dependency failed is skipped, and a step without ``skill_name`` fails.
+    End-to-end latency is therefore the critical path of the plan rather
+    than the sum of all steps.
+    """
+
+    def __init__(
+        self,
+        execute_skill: Callable[..., Awaitable[Any]],
+        result_factory: Callable[..., Any],
+        max_concurrency: int = 8,
+        skill_timeout_seconds: Optional[float] = 60.0
+    ) -> None:
+        """
+        Args:
+            execute_skill: ``async (skill_name, params, context, timeout) -> SkillResult``
+            result_factory: Builds a SkillResult for skipped steps
+            max_concurrency: Max skills running at the same time per plan
+            skill_timeout_seconds: Default per-skill timeout (a positive step
+                ``timeout`` overrides it)
+        """
+        self.execute_skill = execute_skill
+        self.result_factory = result_factory
+        self.max_concurrency = max_concurrency
+        self.skill_timeout_seconds = skill_timeout_seconds
+
+    @staticmethod
+    def _step_id(step: Dict[str, Any], index: int) -> str:
+        return str(step.get("id", index))
+
+    @staticmethod
+    def _priority(step: Dict[str, Any]) -> int:
+        """Step priority as an int (plans come from the LLM; malformed = 1)"""
+        try:
+            return int(step.get("priority", 1))
+        except (TypeError, ValueError, OverflowError):
+            return 1
+
+    def _timeout(self, step: Dict[str, Any]) -> Optional[float]:
+        """Step timeout if it is a positive number of seconds, else the default"""
+        value = step.get("timeout")
+        if value is None:
+            return self.skill_timeout_seconds
+        try:
+            seconds = float(value)
+        except (TypeError, ValueError):
+            seconds = math.nan
+        if isinstance(value, bool) or not math.isfinite(seconds) or seconds <= 0:
+            logger.warning(f"Ignoring invalid timeout {value!r} of step {step.get('id')}")
+            return self.skill_timeout_seconds
+        return seconds
+
+    def build_graph(self, steps: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Resolve ``depends_on`` (or, without it, the priority tiers) into step indices
+
+        Returns:
+            dependencies[i] = indices step i waits for
+
+        Raises:
+            OrchestratorError: On unknown references or dependency cycles
+        """
+        by_id = {self._step_id(step, i): i for i, step in enumerate(steps)}
+        by_skill: Dict[str, List[int]] = {}
+        for i, step in enumerate(steps):
+            by_skill.setdefault(step.get("skill_name"), []).append(i)
+
+        dependencies: List[List[int]] = []
+        implicit: List[int] = []
+        for i, step in enumerate(steps):
+            if step.get("depends_on") is None:
+                dependencies.append([])
+                implicit.append(i)
+                continue
+
+            deps = step["depends_on"]
+            if not isinstance(deps, list):
+                deps = [deps]
+
+            resolved = []
+            for ref in deps:
+                if isinstance(ref, int) and 0 <= ref < len(steps):
+                    resolved.append(ref)
+                elif str(ref) in by_id:
+                    resolved.append(by_id[str(ref)])
+                elif ref in by_skill:
+                    resolved.extend(by_skill[ref])
+                else:
+                    raise OrchestratorError(
+                        f"Step {self._step_id(step, i)} depends on unknown step '{ref}'"
+                    )
+            dependencies.append(sorted(set(d for d in resolved if d != i)))
+
+        self._check_acyclic(dependencies)
+
+        # Steps without depends_on wait for every lower priority tier, except
+        # steps that (explicitly) wait for them, which would form a cycle
+        for i in sorted(implicit, key=lambda i: self._priority(steps[i])):
+            dependencies[i] = [
+                d for d in range(len(steps))
+                if self._priority(steps[d]) < self._priority(steps[i])
+                and not self._reaches(dependencies, d, i)
+            ]
+        return dependencies
+
+    @staticmethod
+    def _reaches(dependencies: List[List[int]], start: int, target: int) -> bool:
+        """Whether ``start`` (transitively) depends on ``target``"""
+        stack, seen = [start], {start}
+        while stack:
+            node = stack.pop()
+            if node == target:
+                return True
+            for dep in dependencies[node]:
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        return False
+
+    @staticmethod
+    def _check_acyclic(dependencies: List[List[int]]) -> None:
+        """Kahn's algorithm - every node must be reachable in topological order"""
+        indegree = [len(deps) for deps in dependencies]
+        dependents: List[List[int]] = [[] for _ in dependencies]
+        for i, deps in enumerate(dependencies):
+            for d in deps:
+                dependents[d].append(i)
+
+        ready = [i for i, n in enumerate(indegree) if n == 0]
+        visited = 0
+        while ready:
+            node = ready.pop()
+            visited += 1
+            for nxt in dependents[node]:
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0:
+                    ready.append(nxt)
+
+        if visited != len(dependencies):
+            raise OrchestratorError("Execution plan has a dependency cycle")
+
+    async def run(self, steps: List[Dict[str, Any]], context: Any) -> List[Any]:
+        """
+        Execute all steps and return their results in plan order
+
+        Cancelling the caller cancels every pending step.
+        """
+        if not steps:
+            return []
+
+        dependencies = self.build_graph(steps)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks: Dict[int, "asyncio.Task[Any]"] = {}
+
+        def failed(skill_name: str, error: str) -> Any:
+            return self.result_factory(
+                skill_name=skill_name,
+                success=False,
+                data=None,
+                execution_time=0.0,
+                timestamp=datetime.now().isoformat(),
+                error=error
+            )
+
+        async def run_step(index: int) -> Any:
+            step = steps[index]
+            skill_name = step.get("skill_name")
+
+            for dep in dependencies[index]:
+                dep_result = await tasks[dep]
+                if not dep_result.success:
+                    dep_id = self._step_id(steps[dep], dep)
+                    logger.warning(f"Skipping step {self._step_id(step, index)}: dependency {dep_id} failed")
+                    return failed(skill_name or "", f"Skipped: dependency '{dep_id}' failed")
+
+            if not skill_name:
+                logger.warning(f"Step {self._step_id(step, index)} has no skill_name")
+                return failed("", f"Step '{self._step_id(step, index)}' has no skill_name")
+
+            async with semaphore:
+                return await self.execute_skill(
+                    skill_name=skill_name,
+                    params=step.get("params", {}),
+                    context=context,
+                    timeout=self._timeout(step)
+                )
+
+        # Launch in priority order so the semaphore favours urgent steps
+        order = sorted(range(len(steps)), key=lambda i: (self._priority(steps[i]), i))
+        for index in order:
+            tasks[index] = asyncio.ensure_future(run_step(index))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        return [tasks[i].result() for i in range(len(steps))]
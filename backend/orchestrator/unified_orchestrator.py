@@ -426,7 +426,7 @@ class UnifiedMarinaOrchestrator:
         logger.info(f"Processing NL request: {user_input[:50]}...")
 
         # Use Big-5 to analyze the request
-        execution_plan = self.big5.process_natural_language(user_input, context)
+        execution_plan = await self.big5.process_natural_language(user_input, context)
 
         # Determine if this is compliance-related
         compliance_keywords = [
@@ -17,8 +17,6 @@ from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from anthropic import Anthropic
-
 from ..config import get_config
 from ..logger import setup_logger
 from ..exceptions import OrchestratorError, SkillExecutionError
@@ -93,12 +91,6 @@ class VerifyAgent:
         if not self.api_key:
             raise OrchestratorError("ANTHROPIC_API_KEY is required")
 
-        try:
-            self.client = Anthropic(api_key=self.api_key)
-        except Exception as e:
-            logger.error(f"Failed to initialize Anthropic client: {e}")
-            raise OrchestratorError(f"Client initialization failed: {e}")
-
         # Load compliance rules
         self.compliance_rules = self._load_compliance_rules()
 
@@ -6,13 +6,27 @@ Complete transparency and accountability for all data transfers
 import time
 import hashlib
 import json
-from typing import Optional, Dict, Any, List
+import logging
+import queue
+import threading
+import weakref
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import sqlite3
 from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
+# PRAGMA synchronous per durability mode (the write-ahead log is always on)
+DURABILITY_MODES = {
+    "full": "FULL",  # fsync every commit; log_* returns once its entry is committed
+    "normal": "NORMAL",  # WAL default; log_* returns once the entry is queued
+    "off": "OFF",  # No fsync - tests and benchmarks only
+}
+
+
 class AuditEventType(Enum):
     """Types of privacy events to audit"""
 
@@ -101,17 +115,199 @@ class AuditEntry:
             )
 
 
+class AuditWriteError(sqlite3.DatabaseError):
+    """Audit entries the background writer could not store"""
+
+    def __init__(self, failures: List[Tuple[str, str]]):
+        self.failures = failures  # (entry_id, error)
+        ids = ", ".join(entry_id for entry_id, _ in failures[:5])
+        more = f" and {len(failures) - 5} more" if len(failures) > 5 else ""
+        super().__init__(f"Audit entries not stored: {ids}{more} ({failures[0][1]})")
+
+
+class _Pending:
+    """Commit signal for a queued item someone waits on ("full" log_* or flush)"""
+
+    __slots__ = ("event", "failures")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.failures: List[Tuple[str, str]] = []
+
+
+class _GroupCommitWriter:
+    """
+    Background thread owning the write connection; commits queued rows in groups
+
+    Kept apart from AuditLog so the thread holds no reference to the log:
+    a dropped AuditLog can be collected, and its finalizer still commits
+    whatever was queued.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, flush_interval: float, flush_size: int):
+        self.conn = conn
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.lock = threading.Lock()  # Guards the connection
+        self.queue: "queue.Queue[Any]" = queue.Queue()
+        self.enqueue_lock = threading.Lock()  # Orders enqueues against close()
+        self.closed = False
+        self.stats = {"entries_written": 0, "commits": 0, "failed_writes": 0}
+        self._failures: List[Tuple[str, str]] = []  # Failed rows nobody waited on
+        self._failures_lock = threading.Lock()
+
+        self.thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self.thread.start()
+
+    def put(self, row: Optional[tuple], pending: Optional[_Pending]):
+        """Hand an item to the writer; nothing can be queued behind close()'s sentinel"""
+        with self.enqueue_lock:
+            if self.closed:
+                raise RuntimeError("AuditLog is closed")
+            if not self.thread.is_alive():
+                raise RuntimeError("AuditLog writer thread is not running")
+            self.queue.put((row, pending))
+
+    def take_failures(self) -> List[Tuple[str, str]]:
+        """Failed rows not yet reported to a caller (clears them)"""
+        with self._failures_lock:
+            failures, self._failures = self._failures, []
+        return failures
+
+    def _run(self):
+        """Drain the queue, committing up to flush_size entries per transaction"""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+
+            batch = [item]
+            # Someone is waiting (durability="full" or flush): commit what is
+            # already queued right away; otherwise linger to grow the group
+            urgent = item[1] is not None
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.flush_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if urgent or remaining <= 0:
+                        item = self.queue.get_nowait()
+                    else:
+                        item = self.queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                urgent = urgent or item[1] is not None
+
+            self._commit_batch(batch)
+            if stop:
+                return
+
+    def _commit_batch(self, batch: List[Tuple[Optional[tuple], Optional[_Pending]]]):
+        entries = [(row, pending) for row, pending in batch if row is not None]
+        failed: Dict[int, str] = {}
+        try:
+            with self.lock:
+                if entries:
+                    failed = self._insert_rows([row for row, _ in entries])
+        except Exception as e:
+            failed = {i: f"{type(e).__name__}: {e}" for i in range(len(entries))}
+            raise
+        finally:
+            # Failures go to whoever waits for the row, else to the next caller
+            unreported = []
+            for i, error in failed.items():
+                row, pending = entries[i]
+                (pending.failures if pending is not None else unreported).append((row[0], error))
+            if unreported:
+                with self._failures_lock:
+                    self._failures.extend(unreported)
+            for _, pending in batch:
+                if pending is not None:
+                    pending.event.set()
+
+    def _insert_rows(self, rows: List[tuple]) -> Dict[int, str]:
+        """Insert rows; returns {index in rows: error} for rows not stored"""
+        sql = "INSERT INTO audit_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        try:
+            with self.conn:
+                self.conn.executemany(sql, rows)
+            self.stats["entries_written"] += len(rows)
+            self.stats["commits"] += 1
+            return {}
+        except sqlite3.Error as e:
+            logger.warning(f"Audit batch of {len(rows)} failed ({e}), retrying row by row")
+
+        # One bad row (e.g. duplicate entry_id) must not cost the whole group
+        failed: Dict[int, str] = {}
+        for i, row in enumerate(rows):
+            try:
+                with self.conn:
+                    self.conn.execute(sql, row)
+                self.stats["entries_written"] += 1
+                self.stats["commits"] += 1
+            except sqlite3.Error as e:
+                self.stats["failed_writes"] += 1
+                failed[i] = f"{type(e).__name__}: {e}"
+                logger.error(f"Audit entry {row[0]} not stored: {e}")
+        return failed
+
+    def close(self):
+        """Commit what is queued, stop the thread and close the connection"""
+        with self.enqueue_lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.queue.put(None)
+        self.thread.join()
+
+        with self.lock:
+            self.conn.close()
+
+
 class AuditLog:
     """
     Privacy audit logging system
     Maintains tamper-proof log of all data sharing activities
+
+    Writes go through a single background writer that owns one long-lived
+    WAL connection and commits queued entries in groups (up to
+    ``flush_size`` entries or ``flush_interval`` seconds per transaction),
+    so a burst of audit events costs one fsync instead of one per event.
+    Readers use one connection per thread; queries flush pending writes
+    first, so an entry is always visible once ``log_*`` has returned.
+
+    In "full" mode a failed insert raises AuditWriteError from its
+    ``log_*`` call. Otherwise ``log_*`` returns before the commit, and a
+    failure is raised as AuditWriteError by the next ``log_*`` or
+    ``flush`` call.
     """
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        durability: str = "normal",
+        flush_interval: float = 0.01,
+        flush_size: int = 256,
+        commit_timeout: float = 30.0,
+    ):
         """
         Initialize audit log
         Stores in local encrypted database
+
+        Args:
+            db_path: Database file (default ~/.ada_sea/audit_log.db)
+            durability: "full", "normal" or "off" (see DURABILITY_MODES)
+            flush_interval: Longest time an entry waits for others to share its commit
+            flush_size: Most entries committed in one transaction
+            commit_timeout: Longest wait for a commit in "full" mode or ``flush``
         """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"durability must be one of {', '.join(DURABILITY_MODES)}")
+
         if db_path is None:
             db_path = str(Path.home() / ".ada_sea" / "audit_log.db")
 
@@ -119,12 +315,48 @@ class AuditLog:
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
         self.db_path = db_path
+        self.durability = durability
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self.commit_timeout = commit_timeout
+
+        self._conn = self._connect()
         self._init_database()
 
+        self._readers = threading.local()
+        self._reader_conns: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        self._group = _GroupCommitWriter(self._conn, flush_interval, flush_size)
+        self._write_lock = self._group.lock  # Guards the writer connection
+        self._queue = self._group.queue
+        self._writer = self._group.thread
+        self.stats = self._group.stats
+
+        # Runs on close(), when the log is collected, or at interpreter exit
+        self._finalizer = weakref.finalize(
+            self, AuditLog._release, self._group, self._reader_conns, self._readers_lock
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={DURABILITY_MODES[self.durability]}")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        """Per-thread read connection (WAL readers never block the writer)"""
+        conn = getattr(self._readers, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._readers.conn = conn
+            with self._readers_lock:
+                self._reader_conns.append(conn)
+        return conn
+
     def _init_database(self):
         """Initialize SQLite database for audit log"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._conn.cursor()
 
         cursor.execute(
             """
@@ -164,8 +396,7 @@ class AuditLog:
         """
         )
 
-        conn.commit()
-        conn.close()
+        self._conn.commit()
 
     def log_transfer(
         self,
@@ -249,31 +480,85 @@ class AuditLog:
         return entry
 
     def _store_entry(self, entry: AuditEntry):
-        """Store entry in database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            INSERT INTO audit_entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                entry.entry_id,
-                entry.event_type.value,
-                entry.timestamp,
-                entry.destination,
-                entry.data_type,
-                entry.captain_id,
-                entry.authorization_method,
-                entry.result,
-                entry.data_hash,
-                json.dumps(entry.data_summary) if entry.data_summary else None,
-                entry.confirmation_text,
-            ),
+        """Queue entry for the group-commit writer"""
+        row = (
+            entry.entry_id,
+            entry.event_type.value,
+            entry.timestamp,
+            entry.destination,
+            entry.data_type,
+            entry.captain_id,
+            entry.authorization_method,
+            entry.result,
+            entry.data_hash,
+            json.dumps(entry.data_summary) if entry.data_summary else None,
+            entry.confirmation_text,
         )
 
-        conn.commit()
-        conn.close()
+        # Earlier entries that failed after their log_* returned
+        self._raise_write_failures()
+
+        if self.durability == "full":
+            pending = _Pending()
+            self._group.put(row, pending)
+            self._wait_committed(pending, f"Audit entry {entry.entry_id}")
+            if pending.failures:
+                raise AuditWriteError(pending.failures)
+        else:
+            self._group.put(row, None)
+
+    def _raise_write_failures(self):
+        failures = self._group.take_failures()
+        if failures:
+            raise AuditWriteError(failures)
+
+    def _wait_committed(self, pending: _Pending, what: str):
+        """Wait for the writer to commit ``pending``, failing fast if it dies"""
+        deadline = time.monotonic() + self.commit_timeout
+        while not pending.event.wait(min(0.1, max(0.0, deadline - time.monotonic()))):
+            if not self._writer.is_alive():
+                raise RuntimeError(f"{what} not committed: writer thread stopped")
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{what} not committed within {self.commit_timeout:g}s")
+
+    def _drain(self):
+        """Block until every entry queued so far is committed"""
+        pending = _Pending()
+        with self._group.enqueue_lock:
+            if self._group.closed or not self._writer.is_alive():
+                return
+            self._queue.put((None, pending))
+        self._wait_committed(pending, "Flush")
+
+    def flush(self):
+        """
+        Block until every entry queued so far is committed
+
+        Raises:
+            AuditWriteError: If entries logged since the last check were not stored
+        """
+        self._drain()
+        self._raise_write_failures()
+
+    def close(self):
+        """Commit pending entries and close all connections"""
+        self._finalizer()
+
+    @staticmethod
+    def _release(
+        group: _GroupCommitWriter, reader_conns: List[sqlite3.Connection], readers_lock: threading.Lock
+    ):
+        group.close()
+        with readers_lock:
+            for conn in reader_conns:
+                conn.close()
+            reader_conns.clear()
+
+    def __enter__(self) -> "AuditLog":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def query(
         self,
@@ -286,9 +571,7 @@ class AuditLog:
         """
         Query audit log with filters
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
+        self._drain()
         cutoff_time = time.time() - (hours * 3600)
 
         query = "SELECT * FROM audit_entries WHERE timestamp >= ?"
@@ -309,30 +592,34 @@ class AuditLog:
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
-
-        entries = []
-        for row in rows:
-            data_summary = json.loads(row[9]) if row[9] else None
-
-            entry = AuditEntry(
-                entry_id=row[0],
-                event_type=AuditEventType(row[1]),
-                timestamp=row[2],
-                destination=row[3],
-                data_type=row[4],
-                captain_id=row[5],
-                authorization_method=row[6],
-                result=row[7],
-                data_hash=row[8],
-                data_summary=data_summary,
-                confirmation_text=row[10],
-            )
-            entries.append(entry)
+        rows = self._reader().execute(query, params).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    @staticmethod
+    def _row_to_entry(row: tuple) -> AuditEntry:
+        return AuditEntry(
+            entry_id=row[0],
+            event_type=AuditEventType(row[1]),
+            timestamp=row[2],
+            destination=row[3],
+            data_type=row[4],
+            captain_id=row[5],
+            authorization_method=row[6],
+            result=row[7],
+            data_hash=row[8],
+            data_summary=json.loads(row[9]) if row[9] else None,
+            confirmation_text=row[10],
+        )
 
-        return entries
+    def get_entry(self, entry_id: str) -> Optional[AuditEntry]:
+        """
+        Look up a single entry by ID
+        """
+        self._drain()
+        row = self._reader().execute(
+            "SELECT * FROM audit_entries WHERE entry_id = ?", (entry_id,)
+        ).fetchone()
+        return self._row_to_entry(row) if row else None
 
     def get_summary(self, captain_id: str, hours: int = 168) -> Dict[str, Any]:
         """
@@ -393,8 +680,7 @@ class AuditLog:
         """
         Verify data integrity using stored hash
         """
-        entries = self.query(limit=10000)
-        entry = next((e for e in entries if e.entry_id == entry_id), None)
+        entry = self.get_entry(entry_id)
 
         if not entry:
             return False
@@ -409,15 +695,10 @@ class AuditLog:
         Delete entries older than specified days
         Returns number of entries deleted
         """
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
+        self._drain()
         cutoff_time = time.time() - (days * 24 * 3600)
 
-        cursor.execute("DELETE FROM audit_entries WHERE timestamp < ?", (cutoff_time,))
-
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
+        with self._write_lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM audit_entries WHERE timestamp < ?", (cutoff_time,))
 
-        return deleted
+        return cursor.rowcount
@@ -1,40 +1,22 @@
 """Email Service for Booking Notifications"""
 
-from typing import Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
-
-@dataclass
-class EmailTemplate:
-    subject: str
-    body: str
-    recipient: str
-    sender: str = "noreply@seturmarinas.com"
+from ..notifications.templates import TemplateEngine
 
 
-class EmailService:
-    """Email service for booking confirmations (POC - Mock mode)"""
-
-    def __init__(self, mock_mode: bool = True):
-        self.mock_mode = mock_mode
-        self.sent_emails = []
+BOOKING_CONFIRMATION_SUBJECT = "Setur Marina Rezervasyon Onayı - {booking_id}"
 
-    def send_booking_confirmation(
-        self,
-        booking_data: Dict,
-        customer_email: str,
-        marina_name: str
-    ) -> bool:
-        subject = f"Setur Marina Rezervasyon Onayı - {booking_data['booking_id']}"
-
-        body = f"""
+BOOKING_CONFIRMATION_TEXT = """
 ╔═══════════════════════════════════════════════╗
 ║          SETUR MARINA                         ║
 ║      Rezervasyon Onay Belgesi                 ║
 ╚═══════════════════════════════════════════════╝
 
-Sayın {booking_data['customer_name']},
+Sayın {customer_name},
 
 {marina_name} rezervasyonunuz başarıyla oluşturulmuştur.
 
@@ -42,19 +24,19 @@ Sayın {booking_data['customer_name']},
 REZERVASYON DETAYLARI
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-Rezervasyon No:    {booking_data['booking_id']}
-Tekne Adı:         {booking_data['boat_name']}
-Tekne Boyu:        {booking_data['boat_length_meters']}m
+Rezervasyon No:    {booking_id}
+Tekne Adı:         {boat_name}
+Tekne Boyu:        {boat_length_meters}m
 
-Check-in:          {booking_data['check_in']}
-Check-out:         {booking_data['check_out']}
-Toplam Gece:       {booking_data['total_nights']}
+Check-in:          {check_in}
+Check-out:         {check_out}
+Toplam Gece:       {total_nights}
 
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 ÖDEME BİLGİLERİ
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-Toplam Tutar:      €{booking_data['total_price_eur']}
+Toplam Tutar:      €{total_price_eur}
 
 İyi seyirler dileriz!
 
@@ -62,12 +44,67 @@ Setur Marina Team
 www.seturmarinas.com
 """
 
+
+@dataclass
+class EmailTemplate:
+    subject: str
+    body: str
+    recipient: str
+    sender: str = "noreply@seturmarinas.com"
+
+
+class EmailService:
+    """Email service for booking confirmations (POC - Mock mode)"""
+
+    def __init__(self, mock_mode: bool = True):
+        self.mock_mode = mock_mode
+        self.sent_emails = []
+        self.templates = TemplateEngine(default_language="tr")
+        self.templates.register(
+            "booking_confirmation",
+            BOOKING_CONFIRMATION_SUBJECT,
+            html="",
+            text=BOOKING_CONFIRMATION_TEXT
+        )
+
+    def send_booking_confirmation(
+        self,
+        booking_data: Dict,
+        customer_email: str,
+        marina_name: str
+    ) -> bool:
+        email = self.templates.render(
+            "booking_confirmation", {**booking_data, "marina_name": marina_name}
+        )
+
         return self._send_email(
             recipient=customer_email,
-            subject=subject,
-            body=body
+            subject=email.subject,
+            body=email.text
         )
 
+    def send_bulk(
+        self,
+        template: str,
+        recipients_with_params: Iterable[Tuple[str, Dict]],
+        language: Optional[str] = None,
+        workers: int = 4
+    ) -> List[bool]:
+        """Render one template per (recipient, params) in a thread pool, then send"""
+        pairs = list(recipients_with_params)
+        self.templates.get(template, language)  # Compile once before fanning out
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            rendered = list(pool.map(
+                lambda params: self.templates.render(template, params, language),
+                (params for _, params in pairs)
+            ))
+
+        return [
+            self._send_email(recipient=recipient, subject=email.subject, body=email.text or email.html)
+            for (recipient, _), email in zip(pairs, rendered)
+        ]
+
     def _send_email(self, recipient: str, subject: str, body: str) -> bool:
         email = EmailTemplate(
             recipient=recipient,
@@ -4,6 +4,7 @@ import asyncio
 from typing import Dict, Any, List, Tuple
 from datetime import datetime
 from backend.skills.base_skill import BaseSkill, SkillMetadata
+from backend.database.interface import as_async_database
 from backend.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,7 +18,8 @@ class BatchResourceAllocationSkill(BaseSkill):
 
     def __init__(self, db_interface=None):
         super().__init__()
-        self.db = db_interface
+        # Sync databases run in worker threads so gathered calls overlap
+        self.db = as_async_database(db_interface)
         self.resource_lock = asyncio.Lock()
 
     def get_metadata(self) -> SkillMetadata:
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from backend.skills.base_skill import BaseSkill, SkillMetadata
 from backend.database.models import Conflict, GateAssignment
 from backend.logger import get_logger
+from backend.utils.intervals import find_overlap_clusters
 
 logger = get_logger(__name__)
 
@@ -113,9 +114,15 @@ class ConflictResolutionSkill(BaseSkill):
         self,
         assignments: List[Dict[str, Any]]
     ) -> List[Conflict]:
-        """Detect gate over-allocation conflicts"""
-        conflicts = []
-        gate_usage = {}
+        """
+        Detect gate over-allocation conflicts
+
+        Timestamps are parsed once, each gate's bookings are sorted by
+        arrival and swept once, so the cost is O(n log n) instead of
+        comparing every pair. Chains of mutually overlapping bookings are
+        merged into a single conflict covering the whole cluster.
+        """
+        gate_usage: Dict[str, List[Tuple[datetime, datetime, str]]] = {}
 
         for assignment in assignments:
             vessel_id = assignment.get("vessel_id")
@@ -126,27 +133,22 @@ class ConflictResolutionSkill(BaseSkill):
             if not all([vessel_id, gate_id, start, end]):
                 continue
 
-            if gate_id not in gate_usage:
-                gate_usage[gate_id] = []
-
-            # Check for time overlap with existing assignments
-            for existing in gate_usage[gate_id]:
-                if self._times_overlap(start, end, existing["start"], existing["end"]):
-                    conflict = Conflict(
-                        conflict_id=f"GATE-{gate_id}-{datetime.now().timestamp()}",
-                        conflict_type="gate_overlap",
-                        severity="high",
-                        vessel_ids=[vessel_id, existing["vessel_id"]],
-                        gate_id=gate_id,
-                        description=f"Gate {gate_id} double-booked between {start} and {end}"
-                    )
-                    conflicts.append(conflict)
+            gate_usage.setdefault(gate_id, []).append((start, end, vessel_id))
 
-            gate_usage[gate_id].append({
-                "vessel_id": vessel_id,
-                "start": start,
-                "end": end
-            })
+        conflicts = []
+        for gate_id, intervals in gate_usage.items():
+            for index, (start, end, vessel_ids) in enumerate(find_overlap_clusters(intervals)):
+                conflicts.append(Conflict(
+                    conflict_id=f"GATE-{gate_id}-{start.strftime('%Y%m%d%H%M')}-{index}",
+                    conflict_type="gate_overlap",
+                    severity="high",
+                    vessel_ids=vessel_ids,
+                    gate_id=gate_id,
+                    description=(
+                        f"Gate {gate_id} double-booked by {len(vessel_ids)} vessels "
+                        f"between {start} and {end}"
+                    )
+                ))
 
         return conflicts
 
@@ -329,16 +331,6 @@ class ConflictResolutionSkill(BaseSkill):
 
         return classification
 
-    def _times_overlap(
-        self,
-        start1: datetime,
-        end1: datetime,
-        start2: datetime,
-        end2: datetime
-    ) -> bool:
-        """Check if two time ranges overlap"""
-        return start1 < end2 and end1 > start2
-
     def _parse_datetime(self, dt_str: Any) -> Optional[datetime]:
         """Safely parse datetime string"""
         if isinstance(dt_str, datetime):
@@ -4,6 +4,7 @@ import asyncio
 from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime, timedelta
 from backend.skills.base_skill import BaseSkill, SkillMetadata
+from backend.database.interface import as_async_database
 from backend.database.models import Vessel, Gate, GateAssignment, VesselStatus, GateStatus
 from backend.logger import get_logger
 
@@ -18,7 +19,8 @@ class ParallelGateAssignmentSkill(BaseSkill):
 
     def __init__(self, db_interface=None):
         super().__init__()
-        self.db = db_interface
+        # Sync databases run in worker threads so gathered calls overlap
+        self.db = as_async_database(db_interface)
         self.assignment_lock = asyncio.Lock()
 
     def get_metadata(self) -> SkillMetadata:
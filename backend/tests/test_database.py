@@ -0,0 +1,293 @@
+"""
+Test Suite for Database Layer
+Tests the SQLAlchemy-backed sync and async database implementations
+"""
+
+import random
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from backend.database.availability import BerthCalendar
+from backend.database.berth_index import BerthSearchIndex
+from backend.database.mediterranean_db import MediterraneanDatabase
+from backend.database.models import Berth, Booking, Gate, Marina, Vessel
+from backend.database.sql_db import SQLDatabase
+from backend.exceptions import BerthNotAvailableError, BookingError
+
+
+def _marina(marina_id: str = "marina_test") -> Marina:
+    return Marina(
+        marina_id=marina_id,
+        name="Test Marina",
+        location="Test Bay",
+        city="Bodrum",
+        country="Turkey",
+        country_code="TR",
+        total_berths=3,
+        available_berths=3,
+        coordinates={"lat": 37.03, "lon": 27.43},
+        amenities=["fuel", "wifi"],
+        contact_email="info@test-marina.com",
+        contact_phone="+90 252 000 0000",
+    )
+
+
+def _berth(number: int, length: float, rate: float, **overrides) -> Berth:
+    data = dict(
+        berth_id=f"marina_test-A{number:03d}",
+        marina_id="marina_test",
+        section="A",
+        number=f"A{number:03d}",
+        length_meters=length,
+        width_meters=5.0,
+        depth_meters=4.0,
+        has_electricity=True,
+        has_water=True,
+        has_wifi=True,
+        daily_rate=rate,
+    )
+    data.update(overrides)
+    return Berth(**data)
+
+
+class _GateDatabase(SQLDatabase):
+    """SQLDatabase plus the gate calls made by the airport-style skills"""
+
+    def __init__(self):
+        super().__init__("sqlite:///:memory:")
+        self.vessels = {
+            "V1": Vessel("V1", "Mavi Deniz", 18.0, priority_level=2),
+            "V2": Vessel("V2", "Poyraz", 12.0, priority_level=1),
+        }
+        self.gates = [Gate("G1", "T1", 20.0, 40.0), Gate("G2", "T1", 14.0, 25.0)]
+        self.caller_threads = set()
+
+    def get_vessel(self, vessel_id):
+        self.caller_threads.add(threading.get_ident())
+        return self.vessels.get(vessel_id)
+
+    def search_suitable_gates(self, vessel, terminal_id, time_window):
+        return [g for g in self.gates if g.length_meters >= vessel.length_meters]
+
+    def allocate_gate(self, vessel_id, gate_id):
+        return True
+
+
+@pytest.fixture
+def sql_db() -> SQLDatabase:
+    """In-memory SQLite database seeded with one marina and three berths"""
+    db = SQLDatabase("sqlite:///:memory:")
+    db.seed(
+        [_marina()],
+        [
+            _berth(1, 20.0, 250.0),
+            _berth(2, 14.0, 150.0, has_water=False),
+            _berth(3, 30.0, 400.0, status="maintenance"),
+        ],
+    )
+    return db
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestSQLDatabase:
+    """Test SQLDatabase against SQLite"""
+
+    def test_round_trip_marina(self, sql_db):
+        """Test seeded marina maps back to the dataclass"""
+        assert sql_db.get_marina_by_id("marina_test") == _marina()
+        assert sql_db.get_marina_by_id("missing") is None
+
+    def test_search_filters_and_price_order(self, sql_db):
+        """Test search applies filters and sorts by daily rate"""
+        results = sql_db.search_available_berths(marina_id="marina_test")
+        assert [b.number for b in results] == ["A002", "A001"]
+
+        results = sql_db.search_available_berths(min_length=15.0, needs_water=True)
+        assert [b.number for b in results] == ["A001"]
+
+    def test_booking_blocks_overlapping_dates(self, sql_db):
+        """Test date-range search and overlap rejection"""
+        booking = sql_db.create_booking(
+            "marina_test-A001", "Test Owner", "test@example.com", "+90 555 0000000",
+            "Test Vessel", 15.5, "2030-06-01", "2030-06-05", ["electricity"]
+        )
+        assert sql_db.get_booking_by_id(booking.booking_id) == booking
+
+        with pytest.raises(BerthNotAvailableError):
+            sql_db.create_booking(
+                "marina_test-A001", "Other", "o@example.com", "+90 555 1111111",
+                "Other Vessel", 12.0, "2030-06-04", "2030-06-08", []
+            )
+
+        overlapping = sql_db.search_available_berths(check_in="2030-06-03", check_out="2030-06-10")
+        assert [b.number for b in overlapping] == ["A002"]
+
+        after = sql_db.search_available_berths(check_in="2030-06-05", check_out="2030-06-10")
+        assert [b.number for b in after] == ["A002", "A001"]
+
+    def test_invalid_dates(self, sql_db):
+        """Test check-out before check-in is rejected"""
+        with pytest.raises(BookingError):
+            sql_db.create_booking(
+                "marina_test-A001", "Test Owner", "test@example.com", "+90 555 0000000",
+                "Test Vessel", 15.5, "2030-06-05", "2030-06-01", []
+            )
+
+    def test_import_bookings(self, sql_db):
+        """Test bulk booking import"""
+        bookings = [
+            Booking(
+                booking_id=f"BK-IMPORT-{i}",
+                berth_id="marina_test-A002",
+                marina_id="marina_test",
+                customer_name="Imported",
+                customer_email="imported@example.com",
+                customer_phone="+90 555 2222222",
+                boat_name=f"Vessel {i}",
+                boat_length_meters=10.0,
+                check_in=f"2030-07-{i + 1:02d}",
+                check_out=f"2030-07-{i + 2:02d}",
+                total_nights=1,
+                total_price=150.0,
+                status="confirmed",
+            )
+            for i in range(5)
+        ]
+
+        assert sql_db.import_bookings(bookings, batch_size=2) == 5
+        assert len(sql_db.get_bookings_by_marina("marina_test")) == 5
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestBerthSearchIndex:
+    """Test the in-memory berth search index against a linear scan"""
+
+    @pytest.mark.parametrize("count,budget", [
+        (50, BerthSearchIndex.LENGTH_PREFIX_BUDGET),
+        (3000, BerthSearchIndex.LENGTH_PREFIX_BUDGET),
+        (3000, 64),
+    ])
+    def test_length_ranges_match_scan(self, count, budget):
+        """Test length-range searches (exact, strided and budget-capped prefixes) match filtering"""
+        rng = random.Random(count)
+        berths = [
+            _berth(i, round(rng.uniform(8.0, 60.0), 1), rng.uniform(50.0, 900.0),
+                   has_water=rng.random() < 0.7,
+                   status=rng.choice(["available", "available", "occupied"]))
+            for i in range(count)
+        ]
+        index = BerthSearchIndex(berths, length_prefix_budget=budget)
+
+        for _ in range(40):
+            low = rng.choice([None, rng.uniform(5.0, 40.0)])
+            high = rng.choice([None, rng.uniform(20.0, 65.0)])
+            expected = sorted(
+                (b for b in berths
+                 if b.is_available() and b.has_water
+                 and (low is None or b.length_meters >= low)
+                 and (high is None or b.length_meters <= high)),
+                key=lambda b: b.daily_rate,
+            )
+            found = index.search(min_length=low, max_length=high, needs_water=True)
+            assert [b.berth_id for b in found] == [b.berth_id for b in expected]
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestBerthCalendar:
+    """Test date-range availability of the in-memory databases"""
+
+    def test_block_occupied_skips_available_berths(self):
+        """Test only berths that are not available get a seeded block"""
+        berths = [_berth(1, 12.0, 100.0), _berth(2, 12.0, 100.0, status="occupied")]
+        calendar = BerthCalendar()
+
+        assert calendar.block_occupied(berths, "2025-07-01", "2025-07-08") == 1
+        assert calendar.is_free(berths[0].berth_id, "2025-07-02", "2025-07-03")
+        assert not calendar.is_free(berths[1].berth_id, "2025-07-02", "2025-07-03")
+        assert calendar.is_free(berths[1].berth_id, "2025-07-08", "2025-07-09")
+
+    def test_occupied_berths_not_offered_for_current_dates(self):
+        """Test seeded occupied/reserved berths are not returned as free today"""
+        db = MediterraneanDatabase()
+        today = date.today()
+        current = db.search_available_berths(
+            check_in=today.isoformat(), check_out=(today + timedelta(days=2)).isoformat()
+        )
+        assert current and all(b.is_available() for b in current)
+
+        # Once the assumed current stay is over they can be booked again
+        later = today + timedelta(days=db.CURRENT_STAY_DAYS + 30)
+        future = db.search_available_berths(
+            check_in=later.isoformat(), check_out=(later + timedelta(days=2)).isoformat()
+        )
+        assert any(b.status in ("occupied", "reserved") for b in future)
+
+    def test_booking_occupied_berth_for_today_fails(self):
+        """Test create_booking refuses a berth that is occupied now"""
+        db = MediterraneanDatabase()
+        berth = next(b for b in db.berths if b.status == "occupied" and b.length_meters >= 10)
+        today = date.today()
+
+        with pytest.raises(BerthNotAvailableError):
+            db.create_booking(
+                berth.berth_id, "Ayşe Kaya", "ayse@example.com", "+905551112233",
+                "Deniz", 8.0, today.isoformat(), (today + timedelta(days=1)).isoformat(), []
+            )
+        assert db.bookings == []
+
+
+@pytest.mark.unit
+@pytest.mark.database
+class TestAsyncDatabase:
+    """Test the async database path"""
+
+    async def test_async_sql_database(self):
+        """Test AsyncSQLDatabase search and booking over aiosqlite"""
+        pytest.importorskip("aiosqlite")
+        from backend.database.sql_db import AsyncSQLDatabase
+
+        db = AsyncSQLDatabase("sqlite:///:memory:")
+        await db.create_tables()
+        await db.seed([_marina()], [_berth(1, 20.0, 250.0), _berth(2, 14.0, 150.0)])
+
+        results = await db.search_available_berths(marina_id="marina_test")
+        assert [b.number for b in results] == ["A002", "A001"]
+
+        booking = await db.create_booking(
+            "marina_test-A001", "Test Owner", "test@example.com", "+90 555 0000000",
+            "Test Vessel", 15.5, "2030-06-01", "2030-06-05", []
+        )
+        assert await db.get_booking_by_id(booking.booking_id) == booking
+
+    async def test_adapter_wraps_sync_database(self, sql_db):
+        """Test AsyncDatabaseAdapter runs sync calls off the event loop"""
+        from backend.database.interface import AsyncDatabaseAdapter, as_async_database
+
+        db = as_async_database(sql_db)
+        assert isinstance(db, AsyncDatabaseAdapter)
+
+        berth = await db.get_berth_by_id("marina_test-A001")
+        assert berth.length_meters == 20.0
+        assert len(await db.search_available_berths(marina_id="marina_test")) == 2
+
+    async def test_skills_use_adapter_for_sync_database(self):
+        """Test the airport-style skills run sync database calls in worker threads"""
+        from backend.skills.parallel_gate_assignment_skill import ParallelGateAssignmentSkill
+        from backend.skills.traffic_aware_scheduling_skill import TrafficAwareSchedulingSkill
+
+        db = _GateDatabase()
+        result = await ParallelGateAssignmentSkill(db).execute({"vessel_ids": ["V1", "V2"]}, None)
+
+        assert result["success"] and result["assigned"] == 2
+        assert {a["gate_id"] for a in result["assignments"]} == {"G1", "G2"}
+        assert threading.get_ident() not in db.caller_threads
+
+        result = await TrafficAwareSchedulingSkill(db).execute({"vessels": ["V2", "V1"]}, None)
+        assert [s["vessel_id"] for s in result["schedule"]] == ["V1", "V2"]
@@ -0,0 +1,513 @@
+"""
+Test Suite for Learning Module
+Tests TabPFN adapter nearest-neighbour search, batch prediction (adapter,
+API client and pipeline), federated aggregation and A/B testing statistics
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pydantic")
+
+from backend.learning.feature_matrix import FeatureMatrix
+from backend.learning.federated_learning import FederatedLearningCoordinator
+from backend.learning.experience_pipeline import ExperienceLearningPipeline
+from backend.learning.models import Experience, ExperienceType, LearningStrategy, Pattern
+from backend.learning.pattern_store import PatternStore
+from backend.learning.seal_v2_manager import SEALv2Manager
+from backend.learning.tabpfn_adapter import TabPFNAdapter
+from backend.learning.tabpfn_client import TabPFNAPIClient
+
+
+def _experience(i: int, **context) -> Experience:
+    return Experience(
+        experience_id=f"exp_test_{i}",
+        experience_type=ExperienceType.PRICING,
+        context={"season": "high", "occupancy_rate": 0.5 + i / 100, **context},
+        action="suggest_price",
+        action_params={"suggested_price": 200 + i},
+        outcome="success" if i % 2 else "failure",
+        performance_score=0.8,
+    )
+
+
+@pytest.mark.unit
+class TestTabPFNAdapter:
+    """Test TabPFNAdapter KNN search"""
+
+    def test_neighbors_match_pairwise_distance(self):
+        """Test vectorized search returns the same neighbours as _calculate_distance"""
+        adapter = TabPFNAdapter(enable_caching=False)
+        for i in range(30):
+            extra = {"berth": None} if i % 4 == 0 else {"flag": i % 3 == 0}
+            adapter.add_training_sample(_experience(i, **extra))
+
+        query = adapter._extract_features(_experience(7, season="low", unseen="x"))
+        expected = sorted(
+            (adapter._calculate_distance(query, adapter._extract_features(exp)), exp.experience_id)
+            for exp in adapter.training_data
+        )[:5]
+
+        neighbors = adapter._find_k_nearest_neighbors(query, 5)
+        assert [exp.experience_id for exp, _ in neighbors] == [eid for _, eid in expected]
+        assert [d for _, d in neighbors] == pytest.approx([d for d, _ in expected])
+
+    def test_feature_matrix_evicts_oldest(self):
+        """Test the ring buffer overwrites the oldest row when full"""
+        matrix = FeatureMatrix(capacity=3)
+        for i in range(5):
+            matrix.add({"x": float(i)}, i)
+
+        assert len(matrix) == 3
+        assert [item for item, _ in matrix.nearest({"x": 0.0}, 3)] == [2, 3, 4]
+
+    def test_predict_batch_matches_predict(self):
+        """Test batch prediction returns the same results in input order"""
+        adapter = TabPFNAdapter(enable_caching=False)
+        for i in range(40):
+            adapter.add_training_sample(_experience(i))
+
+        queries = [_experience(i, season="low" if i % 2 else "high") for i in range(50, 60)]
+        batch = adapter.predict_batch(queries, confidence_threshold=0.0, chunk_size=3)
+        single = [adapter.predict(q, confidence_threshold=0.0) for q in queries]
+
+        assert [p.predicted_outcome for p in batch] == [p.predicted_outcome for p in single]
+        assert [p.confidence for p in batch] == pytest.approx([p.confidence for p in single])
+
+    def test_prediction_cache_is_bounded(self):
+        """Test the LRU evicts beyond cache_size and counts evictions"""
+        adapter = TabPFNAdapter(cache_size=2)
+        for i in range(10):
+            adapter.add_training_sample(_experience(i))
+
+        for i in range(5):
+            adapter.predict(_experience(100 + i), confidence_threshold=0.0)
+        cached = adapter.predict(_experience(104), confidence_threshold=0.0)
+
+        stats = adapter.get_statistics()
+        assert cached.from_cache
+        assert stats['cache_size'] == 2
+        assert stats['cache_evictions'] == 3
+        assert stats['cache_hits'] == 1
+
+    def test_shared_cache_between_adapters(self, tmp_path):
+        """Test a second adapter reuses predictions through the SQLite store"""
+        path = str(tmp_path / "predictions.db")
+        first = TabPFNAdapter(shared_cache_path=path)
+        second = TabPFNAdapter(shared_cache_path=path)
+        for i in range(10):
+            first.add_training_sample(_experience(i))
+
+        prediction = first.predict(_experience(50), confidence_threshold=0.0)
+        shared = second.predict(_experience(50), confidence_threshold=0.0)
+
+        assert shared.from_cache
+        assert shared.predicted_outcome == prediction.predicted_outcome
+        assert second.get_statistics()['cache']['shared_hits'] == 1
+
+
+@pytest.mark.unit
+class TestSEALv2Manager:
+    """Test SEAL v2 bounded experience storage"""
+
+    def test_rolling_performance_window(self):
+        """Test recent performance and plateau checks use the last window only"""
+        seal = SEALv2Manager()
+        for i in range(30):
+            experience = _experience(i)
+            experience.performance_score = 0.2 if i < 20 else 0.9
+            seal.record_experience(experience)
+
+        assert seal._get_recent_performance() == pytest.approx(0.9)
+        assert seal._get_recent_performance(window=20) == pytest.approx(0.55)
+        assert seal._is_learning_plateaued()
+        assert seal.experiences.maxlen == SEALv2Manager.MAX_EXPERIENCES
+
+    def test_pattern_store_bounds_examples_and_sorts(self):
+        """Test example IDs are reservoir-sampled and patterns come back by confidence"""
+        seal = SEALv2Manager()
+        for i in range(100):
+            experience = _experience(i)
+            experience.context = {"season": "high" if i % 4 else "low"}
+            seal.record_experience(experience)
+
+        patterns = seal.get_patterns()
+        assert [p.confidence for p in patterns] == sorted((p.confidence for p in patterns), reverse=True)
+        assert all(len(p.example_experience_ids) <= SEALv2Manager.PATTERN_MAX_EXAMPLES for p in patterns)
+        assert sum(p.occurrences for p in patterns) == 100
+
+        seal._prune_patterns(0.9)
+        assert all(p.confidence >= 0.9 for p in seal.get_patterns())
+
+    @pytest.mark.parametrize("reuse_keys", [False, True])
+    def test_pattern_store_rotation_stays_bounded(self, reuse_keys):
+        """Test add/prune cycles do not grow the compaction queue"""
+        store = PatternStore()
+        for cycle in range(1000):
+            for i in range(5):
+                key = f"k{i}" if reuse_keys else f"k{cycle}_{i}"
+                store.add(key, Pattern(
+                    pattern_type="pricing", description=key, frequency=1.0, confidence=0.1
+                ))
+            store.remove("k0" if reuse_keys else f"k{cycle}_0")
+            store.prune_below(0.5)
+            store.compact_step()
+
+        assert len(store) == 0
+        assert len(store._rotation) <= 2 * len(store) + 16 + 5
+        assert len(store._rotation) == len(set(store._rotation))
+
+
+@pytest.fixture
+def tabpfn_stub():
+    """Local stand-in for the TabPFN /predict endpoint"""
+    requests_seen = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests_seen.append(payload)
+            # Echo the last feature so results can be matched to queries
+            body = json.dumps({
+                "predictions": [
+                    {"prediction": 1.0, "confidence": min(row[-1], 1.0)}
+                    for row in payload["X_query"]
+                ],
+                "training_samples": len(payload["X_train"]),
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", requests_seen
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+class TestTabPFNAPIClient:
+    """Test TabPFNAPIClient against a local HTTP stub"""
+
+    def test_predict_batch_chunks_requests(self, tabpfn_stub):
+        """Test one request per chunk and predictions returned in order"""
+        pytest.importorskip("requests")
+        url, requests_seen = tabpfn_stub
+        client = TabPFNAPIClient(api_key="test-key", api_url=url, enable_fallback=False)
+
+        training = [_experience(i) for i in range(5)]
+        queries = [_experience(i, zz_score=0.5 + i / 100) for i in range(10)]
+        predictions = client.predict_batch(
+            training, queries, confidence_threshold=0.5, chunk_size=4, max_concurrency=2
+        )
+
+        assert len(requests_seen) == 3
+        assert [len(r["X_query"]) for r in requests_seen] == [4, 4, 2]
+        assert all(len(r["X_train"]) == 5 for r in requests_seen)
+        assert [p.confidence for p in predictions] == pytest.approx([0.5 + i / 100 for i in range(10)])
+        assert all(p.predicted_outcome == "success" and p.sample_count == 5 for p in predictions)
+        assert client.get_statistics()["api_successes"] == 3
+
+
+    def test_fallback_trains_adapter_once(self):
+        """Test repeated fallbacks add each training experience to the adapter only once"""
+        client = TabPFNAPIClient(api_key=None)
+        training = [_experience(i) for i in range(6)]
+        queries = [_experience(i, season="low") for i in range(50, 53)]
+
+        first = client.predict_batch(training, queries, confidence_threshold=0.0)
+        second = client.predict_batch(training, queries, confidence_threshold=0.0)
+        client.predict(training, queries[0], confidence_threshold=0.0)
+        assert len(client.fallback_adapter.training_data) == 6
+        assert [p.predicted_outcome for p in first] == [p.predicted_outcome for p in second]
+
+        client.predict_batch([*training, _experience(6)], queries, confidence_threshold=0.0)
+        assert [e.experience_id for e in client.fallback_adapter.training_data] == [
+            f"exp_test_{i}" for i in range(7)
+        ]
+
+        client.predict_batch(training[3:], queries, confidence_threshold=0.0)
+        assert [e.experience_id for e in client.fallback_adapter.training_data] == [
+            f"exp_test_{i}" for i in range(3, 6)
+        ]
+        assert client.get_statistics()["fallback_uses"] == 5
+
+
+def _typed_experience(i: int, experience_type: ExperienceType) -> Experience:
+    return Experience(
+        experience_id=f"exp_{experience_type.value}_{i}",
+        experience_type=experience_type,
+        context={"season": "high" if i % 3 else "low", "occupancy_rate": 0.5 + (i % 10) / 100},
+        action="suggest_price",
+        action_params={"suggested_price": 200 + i},
+        outcome="success" if i % 2 else "failure",
+        performance_score=0.8 if i % 2 else 0.3,
+    )
+
+
+@pytest.mark.unit
+class TestExperienceLearningPipeline:
+    """Test batch prediction routing of the learning pipeline"""
+
+    @staticmethod
+    def _pipeline(counts, **kwargs) -> ExperienceLearningPipeline:
+        pipeline = ExperienceLearningPipeline(enable_caching=False, **kwargs)
+        for experience_type, count in counts.items():
+            for i in range(count):
+                pipeline.process_experience(_typed_experience(i, experience_type))
+        return pipeline
+
+    def test_predict_batch_matches_predict(self):
+        """Test TabPFN, Hybrid and SEAL routes give the same results as predict()"""
+        pipeline = self._pipeline({
+            ExperienceType.PRICING: 5,         # TabPFN
+            ExperienceType.MAINTENANCE: 20,    # Hybrid
+            ExperienceType.COMPLIANCE: 120,    # SEAL
+        })
+        queries = [
+            _typed_experience(1000 + i, experience_type)
+            for experience_type in (ExperienceType.PRICING, ExperienceType.MAINTENANCE, ExperienceType.COMPLIANCE)
+            for i in range(3)
+        ]
+
+        batch = pipeline.predict_batch(queries, chunk_size=2)
+        single = [pipeline.predict(q) for q in queries]
+
+        assert [p.strategy.value for p in batch] == ["tabpfn"] * 3 + ["hybrid"] * 3 + ["seal"] * 3
+        assert [p.strategy for p in batch] == [p.strategy for p in single]
+        assert [p.predicted_outcome for p in batch] == [p.predicted_outcome for p in single]
+        assert [p.confidence for p in batch] == pytest.approx([p.confidence for p in single])
+
+    def test_hybrid_falls_back_to_seal(self):
+        """Test hybrid queries without a TabPFN prediction use matching SEAL patterns"""
+        pipeline = self._pipeline({ExperienceType.MAINTENANCE: 20})
+        pipeline.seal.patterns.add("maintenance_high", Pattern(
+            pattern_type="maintenance", description="high season", frequency=1.0,
+            confidence=0.9, conditions={"season": "high"}
+        ))
+        pipeline.tabpfn.predict = lambda *args, **kwargs: None
+        pipeline.tabpfn.predict_batch = lambda queries, *args, **kwargs: [None] * len(queries)
+
+        queries = [_typed_experience(1002 + i, ExperienceType.MAINTENANCE) for i in range(3)]
+        batch = pipeline.predict_batch(queries)
+        single = [pipeline.predict(q) for q in queries]
+
+        assert batch[0] is None and single[0] is None  # "low" season: no pattern matches
+        assert [(p.strategy.value, p.confidence) for p in batch[1:]] == [("seal", 0.9)] * 2
+        assert [(p.strategy.value, p.confidence) for p in single[1:]] == [("seal", 0.9)] * 2
+        assert pipeline.strategy_usage[LearningStrategy.HYBRID] == 4
+
+    def test_predict_batch_without_tabpfn(self):
+        """Test every query routes to SEAL when TabPFN is disabled"""
+        pipeline = self._pipeline({ExperienceType.COMPLIANCE: 120}, enable_tabpfn=False)
+        queries = [_typed_experience(1000 + i, ExperienceType.COMPLIANCE) for i in range(3)]
+        queries.append(_typed_experience(1000, ExperienceType.PRICING))
+
+        batch = pipeline.predict_batch(queries)
+
+        assert [p.strategy.value for p in batch[:3]] == ["seal"] * 3
+        assert batch[3] is None
+        single = [pipeline.predict(q) for q in queries]
+        assert [p.reasoning for p in batch[:3]] == [p.reasoning for p in single[:3]]
+        assert single[3] is None
+
+
+@pytest.mark.unit
+class TestFederatedLearningCoordinator:
+    """Test dense federated averaging"""
+
+    def test_aggregation_and_npz_round_trip(self, tmp_path):
+        """Test mixed dict/array submissions average per key and survive export"""
+        coordinator = FederatedLearningCoordinator(min_participants=3, enable_privacy=False)
+        for tenant in ("a", "b", "c"):
+            coordinator.tenant_opt_in(tenant, f"Marina {tenant}")
+
+        metrics = {"avg_performance": 0.5}
+        coordinator.submit_local_model("a", "Marina a", [None] * 10, {"w1": 1.0, "w2": 2.0}, metrics)
+        coordinator.submit_local_model("b", "Marina b", [None] * 10, {"w2": 4.0, "w3": 6.0}, metrics)
+        coordinator.submit_local_model("c", "Marina c", [None] * 10, [3.0, 0.0, 3.0], metrics)
+
+        # Equal samples and performance: each tenant weighs (1/3 + 1) / 2
+        weights = coordinator.get_global_model_weights("a")
+        assert weights == pytest.approx({"w1": 8 / 3, "w2": 4.0, "w3": 6.0})
+
+        path = str(tmp_path / "global.npz")
+        assert coordinator.export_global_model_npz(path)
+        restored = FederatedLearningCoordinator()
+        assert restored.import_global_model_npz(path)
+        model = restored.get_global_model()
+        assert model.weight_keys == ["w1", "w2", "w3"]
+        assert model.weights.dtype.name == "float32"
+        assert model.aggregated_weights == pytest.approx(weights)
+
+    def test_privacy_noise_skips_keys_not_submitted(self):
+        """Test Laplace noise touches only the keys a tenant submitted"""
+        coordinator = FederatedLearningCoordinator(min_participants=3, privacy_epsilon=1.0, seed=7)
+        for tenant in ("a", "b"):
+            coordinator.tenant_opt_in(tenant, f"Marina {tenant}")
+
+        metrics = {"avg_performance": 0.5}
+        coordinator.submit_local_model("a", "Marina a", [None] * 10, {"w1": 1.0, "w2": 2.0}, metrics)
+        coordinator.submit_local_model("b", "Marina b", [None] * 10, {"w3": 6.0}, metrics)
+
+        b = coordinator.tenant_models["b"]
+        assert b.weight_keys == ["w1", "w2", "w3"]
+        assert b.weights[:2].tolist() == [0.0, 0.0]
+        assert b.weights[2] != 6.0
+        assert b.model_weights == {"w1": 0.0, "w2": 0.0, "w3": pytest.approx(float(b.weights[2]))}
+        a = coordinator.tenant_models["a"]
+        assert a.weight_keys == ["w1", "w2"] and len(a.weights) == 2
+        assert a.weights.tolist() != [1.0, 2.0]
+
+    @pytest.mark.parametrize("fmt", ["json", "npz"])
+    def test_import_extends_layout(self, tmp_path, fmt):
+        """Test array submissions sized to an imported model's keys are accepted"""
+        source = FederatedLearningCoordinator(min_participants=1, enable_privacy=False)
+        source.tenant_opt_in("a", "Marina a")
+        source.submit_local_model("a", "Marina a", [None], {"w1": 1.0, "w2": 2.0, "w3": 3.0}, {})
+        path = str(tmp_path / f"global.{fmt}")
+        export = source.export_global_model if fmt == "json" else source.export_global_model_npz
+        assert export(path)
+
+        coordinator = FederatedLearningCoordinator(
+            min_participants=3, enable_privacy=False, weight_keys=["w1"]
+        )
+        load = coordinator.import_global_model if fmt == "json" else coordinator.import_global_model_npz
+        assert load(path)
+        coordinator.tenant_opt_in("b", "Marina b")
+
+        assert coordinator.layout.keys == ["w1", "w2", "w3"]
+        assert coordinator.submit_local_model("b", "Marina b", [None], [1.0, 2.0, 3.0], {})
+        assert coordinator.tenant_models["b"].model_weights == {"w1": 1.0, "w2": 2.0, "w3": 3.0}
+
+
+@pytest.mark.unit
+class TestABTestingFramework:
+    """Test streaming variant statistics"""
+
+    def test_streaming_metrics_match_full_sample(self):
+        """Test Welford metrics and t-test agree with the raw scores"""
+        np = pytest.importorskip("numpy")
+        scipy_stats = pytest.importorskip("scipy.stats")
+        from backend.learning.ab_testing import ABTestingFramework, Variant, VariantType
+
+        framework = ABTestingFramework(min_sample_size=50, histogram_bins=100, reservoir_size=20)
+        experiment = framework.create_experiment(
+            "pricing",
+            "Streaming stats",
+            [
+                Variant("control", "Control", VariantType.CONTROL, 0.5, {}, ""),
+                Variant("treatment", "Treatment", VariantType.TREATMENT, 0.5, {}, ""),
+            ],
+            target_metric="performance",
+            created_by="test",
+        )
+        framework.start_experiment(experiment.experiment_id)
+
+        rng = np.random.default_rng(7)
+        scores = {"control": rng.beta(5, 5, 500), "treatment": rng.beta(6, 5, 500)}
+        for variant_id, values in scores.items():
+            for value in values:
+                framework.record_outcome(experiment.experiment_id, variant_id, float(value))
+
+        metrics = framework.get_variant_metrics(experiment.experiment_id, "treatment")
+        values = scores["treatment"]
+        assert metrics.sample_count == 500
+        assert metrics.success_count == int((values > 0.5).sum())
+        assert metrics.avg_performance == pytest.approx(values.mean())
+        assert metrics.std_performance == pytest.approx(values.std())
+        assert metrics.quantiles["p50"] == pytest.approx(np.median(values), abs=0.01)
+        assert len(framework.get_variant_samples(experiment.experiment_id, "treatment")) == 20
+
+        result = framework.analyze_experiment(experiment.experiment_id)
+        expected = scipy_stats.ttest_ind(scores["treatment"], scores["control"]).pvalue
+        assert result.p_value == pytest.approx(expected)
+
+    def test_sequential_mode_stops_early(self):
+        """Test a clearly worse treatment ends the experiment before the fixed horizon"""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("scipy")
+        from backend.learning.ab_testing import (
+            ABTestingFramework, ExperimentStatus, Variant, VariantType
+        )
+
+        framework = ABTestingFramework(min_sample_size=5000, sequential=True)
+        experiment = framework.create_experiment(
+            "berth pricing",
+            "Early stopping",
+            [
+                Variant("control", "Control", VariantType.CONTROL, 0.5, {}, ""),
+                Variant("treatment", "Treatment", VariantType.TREATMENT, 0.5, {}, ""),
+            ],
+            target_metric="performance",
+            created_by="test",
+        )
+        framework.start_experiment(experiment.experiment_id)
+
+        rng = np.random.default_rng(3)
+        for _ in range(5000):
+            if experiment.status != ExperimentStatus.RUNNING:
+                break
+            framework.record_outcome(experiment.experiment_id, "control", float(rng.beta(6, 4)))
+            framework.record_outcome(experiment.experiment_id, "treatment", float(rng.beta(4, 6)))
+
+        result = framework.get_sequential_result(experiment.experiment_id)
+        assert experiment.status == ExperimentStatus.COMPLETED
+        assert result.stopped and result.winner == "control"
+        assert result.decisions == {"treatment": "loser"}
+        assert result.samples_at_stop < 1000
+        assert framework.get_statistics()["early_stopped_experiments"] == 1
+
+        analysis = framework.analyze_experiment(experiment.experiment_id)
+        assert analysis is not None
+        assert analysis.winner == "control" and analysis.statistical_significance
+        assert analysis.p_value == result.p_values["treatment"]
+        assert analysis.recommendation.startswith("Control performs best")
+
+    def test_analyze_early_stopped_winner(self):
+        """Test analyze_experiment reports a sequential winner below minimum_sample_size"""
+        np = pytest.importorskip("numpy")
+        pytest.importorskip("scipy")
+        from backend.learning.ab_testing import (
+            ABTestingFramework, ExperimentStatus, Variant, VariantType
+        )
+
+        framework = ABTestingFramework(min_sample_size=5000, sequential=True)
+        experiment = framework.create_experiment(
+            "berth pricing",
+            "Early stopping",
+            [
+                Variant("control", "Control", VariantType.CONTROL, 0.5, {}, ""),
+                Variant("treatment", "Treatment", VariantType.TREATMENT, 0.5, {}, ""),
+            ],
+            target_metric="performance",
+            created_by="test",
+        )
+        framework.start_experiment(experiment.experiment_id)
+
+        rng = np.random.default_rng(5)
+        while experiment.status == ExperimentStatus.RUNNING:
+            framework.record_outcome(experiment.experiment_id, "control", float(rng.beta(4, 6)))
+            framework.record_outcome(experiment.experiment_id, "treatment", float(rng.beta(6, 4)))
+
+        sequential = framework.get_sequential_result(experiment.experiment_id)
+        analysis = framework.analyze_experiment(experiment.experiment_id)
+
+        assert sequential.winner == "treatment"
+        assert analysis.winner == "treatment" and analysis.statistical_significance
+        assert analysis.variant_metrics["treatment"].sample_count < 5000
+        assert analysis.p_value == sequential.p_values["treatment"]
+        assert analysis.effect_size > 0.5
+        assert analysis.recommendation.startswith("Roll out variant treatment")
+        assert analysis.completed_at == sequential.stopped_at
@@ -0,0 +1,226 @@
+"""
+Test Suite for Email Notifications
+Tests pooled SMTP delivery, the background mail queue, retries and
+compiled templates
+"""
+
+import email
+import socketserver
+import threading
+
+import pytest
+
+from backend.notifications.email_service import EmailService
+from backend.notifications.templates import TemplateEngine
+from backend.services.email_service import EmailService as BookingEmailService
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough ESMTP for smtplib: EHLO/MAIL/RCPT/DATA/RSET/NOOP/QUIT"""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        self._reply("220 stub ESMTP")
+        sent_here = 0
+        mail_from, rcpts = None, []
+
+        for raw in self.rfile:
+            command = raw.decode().strip()
+            verb = command[:4].upper()
+            if verb in ("EHLO", "HELO"):
+                self._reply("250 stub")
+            elif verb == "MAIL":
+                mail_from, rcpts = command[10:].strip("<>"), []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                rcpt = command[8:].strip("<>")
+                with server.lock:
+                    deferred = server.defer_rcpt > 0
+                    server.defer_rcpt -= deferred
+                if rcpt.startswith("reject"):
+                    self._reply("550 No such user")
+                elif deferred:
+                    self._reply("451 Try again later")
+                else:
+                    rcpts.append(rcpt)
+                    self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                for data_line in self.rfile:
+                    if data_line == b".\r\n":
+                        break
+                    lines.append(data_line)
+                with server.lock:
+                    server.messages.append((mail_from, rcpts, b"".join(lines).decode()))
+                self._reply("250 Queued")
+                sent_here += 1
+                if server.messages_per_connection and sent_here >= server.messages_per_connection:
+                    return  # Drop the session, as servers with per-connection limits do
+            elif verb in ("RSET", "NOOP"):
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Not implemented")
+
+
+class _SMTPStub(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.messages = []
+        self.connections = 0
+        self.defer_rcpt = 0  # Reply 451 to the next N RCPT commands
+        self.messages_per_connection = 0  # Drop the session after N messages
+
+
+@pytest.fixture
+def smtp_stub():
+    server = _SMTPStub()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _service(smtp_stub, **kwargs) -> EmailService:
+    return EmailService(
+        smtp_host="127.0.0.1",
+        smtp_port=smtp_stub.server_address[1],
+        from_email="noreply@adamaritime.ai",
+        use_tls=False,
+        retry_backoff=0.01,
+        **kwargs
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.compliance
+class TestMailQueue:
+    """Test EmailService against a local SMTP stub"""
+
+    async def test_enqueue_reuses_pooled_connections(self, smtp_stub):
+        """Test queued mail is delivered in batches over at most pool_size sessions"""
+        service = _service(smtp_stub, pool_size=2, batch_size=10)
+
+        for i in range(30):
+            await service.enqueue_email([f"manager{i}@marina.test"], f"Alert {i}", "<p>alert</p>")
+        await service.close()
+
+        stats = service.get_queue_stats()
+        assert len(smtp_stub.messages) == 30
+        assert stats["sent"] == 30 and stats["failed"] == 0
+        assert smtp_stub.connections <= 2
+        assert stats["batches"] < 30
+
+    async def test_transient_failure_is_retried(self, smtp_stub):
+        """Test a 451 reply is retried with backoff and then delivered"""
+        service = _service(smtp_stub)
+        smtp_stub.defer_rcpt = 2
+
+        assert await service.enqueue_email(["manager@marina.test"], "Permit", "<p>ok</p>", wait=True)
+        assert service.get_queue_stats()["retries"] == 2
+        await service.close()
+
+    async def test_permanent_failure_is_not_retried(self, smtp_stub):
+        """Test a 550 reply fails the message without retries"""
+        service = _service(smtp_stub)
+
+        assert not await service.enqueue_email(["reject@marina.test"], "Permit", "<p>x</p>", wait=True)
+        stats = service.get_queue_stats()
+        assert stats["failed"] == 1 and stats["retries"] == 0
+        await service.close()
+
+    async def test_reconnects_after_server_drops_session(self, smtp_stub):
+        """Test messages interrupted by a dropped session are resent on a new one"""
+        service = _service(smtp_stub, pool_size=1, batch_size=10)
+        smtp_stub.messages_per_connection = 3
+
+        for i in range(10):
+            await service.enqueue_email([f"manager{i}@marina.test"], f"Report {i}", "<p>r</p>")
+        await service.close()
+
+        assert sorted(rcpts[0] for _, rcpts, _ in smtp_stub.messages) == sorted(
+            f"manager{i}@marina.test" for i in range(10)
+        )
+        assert smtp_stub.connections >= 4
+
+    def test_send_email_reuses_session(self, smtp_stub):
+        """Test synchronous sends share one pooled session"""
+        service = _service(smtp_stub)
+
+        assert service.send_email(["a@marina.test"], "One", "<p>1</p>", body_text="1")
+        assert service.send_email(["b@marina.test"], "Two", "<p>2</p>")
+        assert smtp_stub.connections == 1
+        assert "Subject: One" in smtp_stub.messages[0][2]
+        service.pool.close()
+
+
+@pytest.mark.unit
+@pytest.mark.compliance
+class TestEmailTemplates:
+    """Test compiled templates and bulk rendering"""
+
+    def test_template_compiled_once_per_language(self):
+        """Test languages fall back to the default and compile once"""
+        engine = TemplateEngine()
+        engine.register("greeting", "Hello {name}", "<p>Hello {name}, {count:03d}</p>")
+        engine.register("greeting", "Merhaba {name}", "<p>Merhaba {name}</p>", language="tr")
+
+        assert engine.render("greeting", {"name": "Ece", "count": 7}).html == "<p>Hello Ece, 007</p>"
+        assert engine.render("greeting", {"name": "Ece"}, language="tr").subject == "Merhaba Ece"
+        assert engine.get("greeting", "de") is engine.get("greeting", "de")
+        assert engine.get("greeting", "de").language == "en"
+
+    async def test_send_bulk_renders_and_queues(self, smtp_stub):
+        """Test send_bulk delivers one rendered message per recipient"""
+        service = _service(smtp_stub, batch_size=10)
+        recipients = [
+            (f"owner{i}@marina.test", {
+                "vessel_name": f"Vessel {i}",
+                "vessel_registration": f"TR-{i}",
+                "expiry_date": "2026-01-01",
+                "days_until_expiry": 14,
+            })
+            for i in range(25)
+        ]
+
+        message_ids = await service.send_bulk("insurance_expiry_warning", recipients)
+        await service.close()
+
+        assert len(set(message_ids)) == 25
+        assert len(smtp_stub.messages) == 25
+        delivered = {rcpts[0]: email.message_from_string(body) for _, rcpts, body in smtp_stub.messages}
+        html = delivered["owner7@marina.test"].get_payload()[-1].get_payload(decode=True).decode()
+        assert "Vessel 7" in html and "TR-7" in html
+
+    def test_booking_bulk_matches_single_render(self):
+        """Test the booking service bulk path renders the same text as single sends"""
+        service = BookingEmailService()
+        booking = {
+            "booking_id": "BK-1", "customer_name": "Ece", "boat_name": "Mavi",
+            "boat_length_meters": 12, "check_in": "2026-06-01", "check_out": "2026-06-05",
+            "total_nights": 4, "total_price_eur": 800,
+        }
+
+        service.send_booking_confirmation(booking, "ece@example.com", "Setur Kuşadası")
+        results = service.send_bulk(
+            "booking_confirmation",
+            [("ece@example.com", {**booking, "marina_name": "Setur Kuşadası"})] * 3
+        )
+
+        sent = service.get_sent_emails()
+        assert results == [True] * 3
+        assert sent[0]["subject"] == "Setur Marina Rezervasyon Onayı - BK-1"
+        assert all(email["body"] == sent[0]["body"] for email in sent)
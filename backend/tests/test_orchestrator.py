@@ -0,0 +1,745 @@
+"""
+Test Suite for Orchestrator Internals
+Tests plan execution ordering, plan caching, execution statistics,
+the background experience queue, the shared LLM client and end-to-end
+request handling
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from backend.config import get_config
+from backend.exceptions import OrchestratorError
+from backend.orchestrator.big5_orchestrator import AgentContext, Big5Orchestrator
+from backend.orchestrator.code_execution_agent import CodeExecutionAgent
+from backend.orchestrator.execution_stats import ExecutionHistory, LatencySketch, SkillStats
+from backend.orchestrator.experience_queue import ExperienceQueue
+from backend.orchestrator.plan_cache import PlanCache
+from backend.orchestrator.llm_client import create_message
+from backend.orchestrator.plan_executor import PlanExecutor
+
+
+@dataclass
+class _Result:
+    """Stand-in for Big5Orchestrator's SkillResult"""
+    skill_name: str
+    success: bool
+    data: Any
+    execution_time: float
+    timestamp: str
+    error: Optional[str] = None
+
+
+class _Skills:
+    """Fake execute_skill that records start/finish order and honours timeouts"""
+
+    def __init__(self, durations: Optional[Dict[str, float]] = None, failing: tuple = ()):
+        self.durations = durations or {}
+        self.failing = failing
+        self.events: List[str] = []
+        self.timeouts: Dict[str, Optional[float]] = {}
+
+    async def execute(self, skill_name: str, params: Dict[str, Any], context: Any,
+                      timeout: Optional[float] = None) -> _Result:
+        self.timeouts[skill_name] = timeout
+        self.events.append(f"start:{skill_name}")
+        try:
+            await asyncio.wait_for(asyncio.sleep(self.durations.get(skill_name, 0.01)), timeout)
+        except asyncio.TimeoutError:
+            self.events.append(f"timeout:{skill_name}")
+            return _Result(skill_name, False, None, 0.0, datetime.now().isoformat(), "timed out")
+        self.events.append(f"end:{skill_name}")
+        success = skill_name not in self.failing
+        return _Result(skill_name, success, params, 0.0, datetime.now().isoformat(),
+                       None if success else "failed")
+
+
+def _executor(skills: _Skills, **kwargs) -> PlanExecutor:
+    return PlanExecutor(execute_skill=skills.execute, result_factory=_Result, **kwargs)
+
+
+@pytest.mark.unit
+class TestPlanExecutor:
+    """Test dependency and priority ordering of execution plans"""
+
+    async def test_priority_tiers_run_in_order(self):
+        """Test each priority tier starts only after lower tiers finish"""
+        skills = _Skills()
+        steps = [
+            {"skill_name": "notify", "priority": 3},
+            {"skill_name": "weather", "priority": 1},
+            {"skill_name": "berths", "priority": 1},
+            {"skill_name": "book", "priority": 2},
+        ]
+
+        results = await _executor(skills).run(steps, context=None)
+
+        assert [r.skill_name for r in results] == ["notify", "weather", "berths", "book"]
+        events = skills.events
+        assert events.index("start:book") > max(events.index("end:weather"), events.index("end:berths"))
+        assert events.index("start:notify") > events.index("end:book")
+        # Steps of one tier run concurrently
+        assert events.index("start:berths") < events.index("end:weather")
+
+    async def test_depends_on_overrides_priority(self):
+        """Test an explicit depends_on replaces the implicit tier ordering"""
+        skills = _Skills(durations={"slow": 0.1})
+        steps = [
+            {"id": "a", "skill_name": "slow", "priority": 1},
+            {"id": "b", "skill_name": "fast", "priority": 2, "depends_on": []},
+            {"id": "c", "skill_name": "after", "priority": 3, "depends_on": ["b"]},
+        ]
+
+        executor = _executor(skills)
+        assert executor.build_graph(steps) == [[], [], [1]]
+
+        await executor.run(steps, context=None)
+        assert skills.events.index("end:after") < skills.events.index("end:slow")
+
+    def test_cycle_is_rejected(self):
+        """Test a dependency cycle raises OrchestratorError"""
+        steps = [
+            {"id": "a", "skill_name": "x", "depends_on": ["b"]},
+            {"id": "b", "skill_name": "y", "depends_on": ["a"]},
+        ]
+        with pytest.raises(OrchestratorError):
+            _executor(_Skills()).build_graph(steps)
+
+    def test_unknown_dependency_is_rejected(self):
+        """Test a reference to a missing step raises OrchestratorError"""
+        with pytest.raises(OrchestratorError):
+            _executor(_Skills()).build_graph([{"skill_name": "x", "depends_on": ["nope"]}])
+
+    def test_implicit_tiers_do_not_create_cycles(self):
+        """Test a lower tier explicitly waiting for a higher one is not made circular"""
+        steps = [
+            {"id": "early", "skill_name": "x", "priority": 1, "depends_on": ["late"]},
+            {"id": "late", "skill_name": "y", "priority": 2},
+        ]
+        assert _executor(_Skills()).build_graph(steps) == [[1], []]
+
+    async def test_failed_dependency_skips_dependents(self):
+        """Test dependents of a failed step are skipped, unrelated steps still run"""
+        skills = _Skills(failing=("lookup",))
+        steps = [
+            {"id": "lookup", "skill_name": "lookup", "depends_on": []},
+            {"id": "book", "skill_name": "book", "depends_on": ["lookup"]},
+            {"id": "weather", "skill_name": "weather", "depends_on": []},
+        ]
+
+        lookup, book, weather = await _executor(skills).run(steps, context=None)
+
+        assert not lookup.success
+        assert not book.success and "dependency 'lookup' failed" in book.error
+        assert "start:book" not in skills.events
+        assert weather.success
+
+    async def test_missing_skill_name_fails_step(self):
+        """Test a step without skill_name yields a failed result instead of raising"""
+        skills = _Skills()
+        results = await _executor(skills).run(
+            [{"params": {}}, {"skill_name": "weather"}], context=None
+        )
+
+        assert not results[0].success and "no skill_name" in results[0].error
+        assert results[1].success
+
+    async def test_step_timeout_overrides_default(self):
+        """Test per-step timeouts reach execute_skill and a timeout skips dependents"""
+        skills = _Skills(durations={"slow": 1.0})
+        steps = [
+            {"id": "slow", "skill_name": "slow", "timeout": 0.05, "depends_on": []},
+            {"id": "next", "skill_name": "next", "depends_on": ["slow"]},
+            {"id": "quick", "skill_name": "quick", "depends_on": []},
+        ]
+
+        slow, after, quick = await _executor(skills, skill_timeout_seconds=5.0).run(steps, context=None)
+
+        assert skills.timeouts == {"slow": 0.05, "quick": 5.0}
+        assert not slow.success and "timeout:slow" in skills.events
+        assert not after.success
+        assert quick.success
+
+    async def test_mixed_priority_types_are_coerced(self):
+        """Test str, int, None and junk priorities sort instead of raising TypeError"""
+        skills = _Skills()
+        steps = [
+            {"skill_name": "late", "priority": "3"},
+            {"skill_name": "first", "priority": 0},
+            {"skill_name": "default", "priority": None},
+            {"skill_name": "junk", "priority": "urgent"},
+            {"skill_name": "second", "priority": 2.0},
+        ]
+
+        results = await _executor(skills).run(steps, context=None)
+
+        assert all(r.success for r in results)
+        starts = [e.split(":")[1] for e in skills.events if e.startswith("start:")]
+        assert starts[0] == "first"
+        assert set(starts[1:3]) == {"default", "junk"}
+        assert starts[3:] == ["second", "late"]
+
+    @pytest.mark.parametrize("timeout", ["soon", -1, 0, float("nan"), True, [5]])
+    async def test_invalid_step_timeout_uses_default(self, timeout):
+        """Test a non-positive or non-numeric step timeout falls back to the default"""
+        skills = _Skills()
+        steps = [{"skill_name": "weather", "timeout": timeout}, {"skill_name": "tides", "timeout": "2.5"}]
+
+        results = await _executor(skills, skill_timeout_seconds=5.0).run(steps, context=None)
+
+        assert all(r.success for r in results)
+        assert skills.timeouts == {"weather": 5.0, "tides": 2.5}
+
+
+PLAN = {"intent": "list berths", "skills_to_execute": [{"skill_name": "berth_management", "params": {}}]}
+
+
+@pytest.mark.unit
+class TestPlanCache:
+    """Test plan cache keys, expiry and eviction"""
+
+    def test_hit_for_equivalent_request(self):
+        """Test case, whitespace and trailing punctuation share a plan"""
+        cache = PlanCache()
+        cache.put("List berths at  Kalamış!", "tr", 1, PLAN, marina_id="kalamis")
+
+        plan = cache.get("list berths at KALAMIŞ", "tr", 1, marina_id="kalamis")
+        assert plan == PLAN
+        plan["intent"] = "mutated"
+        assert cache.get("list berths at kalamış", "tr", 1, marina_id="kalamis") == PLAN
+        assert cache.get_stats()["hits"] == 2
+
+    def test_miss_on_different_context(self):
+        """Test marina, language and skill-registry version are part of the key"""
+        cache = PlanCache()
+        cache.put("list berths", "tr", 1, PLAN, marina_id="kalamis")
+
+        assert cache.get("list berths", "tr", 1, marina_id="bodrum") is None
+        assert cache.get("list berths", "tr", 1) is None
+        assert cache.get("list berths", "en", 1, marina_id="kalamis") is None
+        assert cache.get("list berths", "tr", 2, marina_id="kalamis") is None
+        assert cache.get_stats()["misses"] == 4
+
+    def test_entries_expire_after_ttl(self):
+        """Test a plan older than the TTL is a miss"""
+        cache = PlanCache(ttl_seconds=0.05)
+        cache.put("list berths", "tr", 1, PLAN)
+        assert cache.get("list berths", "tr", 1) is not None
+
+        time.sleep(0.06)
+        assert cache.get("list berths", "tr", 1) is None
+        assert cache.get_stats()["expirations"] == 1
+
+    @pytest.mark.parametrize("request_text", [
+        "Show today's arrivals", "Yarın için yer var mı?", "bu akşam kalkan tekneler",
+    ])
+    def test_date_relative_plans_expire_at_midnight(self, request_text):
+        """Test date-relative requests never outlive the day they were planned"""
+        cache = PlanCache(ttl_seconds=3600.0)
+        assert cache.entry_ttl(request_text, now=datetime(2030, 5, 1, 23, 30)) == 1800.0
+        assert cache.entry_ttl(request_text, now=datetime(2030, 5, 1, 9, 0)) == 3600.0
+        assert cache.entry_ttl("list berths at Kalamış", now=datetime(2030, 5, 1, 23, 30)) == 3600.0
+
+    def test_lru_eviction(self):
+        """Test the least recently used plan is evicted at max_size"""
+        cache = PlanCache(max_size=2)
+        cache.put("a", "tr", 1, PLAN)
+        cache.put("b", "tr", 1, PLAN)
+        assert cache.get("a", "tr", 1) is not None  # "b" is now least recently used
+        cache.put("c", "tr", 1, PLAN)
+
+        assert cache.get("b", "tr", 1) is None
+        assert cache.get("a", "tr", 1) is not None
+        assert cache.get("c", "tr", 1) is not None
+        assert cache.get_stats()["evictions"] == 1
+
+
+def _result(skill_name: str, execution_time: float, success: bool = True, error: Optional[str] = None) -> _Result:
+    return _Result(skill_name, success, None, execution_time, datetime.now().isoformat(), error)
+
+
+@pytest.mark.unit
+class TestExecutionStats:
+    """Test the latency sketch, per-skill aggregates and bounded history"""
+
+    def test_empty_sketch_has_no_quantiles(self):
+        """Test an empty sketch reports None"""
+        assert LatencySketch().quantile(0.5) is None
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_quantiles_within_relative_accuracy(self, seed):
+        """Test quantiles stay within relative_accuracy of the exact values"""
+        rng = random.Random(seed)
+        values = [rng.lognormvariate(-2, 1.5) for _ in range(5000)]
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        ordered = sorted(values)
+        for q in (0.0, 0.25, 0.5, 0.9, 0.95, 0.99, 1.0):
+            exact = ordered[int(q * (len(ordered) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.01)
+
+    def test_values_below_min_value_count_as_zero(self):
+        """Test sub-min_value samples fill the low ranks with 0.0"""
+        sketch = LatencySketch(min_value=1e-3)
+        for value in (0.0, 1e-4, 0.5, 0.5):
+            sketch.add(value)
+
+        assert sketch.zero_count == 2
+        assert sketch.quantile(0.0) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(0.5, rel=0.01)
+
+    def test_skill_stats_aggregates(self):
+        """Test SkillStats counts, timings and last error"""
+        stats = SkillStats()
+        assert stats.to_dict()["min_seconds"] == 0.0
+        assert stats.to_dict()["p50_seconds"] is None
+
+        stats.record(True, 0.2)
+        stats.record(False, 0.4, "timeout")
+        stats.record(True, 0.3)
+
+        summary = stats.to_dict()
+        assert summary["count"] == 3
+        assert summary["successes"] == 2
+        assert summary["failures"] == 1
+        assert summary["success_rate"] == pytest.approx(2 / 3)
+        assert summary["avg_seconds"] == pytest.approx(0.3)
+        assert summary["min_seconds"] == 0.2
+        assert summary["max_seconds"] == 0.4
+        assert summary["p50_seconds"] == pytest.approx(0.3, rel=0.01)
+        assert summary["last_error"] == "timeout"
+
+    def test_history_keeps_only_capacity_results(self):
+        """Test the buffer drops the oldest results but aggregates keep them"""
+        history = ExecutionHistory(capacity=3)
+        for i in range(5):
+            history.append(_result("berth_management" if i % 2 else "weather", 0.1 * (i + 1)))
+
+        assert len(history) == 3
+        assert [r.execution_time for r in history] == pytest.approx([0.3, 0.4, 0.5])
+
+        stats = history.get_skill_stats()
+        assert stats["total"]["count"] == 5
+        assert stats["skills"]["weather"]["count"] == 3
+        assert stats["skills"]["berth_management"]["count"] == 2
+        assert stats["buffered"] == 3
+        assert stats["capacity"] == 3
+        assert history.get_skill_stats("weather")["min_seconds"] == pytest.approx(0.1)
+        assert history.get_skill_stats("unknown")["count"] == 0
+
+    def test_recent_returns_newest_oldest_first(self):
+        """Test recent() limits, ordering and the [-limit:] semantics for limit <= 0"""
+        history = ExecutionHistory(capacity=4)
+        results = [_result("weather", 0.1) for _ in range(6)]
+        for result in results:
+            history.append(result)
+
+        assert history.recent(2) == results[4:]
+        assert history.recent(10) == results[2:]
+        assert history.recent(0) == results[2:]
+        assert history.recent(-1) == results[3:]
+
+    def test_clear_resets_buffer_and_aggregates(self):
+        """Test clear() drops buffered results and statistics"""
+        history = ExecutionHistory(capacity=3)
+        history.append(_result("weather", 0.1, success=False, error="down"))
+        history.clear()
+
+        assert len(history) == 0
+        assert history.recent() == []
+        stats = history.get_skill_stats()
+        assert stats["total"]["count"] == 0
+        assert stats["skills"] == {}
+
+
+class _Batches:
+    """process_batch stand-in that records batches and can be held at a gate"""
+
+    def __init__(self, fail: bool = False):
+        self.batches: List[List[int]] = []
+        self.called_at: List[float] = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fail = fail
+
+    def __call__(self, batch: List[int]) -> None:
+        self.called_at.append(time.monotonic())
+        self.gate.wait(5)
+        self.batches.append(list(batch))
+        if self.fail:
+            raise RuntimeError("learning failed")
+
+    @property
+    def items(self) -> List[int]:
+        return [item for batch in self.batches for item in batch]
+
+
+def _accounted(queue: ExperienceQueue) -> bool:
+    stats = queue.get_stats()
+    return stats["submitted"] == (
+        stats["processed"] + stats["failed"] + stats["dropped"] + stats["pending"]
+    )
+
+
+async def _wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        await asyncio.sleep(0.005)
+
+
+@pytest.mark.unit
+class TestExperienceQueue:
+    """Test overflow policies, micro-batching and shutdown accounting"""
+
+    async def test_drop_oldest_keeps_newest(self):
+        """Test a full queue discards its oldest items"""
+        process = _Batches()
+        queue = ExperienceQueue(process, max_size=3, overflow_policy="drop_oldest")
+
+        accepted = [await queue.put(i) for i in range(5)]
+        await queue.close()
+
+        assert accepted == [True] * 5
+        assert process.items == [2, 3, 4]
+        assert queue.dropped == 2 and _accounted(queue)
+
+    async def test_drop_newest_rejects_incoming(self):
+        """Test a full queue rejects new items"""
+        process = _Batches()
+        queue = ExperienceQueue(process, max_size=3, overflow_policy="drop_newest")
+
+        accepted = [await queue.put(i) for i in range(5)]
+        await queue.close()
+
+        assert accepted == [True, True, True, False, False]
+        assert process.items == [0, 1, 2]
+        assert queue.dropped == 2 and _accounted(queue)
+
+    async def test_block_applies_back_pressure_then_drops(self):
+        """Test "block" waits for space up to put_timeout, then drops the item"""
+        process = _Batches()
+        process.gate.clear()
+        queue = ExperienceQueue(
+            process, max_size=2, batch_size=1, max_batch_delay=0.0,
+            overflow_policy="block", put_timeout=0.05
+        )
+
+        await queue.put(0)
+        await _wait_until(lambda: process.called_at)  # Consumer holds item 0
+        assert await queue.put(1) and await queue.put(2)
+
+        started = time.monotonic()
+        assert not await queue.put(3)
+        assert time.monotonic() - started >= 0.04
+
+        process.gate.set()
+        await queue.close()
+        assert process.items == [0, 1, 2]
+        assert queue.dropped == 1 and _accounted(queue)
+
+    async def test_batches_are_capped_at_batch_size(self):
+        """Test items queued together are processed in batches of at most batch_size"""
+        process = _Batches()
+        queue = ExperienceQueue(process, batch_size=4, max_batch_delay=0.05)
+
+        for i in range(10):
+            await queue.put(i)
+        await queue.flush()
+
+        assert [len(b) for b in process.batches] == [4, 4, 2]
+        assert process.items == list(range(10))
+        await queue.close()
+
+    async def test_partial_batch_waits_for_stragglers(self):
+        """Test a partial batch waits up to max_batch_delay, a full one does not"""
+        process = _Batches()
+        queue = ExperienceQueue(process, batch_size=2, max_batch_delay=0.1)
+
+        started = time.monotonic()
+        await queue.put(0)
+        await queue.flush()
+        assert process.called_at[0] - started >= 0.09
+
+        started = time.monotonic()
+        await queue.put(1)
+        await queue.put(2)
+        await queue.flush()
+        assert process.called_at[1] - started < 0.09
+        assert process.batches == [[0], [1, 2]]
+        await queue.close()
+
+    async def test_flush_processes_everything(self):
+        """Test flush returns once every queued item is processed"""
+        process = _Batches()
+        queue = ExperienceQueue(process, batch_size=8, max_batch_delay=0.01)
+
+        for i in range(20):
+            await queue.put(i)
+        await queue.flush()
+
+        assert queue.processed == 20
+        assert queue.get_stats()["pending"] == 0 and _accounted(queue)
+        await queue.close()
+
+    async def test_close_without_flush_discards_queued_items(self):
+        """Test close(flush=False) drops queued items but finishes the batch in progress"""
+        process = _Batches()
+        process.gate.clear()
+        queue = ExperienceQueue(process, batch_size=1, max_batch_delay=0.0)
+
+        for i in range(5):
+            await queue.put(i)
+        await _wait_until(lambda: process.called_at)  # Item 0 is in the worker thread
+
+        threading.Timer(0.05, process.gate.set).start()
+        await queue.close(flush=False)
+
+        assert process.items == [0]
+        assert queue.processed == 1 and queue.dropped == 4
+        assert queue.get_stats()["pending"] == 0 and _accounted(queue)
+        assert not await queue.put(5)
+        assert queue.dropped == 5 and _accounted(queue)
+
+    async def test_failing_batch_is_counted_and_consumer_continues(self):
+        """Test an exception in process_batch marks the batch failed, later batches still run"""
+        process = _Batches(fail=True)
+        queue = ExperienceQueue(process, batch_size=2, max_batch_delay=0.0)
+
+        await queue.put(0)
+        await queue.flush()
+        process.fail = False
+        await queue.put(1)
+        await queue.flush()
+
+        assert queue.failed == 1 and queue.processed == 1
+        assert queue.batches == 2 and _accounted(queue)
+        await queue.close()
+
+
+class _Message:
+    """Minimal anthropic Message: ``content[0].text``"""
+
+    def __init__(self, text: str):
+        self.content = [type("TextBlock", (), {"text": text})()]
+
+
+class _AsyncClient:
+    """Fake AsyncAnthropic whose messages.create returns a fixed reply"""
+
+    def __init__(self, reply: str = "{}", delay: float = 0.0):
+        self.reply = reply
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.messages = self
+
+    async def create(self, **kwargs: Any) -> _Message:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return _Message(self.reply)
+
+
+class _Skill:
+    """Skill handler that records when it ran"""
+
+    def __init__(self, name: str, events: List[str], duration: float = 0.02):
+        self.name = name
+        self.description = f"{name} test skill"
+        self.events = events
+        self.duration = duration
+
+    async def execute(self, params: Dict[str, Any], context: Any) -> Dict[str, Any]:
+        self.events.append(f"start:{self.name}")
+        await asyncio.sleep(self.duration)
+        self.events.append(f"end:{self.name}")
+        return {"skill": self.name, **params}
+
+
+MULTI_STEP_PLAN = {
+    "intent": "book a berth",
+    "skills_to_execute": [
+        {"id": "berths", "skill_name": "berth_management", "params": {"length": 12}, "priority": 1},
+        {"id": "weather", "skill_name": "weather", "params": {}, "priority": 1},
+        {"id": "price", "skill_name": "pricing", "params": {}, "depends_on": ["berths", "weather"]},
+    ],
+    "response_language": "en",
+}
+
+
+@pytest.mark.unit
+class TestBig5Orchestrator:
+    """Test handle_request end to end with a stubbed LLM client"""
+
+    @staticmethod
+    def _orchestrator(reply: Dict[str, Any], events: List[str]):
+        orchestrator = Big5Orchestrator(api_key="test-key")
+        orchestrator.client = _AsyncClient(json.dumps(reply))
+        for name in ("berth_management", "weather", "pricing"):
+            orchestrator.register_skill(name, _Skill(name, events))
+        context = AgentContext(user_id="u1", session_id="s1", marina_id="setur-kalamis", language="en")
+        return orchestrator, context
+
+    async def test_handle_request_runs_multi_step_plan(self):
+        """Test a plan runs along its DAG, is cached and feeds stats and learning"""
+        events: List[str] = []
+        orchestrator, context = self._orchestrator(MULTI_STEP_PLAN, events)
+
+        response = await orchestrator.handle_request("Book a 12m berth", context)
+
+        assert response["success"] and response["intent"] == "book a berth"
+        assert [r["skill_name"] for r in response["results"]] == ["berth_management", "weather", "pricing"]
+        assert response["results"][0]["data"] == {"skill": "berth_management", "length": 12}
+        assert events.index("start:weather") < events.index("end:berth_management")
+        assert events.index("start:pricing") > max(
+            events.index("end:berth_management"), events.index("end:weather")
+        )
+
+        await orchestrator.handle_request("Book a 12m berth", context)
+        assert orchestrator.client.calls == 1
+        assert orchestrator.get_plan_cache_stats()["hits"] == 1
+        assert orchestrator.get_skill_stats()["total"]["count"] == 6
+        assert len(orchestrator.get_execution_history(limit=4)) == 4
+
+        await orchestrator.shutdown()
+        stats = orchestrator.get_experience_queue_stats()
+        assert stats["submitted"] == 6 and stats["processed"] == 6
+
+    async def test_unknown_skill_fails_and_skips_dependents(self):
+        """Test a step naming an unregistered skill fails and its dependents are skipped"""
+        plan = {
+            "intent": "broken",
+            "skills_to_execute": [
+                {"id": "a", "skill_name": "missing", "params": {}},
+                {"id": "b", "skill_name": "pricing", "params": {}, "depends_on": ["a"]},
+            ],
+        }
+        events: List[str] = []
+        orchestrator, context = self._orchestrator(plan, events)
+
+        response = await orchestrator.handle_request("price it", context)
+
+        assert not response["success"]
+        assert "not found" in response["results"][0]["error"]
+        assert response["results"][1]["error"].startswith("Skipped")
+        assert events == []
+        await orchestrator.shutdown()
+
+    async def test_slow_llm_raises_orchestrator_error(self, monkeypatch):
+        """Test the LLM timeout surfaces as OrchestratorError from handle_request"""
+        monkeypatch.setattr(get_config().api, "llm_timeout_seconds", 0.05)
+        orchestrator, context = self._orchestrator(MULTI_STEP_PLAN, [])
+        orchestrator.client.delay = 1.0
+
+        with pytest.raises(OrchestratorError, match="timed out"):
+            await orchestrator.handle_request("Book a 12m berth", context)
+        await orchestrator.shutdown()
+
+
+    async def test_execute_skill_timeouts(self):
+        """Test only the skill deadline is reported as a timeout"""
+        orchestrator, context = self._orchestrator(MULTI_STEP_PLAN, [])
+
+        class _RaisesTimeout:
+            description = "raises its own TimeoutError"
+
+            async def execute(self, params, context):
+                raise TimeoutError("upstream AIS feed timed out")
+
+        orchestrator.register_skill("ais", _RaisesTimeout())
+        orchestrator.skills["weather"].duration = 1.0
+
+        own = await orchestrator.execute_skill("ais", {}, context, timeout=5.0)
+        expired = await orchestrator.execute_skill("weather", {}, context, timeout=0.05)
+        unlimited = await orchestrator.execute_skill("pricing", {}, context, timeout=None)
+        own_unlimited = await orchestrator.execute_skill("ais", {}, context, timeout=None)
+
+        assert not own.success and own.error == "upstream AIS feed timed out"
+        assert not expired.success and expired.error == "Skill 'weather' timed out after 0.05s"
+        assert unlimited.success
+        assert not own_unlimited.success and own_unlimited.error == "upstream AIS feed timed out"
+        await orchestrator.shutdown()
+
+@pytest.mark.unit
+class TestLLMClient:
+    """Test the shared concurrency limit and timeout of create_message"""
+
+    async def test_concurrency_is_capped(self, monkeypatch):
+        """Test no more than llm_max_concurrency requests are in flight"""
+        monkeypatch.setattr(get_config().api, "llm_max_concurrency", 2)
+        client = _AsyncClient("ok", delay=0.05)
+
+        replies = await asyncio.gather(*(create_message(client, timeout=5.0) for _ in range(6)))
+
+        assert [r.content[0].text for r in replies] == ["ok"] * 6
+        assert client.calls == 6
+        assert client.max_in_flight == 2
+
+    async def test_timeout_raises_orchestrator_error(self):
+        """Test a request exceeding the timeout is cancelled and reported"""
+        client = _AsyncClient("late", delay=1.0)
+
+        started = time.monotonic()
+        with pytest.raises(OrchestratorError, match="timed out after 0.05s"):
+            await create_message(client, timeout=0.05)
+
+        assert time.monotonic() - started < 0.5
+        assert client.in_flight == 0
+
+    async def test_queueing_time_counts_towards_timeout(self, monkeypatch):
+        """Test a request stuck behind the limit times out as well"""
+        monkeypatch.setattr(get_config().api, "llm_max_concurrency", 1)
+        client = _AsyncClient("ok", delay=0.2)
+
+        slow = asyncio.ensure_future(create_message(client, timeout=5.0))
+        await asyncio.sleep(0.01)
+        with pytest.raises(OrchestratorError, match="timed out"):
+            await create_message(client, timeout=0.05)
+
+        assert (await slow).content[0].text == "ok"
+        assert client.calls == 1
+
+
+@pytest.mark.unit
+class TestCodeExecutionAgent:
+    """Test the async code-generation loop of CodeExecutionAgent"""
+
+    async def test_execute_task_runs_generated_code(self):
+        """Test generated code is executed and its result returned"""
+        agent = CodeExecutionAgent()
+        agent.client = _AsyncClient("```python\nresult = {'berths': 2 + 3}\n```")
+
+        outcome = await agent.execute_task({"query": "count free berths"})
+
+        assert outcome["success"] and outcome["type"] == "code_execution"
+        assert outcome["result"] == {"berths": 5}
+        assert outcome["iterations"] == 1
+        assert agent.client.calls == 1
+
+    async def test_execute_task_returns_text_reply(self):
+        """Test a reply without code is returned as text"""
+        agent = CodeExecutionAgent()
+        agent.client = _AsyncClient("All berths are free.")
+
+        outcome = await agent.execute_task({"query": "any berths?"})
+
+        assert outcome == {
+            "success": True, "type": "text", "content": "All berths are free.",
+            "iterations": 1, "total_tokens_saved": outcome["total_tokens_saved"],
+        }
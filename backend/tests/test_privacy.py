@@ -0,0 +1,177 @@
+"""
+Test Suite for Privacy Audit Log
+Tests group-commit writes, read-your-writes queries and retention
+"""
+
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+from backend.privacy.audit_log import AuditEntry, AuditEventType, AuditLog, AuditWriteError
+
+
+def _access_entry() -> AuditEntry:
+    return AuditEntry(
+        event_type=AuditEventType.DATA_ACCESS, timestamp=time.time(), destination="creator",
+        data_type="logs", captain_id="captain_1", authorization_method="token", result="read",
+    )
+
+
+@pytest.fixture
+def audit_log(tmp_path):
+    log = AuditLog(db_path=str(tmp_path / "audit.db"))
+    yield log
+    log.close()
+
+
+@pytest.mark.unit
+@pytest.mark.compliance
+class TestAuditLog:
+    """Test AuditLog batching and reader path"""
+
+    def test_entries_visible_after_logging(self, audit_log):
+        """Test queries see entries still waiting in the writer queue"""
+        entry = audit_log.log_transfer(
+            "marina_bodrum", "vessel_position", "captain_1", "explicit", "sent", data={"lat": 37.03}
+        )
+
+        assert [e.entry_id for e in audit_log.query(captain_id="captain_1")] == [entry.entry_id]
+        assert audit_log.verify_integrity(entry.entry_id, {"lat": 37.03})
+        assert audit_log.get_summary("captain_1")["total_transfers"] == 1
+
+    def test_concurrent_writers_share_commits(self, audit_log):
+        """Test entries from several threads are grouped into fewer transactions"""
+        def log_requests(thread_id: int):
+            for i in range(100):
+                audit_log.log_request(f"marina_{i % 3}", "arrival_time", f"captain_{thread_id}_{i}")
+
+        threads = [threading.Thread(target=log_requests, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        audit_log.flush()
+
+        assert audit_log.stats["entries_written"] == 400
+        assert audit_log.stats["commits"] < 400
+        assert len(audit_log.query(limit=1000)) == 400
+
+    def test_duplicate_entry_does_not_drop_batch(self, audit_log):
+        """Test a rejected row leaves the rest of its group committed"""
+        entry = _access_entry()
+        audit_log._store_entry(entry)
+        audit_log._store_entry(entry)
+        audit_log.log_request("marina_bodrum", "berth", "captain_1")
+        with pytest.raises(AuditWriteError) as excinfo:
+            audit_log.flush()
+
+        assert [entry_id for entry_id, _ in excinfo.value.failures] == [entry.entry_id]
+        assert audit_log.stats["failed_writes"] == 1
+        assert len(audit_log.query(captain_id="captain_1")) == 2
+        audit_log.flush()  # Reported once
+
+    def test_failed_write_raises_on_next_log(self, audit_log):
+        """Test a row that failed after log_* returned is raised by the next log_* call"""
+        entry = _access_entry()
+        audit_log._store_entry(entry)
+        audit_log._store_entry(entry)
+        audit_log._drain()
+
+        with pytest.raises(AuditWriteError, match=entry.entry_id):
+            audit_log.log_request("marina_bodrum", "berth", "captain_1")
+        audit_log.log_request("marina_bodrum", "berth", "captain_1")
+        audit_log.flush()
+
+    def test_full_durability_raises_failed_write(self, tmp_path):
+        """Test log_* in "full" mode raises when its own row is rejected"""
+        with AuditLog(db_path=str(tmp_path / "full.db"), durability="full") as log:
+            entry = _access_entry()
+            log._store_entry(entry)
+            with pytest.raises(AuditWriteError, match=entry.entry_id):
+                log._store_entry(entry)
+            log.flush()  # Already reported to the caller
+
+    def test_dropped_log_is_collected_and_committed(self, tmp_path):
+        """Test an unreferenced AuditLog is collected and its queued entries still committed"""
+        log = AuditLog(db_path=str(tmp_path / "dropped.db"), flush_interval=1.0)
+        entry = log.log_request("marina_bodrum", "berth", "captain_1")
+        writer = log._writer
+        ref = weakref.ref(log)
+        del log
+        gc.collect()
+
+        assert ref() is None
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+        with AuditLog(db_path=str(tmp_path / "dropped.db")) as reopened:
+            assert reopened.get_entry(entry.entry_id) is not None
+
+    def test_delete_old_entries(self, audit_log):
+        """Test retention deletes only entries past the cutoff"""
+        old = AuditEntry(
+            event_type=AuditEventType.DATA_TRANSFER, timestamp=time.time() - 400 * 86400,
+            destination="marina_bodrum", data_type="position", captain_id="captain_1",
+            authorization_method="explicit", result="sent",
+        )
+        audit_log._store_entry(old)
+        audit_log.log_request("marina_bodrum", "berth", "captain_1")
+
+        assert audit_log.delete_old_entries(days=365) == 1
+        assert audit_log.get_entry(old.entry_id) is None
+
+    def test_full_durability_returns_after_commit(self, tmp_path):
+        """Test log_* in "full" mode returns only once the row is in the database"""
+        with AuditLog(db_path=str(tmp_path / "full.db"), durability="full") as log:
+            entry = log.log_request("marina_bodrum", "berth", "captain_1")
+            assert log.stats["entries_written"] == 1
+            assert log.get_entry(entry.entry_id) is not None
+
+    def test_full_durability_times_out_on_stuck_writer(self, tmp_path):
+        """Test a commit that never happens raises instead of blocking forever"""
+        log = AuditLog(db_path=str(tmp_path / "stuck.db"), durability="full", commit_timeout=0.2)
+        try:
+            with log._write_lock:  # The writer cannot commit while this is held
+                started = time.monotonic()
+                with pytest.raises(TimeoutError):
+                    log.log_request("marina_bodrum", "berth", "captain_1")
+                assert time.monotonic() - started < 2.0
+        finally:
+            log.close()
+
+    def test_dead_writer_fails_fast(self, audit_log):
+        """Test logging raises once the writer thread has stopped"""
+        audit_log._queue.put(None)
+        audit_log._writer.join(timeout=5)
+
+        with pytest.raises(RuntimeError):
+            audit_log.log_request("marina_bodrum", "berth", "captain_1")
+
+    def test_close_races_with_loggers(self, tmp_path):
+        """Test entries logged during close() are either committed or rejected, never lost"""
+        log = AuditLog(db_path=str(tmp_path / "race.db"), durability="full")
+        accepted: list = []
+        rejected: list = []
+
+        def log_requests(thread_id: int):
+            for i in range(200):
+                try:
+                    accepted.append(log.log_request("marina_bodrum", "berth", f"c{thread_id}_{i}").entry_id)
+                except RuntimeError:
+                    rejected.append(i)
+                    return
+
+        threads = [threading.Thread(target=log_requests, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        time.sleep(0.02)
+        log.close()
+        for t in threads:
+            t.join(timeout=10)
+            assert not t.is_alive()
+
+        with AuditLog(db_path=str(tmp_path / "race.db")) as reopened:
+            stored = {e.entry_id for e in reopened.query(limit=10_000)}
+        assert stored == set(accepted)
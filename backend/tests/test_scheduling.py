@@ -0,0 +1,96 @@
+"""
+Test Suite for Gate Scheduling
+Tests sort-and-sweep overlap detection and the conflict resolution skill
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+from backend.skills.conflict_resolution_skill import ConflictResolutionSkill
+from backend.utils.intervals import find_overlap_clusters
+
+
+BASE = datetime(2030, 1, 1)
+
+
+def _interval(start_min: int, end_min: int, vessel_id: str) -> Tuple[datetime, datetime, str]:
+    return BASE + timedelta(minutes=start_min), BASE + timedelta(minutes=end_min), vessel_id
+
+
+def _pairwise_components(intervals: List[Tuple[datetime, datetime, str]]) -> Set[frozenset]:
+    """Connected components (size >= 2) of the pairwise overlap graph"""
+    parent: Dict[str, str] = {v: v for _, _, v in intervals}
+
+    def root(v: str) -> str:
+        while parent[v] != v:
+            v = parent[v]
+        return v
+
+    for i, (start, end, vessel) in enumerate(intervals):
+        for other_start, other_end, other in intervals[:i]:
+            if start < other_end and end > other_start:
+                parent[root(vessel)] = root(other)
+
+    groups: Dict[str, Set[str]] = {}
+    for _, _, vessel in intervals:
+        groups.setdefault(root(vessel), set()).add(vessel)
+    return {frozenset(g) for g in groups.values() if len(g) > 1}
+
+
+@pytest.mark.unit
+class TestFindOverlapClusters:
+    """Test find_overlap_clusters against the pairwise check"""
+
+    def test_touching_intervals_do_not_overlap(self):
+        """Test one stay ending as the next starts is not a conflict"""
+        intervals = [_interval(0, 60, "V1"), _interval(60, 120, "V2")]
+        assert find_overlap_clusters(intervals) == []
+
+    def test_chain_merges_into_one_cluster(self):
+        """Test transitively overlapping stays form a single cluster"""
+        intervals = [_interval(100, 160, "V3"), _interval(0, 60, "V1"), _interval(50, 110, "V2")]
+        assert find_overlap_clusters(intervals) == [
+            (BASE, BASE + timedelta(minutes=160), ["V1", "V2", "V3"])
+        ]
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_pairwise_check(self, seed):
+        """Test clusters equal the components of the pairwise overlap graph"""
+        rng = random.Random(seed)
+        intervals = []
+        for i in range(300):
+            start = rng.randrange(7 * 24 * 60)
+            intervals.append(_interval(start, start + rng.randrange(30, 240), f"V{i:04d}"))
+
+        clusters = find_overlap_clusters(intervals)
+
+        assert {frozenset(ids) for _, _, ids in clusters} == _pairwise_components(intervals)
+        by_id = {v: (s, e) for s, e, v in intervals}
+        for start, end, ids in clusters:
+            assert start == min(by_id[v][0] for v in ids)
+            assert end == max(by_id[v][1] for v in ids)
+
+
+@pytest.mark.unit
+class TestConflictResolutionSkill:
+    """Test gate conflict detection in the skill"""
+
+    async def test_detect_gate_conflicts(self):
+        """Test overlapping assignments on one gate produce one conflict"""
+        assignments = [
+            {"vessel_id": "V1", "gate_id": "G1",
+             "scheduled_arrival": "2030-01-01T08:00:00", "scheduled_departure": "2030-01-01T10:00:00"},
+            {"vessel_id": "V2", "gate_id": "G1",
+             "scheduled_arrival": "2030-01-01T09:00:00", "scheduled_departure": "2030-01-01T11:00:00"},
+            {"vessel_id": "V3", "gate_id": "G2",
+             "scheduled_arrival": "2030-01-01T09:00:00", "scheduled_departure": "2030-01-01T11:00:00"},
+        ]
+
+        conflicts = await ConflictResolutionSkill()._detect_gate_conflicts(assignments)
+
+        assert len(conflicts) == 1
+        assert conflicts[0].gate_id == "G1"
+        assert conflicts[0].vessel_ids == ["V1", "V2"]
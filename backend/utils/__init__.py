@@ -6,10 +6,14 @@ from .currency_converter import (
     convert_currency,
     format_currency
 )
+from .intervals import find_overlap_clusters
+from .lru_cache import TTLCache
 
 __all__ = [
     "CurrencyConverter",
     "get_currency_converter",
     "convert_currency",
     "format_currency",
+    "TTLCache",
+    "find_overlap_clusters",
 ]
@@ -0,0 +1,39 @@
+"""Interval helpers for gate and berth scheduling"""
+
+from datetime import datetime
+from typing import List, Tuple
+
+
+def find_overlap_clusters(
+    intervals: List[Tuple[datetime, datetime, str]]
+) -> List[Tuple[datetime, datetime, List[str]]]:
+    """
+    Sort-and-sweep overlap detection
+
+    Args:
+        intervals: (start, end, vessel_id) tuples for one gate
+
+    Returns:
+        (cluster_start, cluster_end, vessel_ids) for every group of two or
+        more transitively overlapping intervals. Intervals that merely touch
+        (one ends when the next starts) do not overlap.
+    """
+    clusters = []
+    cluster_start = cluster_end = None
+    members: List[str] = []
+
+    for start, end, vessel_id in sorted(intervals, key=lambda iv: iv[0]):
+        if cluster_end is not None and start < cluster_end:
+            members.append(vessel_id)
+            if end > cluster_end:
+                cluster_end = end
+            continue
+
+        if len(members) > 1:
+            clusters.append((cluster_start, cluster_end, members))
+        cluster_start, cluster_end, members = start, end, [vessel_id]
+
+    if len(members) > 1:
+        clusters.append((cluster_start, cluster_end, members))
+
+    return clusters
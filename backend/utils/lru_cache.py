@@ -0,0 +1,107 @@
+"""Size- and TTL-bounded LRU cache with hit/miss/eviction counters"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    LRU cache bounded by entry count and entry age
+
+    - ``get`` moves a hit to the most-recently-used end
+    - ``set`` evicts the least-recently-used entry once ``max_size`` is reached
+    - entries older than ``ttl_seconds`` (or their own TTL, see ``set``)
+      are treated as misses and dropped
+
+    All operations are O(1) and guarded by a lock, so one instance can be
+    shared between threads.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: Optional[float] = 300.0) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # key -> (value, stored_at, entry TTL or None for the cache TTL)
+        self._data: "OrderedDict[Hashable, Tuple[V, float, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value or None"""
+        entry = self.get_with_age(key)
+        return entry[0] if entry else None
+
+    def get_with_age(self, key: Hashable) -> Optional[Tuple[V, float]]:
+        """Return ``(value, age_seconds)`` or None"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, stored_at, ttl = entry
+            age = now - stored_at
+            if ttl is None:
+                ttl = self.ttl_seconds
+            if ttl is not None and age >= ttl:
+                del self._data[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value, age
+
+    def set(self, key: Hashable, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Insert or refresh an entry (``ttl_seconds`` overrides the cache TTL for it)"""
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+            elif len(self._data) >= self.max_size:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            self._data[key] = (value, time.monotonic(), ttl_seconds)
+
+    def pop(self, key: Hashable) -> Optional[V]:
+        """Remove an entry"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry else None
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)"""
+        with self._lock:
+            self._data.clear()
+
+    def reset_stats(self) -> None:
+        """Zero the counters"""
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters and hit rate"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
@@ -4,6 +4,7 @@ Main runtime for executing agent-generated code with MCP tool access.
 Implements the efficient code execution pattern from Anthropic's blog.
 """
 
+import asyncio
 import json
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -11,11 +12,11 @@ from dataclasses import dataclass, asdict
 
 try:
     from .tool_loader import ToolLoader, ToolMetadata
-    from .sandbox import SecureSandbox, SandboxConfig, SandboxValidator
+    from .sandbox import SecureSandbox, SandboxConfig
     from .privacy import PrivacyLayer
 except ImportError:
     from tool_loader import ToolLoader, ToolMetadata
-    from sandbox import SecureSandbox, SandboxConfig, SandboxValidator
+    from sandbox import SecureSandbox, SandboxConfig
     from privacy import PrivacyLayer
 
 
@@ -109,31 +110,32 @@ class CodeExecutionRuntime:
         import time
         start_time = time.time()
 
+        # Apply privacy layer if enabled
+        if preserve_privacy:
+            code = self.privacy.sanitize_code(code)
+
+        # Parse, validate and compile - once per unique source
+        compiled = self.sandbox.code_cache.get(code)
+
         # Validate code
-        if validate:
-            is_safe, error = SandboxValidator.validate(code)
-            if not is_safe:
-                return ExecutionResult(
-                    success=False,
-                    result=None,
-                    stdout="",
-                    stderr=f"Validation failed: {error}",
-                    tools_used=[],
-                    tokens_saved=0,
-                    execution_time=0
-                )
+        if validate and not compiled.is_safe:
+            return ExecutionResult(
+                success=False,
+                result=None,
+                stdout="",
+                stderr=f"Validation failed: {compiled.error}",
+                tools_used=[],
+                tokens_saved=0,
+                execution_time=0
+            )
 
         # Prepare execution context with MCP tools
         exec_context = self._prepare_mcp_context(context or {})
 
-        # Apply privacy layer if enabled
-        if preserve_privacy:
-            code = self.privacy.sanitize_code(code)
-
         # Execute in sandbox
         tools_used = []
         try:
-            result, stdout, stderr = self.sandbox.execute(code, exec_context)
+            result, stdout, stderr = self.sandbox.execute(compiled, exec_context)
 
             # Track which tools were used
             if '_tools_used' in exec_context:
@@ -170,6 +172,25 @@ class CodeExecutionRuntime:
                 execution_time=execution_time
             )
 
+    async def execute_async(
+        self,
+        code: str,
+        context: Optional[Dict[str, Any]] = None,
+        validate: bool = True,
+        preserve_privacy: bool = True
+    ) -> ExecutionResult:
+        """
+        Execute code without blocking the event loop.
+
+        The sandbox worker pool runs concurrent executions in parallel,
+        so several agents can await this at once.
+        """
+        return await asyncio.to_thread(self.execute, code, context, validate, preserve_privacy)
+
+    def close(self):
+        """Stop the sandbox worker processes"""
+        self.sandbox.close()
+
     def _prepare_mcp_context(self, user_context: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare execution context with MCP tool functions"""
 
@@ -264,6 +285,15 @@ class CodeExecutionRuntime:
         """Calculate total tokens saved in session"""
         return sum(r.tokens_saved for r in self._execution_history)
 
+    def get_metrics(self) -> Dict[str, Any]:
+        """Session metrics, with tool loader, code cache and sandbox worker statistics"""
+        return {
+            "executions": len(self._execution_history),
+            "total_tokens_saved": self.get_total_tokens_saved(),
+            "tool_loader": self.tool_loader.get_stats(),
+            **self.sandbox.get_stats(),
+        }
+
     def persist_state(self, filename: str = "session_state.json"):
         """Persist session state to disk"""
         state_file = self.state_dir / filename
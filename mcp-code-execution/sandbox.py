@@ -4,14 +4,21 @@ Provides secure, resource-limited Python execution environment.
 Implements safety controls for untrusted code execution.
 """
 
+import ast
+import builtins
+import hashlib
+import marshal
 import sys
 import io
+import threading
 import traceback
 import resource
 import signal
+from collections import OrderedDict
 from contextlib import contextmanager
-from typing import Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from types import CodeType
+from typing import Dict, Any, Optional, Tuple, Union
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -23,6 +30,9 @@ class SandboxConfig:
     allow_network: bool = True
     allow_file_write: bool = False
     allowed_modules: set = None
+    worker_processes: int = 2  # Started on first use, 0 = run in this process
+    max_runs_per_worker: int = 100  # Executions before a worker process is replaced
+    code_cache_size: int = 256  # Validated, compiled sources kept (LRU)
 
     def __post_init__(self):
         if self.allowed_modules is None:
@@ -62,15 +72,35 @@ class SecureSandbox:
     - Module restrictions
     - Output capture
     - Error handling
+
+    By default code runs in a pool of worker processes (see sandbox_pool),
+    started on the first ``execute``, so limits, alarms and output capture
+    stay inside the worker and concurrent calls run in parallel. With
+    ``worker_processes=0`` code runs in the calling process, one
+    execution at a time.
     """
 
     def __init__(self, config: Optional[SandboxConfig] = None):
         self.config = config or SandboxConfig()
         self._original_modules = None
+        self._pool = None
+        self.code_cache = CodeCache(self.config.code_cache_size)
+
+        workers = self.config.worker_processes
+        if workers > 0:
+            try:
+                from .sandbox_pool import SandboxWorkerPool
+            except ImportError:
+                from sandbox_pool import SandboxWorkerPool
+            self._pool = SandboxWorkerPool(
+                self.config,
+                size=workers,
+                max_runs_per_worker=self.config.max_runs_per_worker
+            )
 
     def execute(
         self,
-        code: str,
+        code: Union[str, "CompiledCode"],
         context: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None
     ) -> Tuple[Any, str, str]:
@@ -78,7 +108,7 @@ class SecureSandbox:
         Execute code in sandbox.
 
         Args:
-            code: Python code to execute
+            code: Python code to execute (or an entry from ``code_cache``)
             context: Variables to inject into execution context
             timeout: Override default timeout
 
@@ -91,7 +121,21 @@ class SecureSandbox:
             SandboxMemoryError: On memory limit exceeded
         """
         timeout = timeout or self.config.max_execution_time
+        compiled = code if isinstance(code, CompiledCode) else self.code_cache.get(code)
+        if compiled.code is None:
+            raise SandboxExecutionError(f"Execution failed: {compiled.syntax_error}")
 
+        if self._pool is not None:
+            return self._pool.execute(compiled, context or {}, timeout)
+        return self._execute_in_process(compiled.code, context, timeout)
+
+    def _execute_in_process(
+        self,
+        code: CodeType,
+        context: Optional[Dict[str, Any]],
+        timeout: int
+    ) -> Tuple[Any, str, str]:
+        """Run a compiled script in this process (see ``execute``)"""
         # Capture output
         stdout_capture = io.StringIO()
         stderr_capture = io.StringIO()
@@ -140,6 +184,18 @@ class SecureSandbox:
 
         return result, stdout, stderr
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Code cache and worker pool statistics"""
+        return {
+            "code_cache": self.code_cache.get_stats(),
+            "workers": self._pool.get_stats() if self._pool is not None else {},
+        }
+
+    def close(self):
+        """Stop the worker processes"""
+        if self._pool is not None:
+            self._pool.close()
+
     def _prepare_context(self, user_context: Dict[str, Any]) -> Dict[str, Any]:
         """Prepare execution context with restricted builtins"""
         # Start with safe builtins
@@ -166,6 +222,10 @@ class SecureSandbox:
             'filter': filter,
             'any': any,
             'all': all,
+            # Class definitions
+            '__build_class__': builtins.__build_class__,
+            'object': object,
+            'super': super,
         }
 
         # Restricted imports
@@ -179,6 +239,7 @@ class SecureSandbox:
         # Combine with user context
         exec_context = {
             '__builtins__': safe_builtins,
+            '__name__': '__main__',
             **user_context
         }
 
@@ -243,18 +304,42 @@ class SecureSandbox:
 
 
 class SandboxValidator:
-    """Validates code before execution"""
-
-    DANGEROUS_PATTERNS = [
-        'os.system',
-        'subprocess',
-        'eval(',
-        'exec(',
-        '__import__',
-        'open(',
-        'file(',
-        'input(',
-    ]
+    """Validates code before execution by walking its syntax tree"""
+
+    # Builtins that reach outside the sandbox when called
+    DANGEROUS_CALLS = {
+        'eval', 'exec', 'compile', 'open', 'file', 'input',
+        '__import__', 'breakpoint', 'globals', 'locals', 'vars',
+        'getattr', 'setattr', 'delattr',
+    }
+
+    # Modules that must not be imported or used (unless the script binds the name itself)
+    DANGEROUS_MODULES = {
+        'os', 'sys', 'subprocess', 'shutil', 'socket', 'ctypes',
+        'importlib', 'builtins', 'pickle', 'marshal',
+    }
+
+    # Dunders used by ordinary scripts and classes; every other dunder
+    # (__class__, __globals__, __subclasses__, ...) leads out of the sandbox
+    SAFE_DUNDERS = {
+        '__name__', '__main__', '__doc__', '__init__', '__post_init__',
+        '__slots__', '__repr__', '__str__', '__eq__', '__ne__', '__lt__',
+        '__le__', '__gt__', '__ge__', '__hash__', '__len__', '__bool__',
+        '__contains__', '__iter__', '__next__', '__getitem__',
+        '__enter__', '__exit__',
+    }
+
+    # Frame and code introspection reaches the host's (or worker loop's) locals
+    DANGEROUS_ATTRIBUTES = {
+        'gi_frame', 'gi_code', 'cr_frame', 'cr_code', 'ag_frame', 'ag_code',
+        'tb_frame', 'tb_next', 'f_back', 'f_locals', 'f_globals',
+        'f_builtins', 'f_code',
+    }
+
+    # Names whose private attributes a script may use (its own objects)
+    OWN_OBJECTS = {'self', 'cls'}
+
+    MAX_CODE_SIZE = 100_000
 
     @staticmethod
     def validate(code: str) -> Tuple[bool, Optional[str]]:
@@ -264,13 +349,171 @@ class SandboxValidator:
         Returns:
             Tuple of (is_safe, error_message)
         """
-        # Check for dangerous patterns
-        for pattern in SandboxValidator.DANGEROUS_PATTERNS:
-            if pattern in code:
-                return False, f"Dangerous pattern detected: {pattern}"
-
         # Check code length
-        if len(code) > 100_000:
+        if len(code) > SandboxValidator.MAX_CODE_SIZE:
             return False, "Code too long (max 100KB)"
 
+        try:
+            tree = ast.parse(code)
+        except SyntaxError as e:
+            return False, f"Syntax error: {e.msg} (line {e.lineno})"
+
+        return SandboxValidator.validate_tree(tree)
+
+    @staticmethod
+    def validate_tree(tree: ast.AST) -> Tuple[bool, Optional[str]]:
+        """Validate an already parsed module"""
+        bound = SandboxValidator._bound_names(tree)
+        for node in ast.walk(tree):
+            pattern = SandboxValidator._dangerous_pattern(node, bound)
+            if pattern:
+                return False, f"Dangerous pattern detected: {pattern} (line {node.lineno})"
         return True, None
+
+    @staticmethod
+    def _bound_names(tree: ast.AST) -> set:
+        """Names the script assigns itself (variables, parameters, functions, classes)"""
+        bound = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+                bound.add(node.id)
+            elif isinstance(node, ast.arg):
+                bound.add(node.arg)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                bound.add(node.name)
+        return bound
+
+    @staticmethod
+    def _dangerous_pattern(node: ast.AST, bound: set = frozenset()) -> Optional[str]:
+        """Describe ``node`` if it is not allowed, else None"""
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name):
+            if node.func.id in SandboxValidator.DANGEROUS_CALLS:
+                return f"{node.func.id}()"
+
+        elif isinstance(node, ast.Name):
+            if node.id in SandboxValidator.DANGEROUS_MODULES and node.id not in bound:
+                return node.id
+            if SandboxValidator._is_dunder(node.id) and node.id not in SandboxValidator.SAFE_DUNDERS:
+                return node.id
+
+        elif isinstance(node, ast.Attribute):
+            attr = node.attr
+            if SandboxValidator._is_dunder(attr):
+                if attr not in SandboxValidator.SAFE_DUNDERS:
+                    return f".{attr}"
+            elif attr.startswith('_'):
+                # Private state of host objects and proxies (connections, caches)
+                owner = node.value
+                if not (isinstance(owner, ast.Name) and owner.id in SandboxValidator.OWN_OBJECTS):
+                    return f".{attr}"
+            elif attr in SandboxValidator.DANGEROUS_ATTRIBUTES:
+                return f".{attr}"
+
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split('.')[0] in SandboxValidator.DANGEROUS_MODULES:
+                    return f"import {alias.name}"
+
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and node.module.split('.')[0] in SandboxValidator.DANGEROUS_MODULES:
+                return f"from {node.module} import"
+
+        return None
+
+    @staticmethod
+    def _is_dunder(name: str) -> bool:
+        return len(name) > 4 and name.startswith('__') and name.endswith('__')
+
+
+@dataclass
+class CompiledCode:
+    """A source string after validation and compilation"""
+    digest: str  # SHA-256 of the source
+    code: Optional[CodeType]  # None if the source does not parse
+    error: Optional[str] = None  # Validation failure, None if safe
+    syntax_error: Optional[str] = None
+    _payload: Optional[bytes] = field(default=None, repr=False)
+
+    @property
+    def is_safe(self) -> bool:
+        return self.error is None
+
+    @property
+    def payload(self) -> bytes:
+        """Marshalled code object, for handing to worker processes"""
+        if self._payload is None:
+            self._payload = marshal.dumps(self.code)
+        return self._payload
+
+
+class CodeCache:
+    """
+    Bounded LRU of validated, compiled sources keyed by SHA-256.
+
+    Each unique source is parsed once; the syntax tree is validated and
+    compiled from the same parse, so repeated scripts skip parsing,
+    validation and compilation entirely. Thread-safe.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CompiledCode]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def digest(source: str) -> str:
+        return hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def get(self, source: str) -> CompiledCode:
+        """Cached entry for ``source``, validating and compiling it on a miss"""
+        digest = self.digest(source)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        entry = self._compile(digest, source)
+
+        with self._lock:
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    @staticmethod
+    def _compile(digest: str, source: str) -> CompiledCode:
+        try:
+            tree = ast.parse(source, filename="<string>")
+        except SyntaxError as e:
+            return CompiledCode(digest, None, error=f"Syntax error: {e.msg} (line {e.lineno})",
+                                syntax_error=str(e))
+
+        if len(source) > SandboxValidator.MAX_CODE_SIZE:
+            error = "Code too long (max 100KB)"
+        else:
+            _, error = SandboxValidator.validate_tree(tree)
+        return CompiledCode(digest, compile(tree, "<string>", "exec"), error=error)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
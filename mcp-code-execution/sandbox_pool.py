@@ -0,0 +1,459 @@
+"""Sandbox Worker Pool
+
+Worker processes for SecureSandbox, started on demand.
+
+Each worker runs one script at a time with its own memory and CPU limits,
+alarm-based timeout and captured stdout/stderr, so none of that touches the
+parent process and several scripts can run concurrently across cores.
+Callables in the execution context (search_tools, load_tool, ...) stay in
+the parent and are invoked over the worker's pipe.
+
+The worker runs untrusted code, so everything it sends back is JSON read
+with ``recv_bytes`` and checked against the expected message shapes; the
+parent never unpickles worker output. Messages from the parent to the
+worker are pickled as usual.
+"""
+
+import json
+import multiprocessing
+import resource
+import signal
+import threading
+import marshal
+import time
+from collections import OrderedDict, deque
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    from .sandbox import (
+        CompiledCode, SandboxConfig, SandboxExecutionError, SandboxMemoryError,
+        SandboxTimeoutError, SecureSandbox
+    )
+except ImportError:
+    from sandbox import (
+        CompiledCode, SandboxConfig, SandboxExecutionError, SandboxMemoryError,
+        SandboxTimeoutError, SecureSandbox
+    )
+
+
+class SandboxWorkerLost(SandboxExecutionError):
+    """Raised when a worker process dies, stops responding or sends a malformed message"""
+    pass
+
+
+# Error kinds a worker may report, and the exception raised for each
+_ERROR_KINDS = {
+    "timeout": SandboxTimeoutError,
+    "memory": SandboxMemoryError,
+    "execution": SandboxExecutionError,
+}
+
+
+def _encode(message: list) -> bytes:
+    return json.dumps(message, allow_nan=False).encode("utf-8")
+
+
+def _host_functions(conn, host_functions: Dict[str, int]) -> Dict[str, Callable]:
+    """
+    Worker-side stand-ins for callables that live in the parent process.
+
+    The pipe is only held in this closure, never as an attribute of the
+    returned functions, so scripts cannot reach it through them.
+    """
+    def call(handle: int, name: str, args: tuple, kwargs: dict):
+        try:
+            request = _encode(["call", handle, list(args), kwargs])
+        except (TypeError, ValueError) as e:
+            raise TypeError(f"Arguments to {name}() are not JSON-serializable: {e}")
+        conn.send_bytes(request)
+
+        kind, value = conn.recv()
+        if kind == "raise":
+            raise value
+        if kind == "callable":
+            return proxy(value, name)
+        return value
+
+    def proxy(handle: int, name: str) -> Callable:
+        def host_function(*args, **kwargs):
+            return call(handle, name, args, kwargs)
+        host_function.__name__ = host_function.__qualname__ = name
+        return host_function
+
+    return {name: proxy(handle, name) for name, handle in host_functions.items()}
+
+
+def _limit_cpu_time(seconds: int) -> None:
+    """Cap this run's CPU time; the kernel sends SIGXCPU (fatal) past it"""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime)
+    try:
+        resource.setrlimit(resource.RLIMIT_CPU, (used + seconds + 1, resource.RLIM_INFINITY))
+    except (ValueError, OSError):
+        pass
+
+
+def _error_reply(error: SandboxExecutionError) -> list:
+    if isinstance(error, SandboxTimeoutError):
+        kind = "timeout"
+    elif isinstance(error, SandboxMemoryError):
+        kind = "memory"
+    else:
+        kind = "execution"
+    return ["error", kind, str(error)]
+
+
+def _worker_main(conn, config: SandboxConfig) -> None:
+    """Worker loop: receive (code, data, host functions, timeout), reply with the outcome"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl-C is for the parent
+    sandbox = SecureSandbox(replace(config, worker_processes=0))
+    code_objects: "OrderedDict[str, Any]" = OrderedDict()  # digest -> code, LRU
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            return
+        if message[0] == "stop":
+            return
+
+        _, digest, payload, data, host_functions, timeout = message
+        code = code_objects.get(digest)
+        if code is None:
+            code = marshal.loads(payload)
+            code_objects[digest] = code
+            if len(code_objects) > config.code_cache_size:
+                code_objects.popitem(last=False)
+        else:
+            code_objects.move_to_end(digest)
+
+        context = dict(data)
+        context.update(_host_functions(conn, host_functions))
+
+        _limit_cpu_time(timeout)
+        try:
+            reply = ["ok", *sandbox._execute_in_process(code, context, timeout)]
+        except SandboxExecutionError as e:
+            reply = _error_reply(e)
+
+        try:
+            encoded = _encode(reply)
+        except (TypeError, ValueError) as e:
+            encoded = _encode(["error", "execution", f"Execution result is not JSON-serializable: {e}"])
+        conn.send_bytes(encoded)
+
+
+class _Worker:
+    """Parent-side handle of one worker process"""
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.runs = 0
+
+    def stop(self, timeout: float = 1.0) -> None:
+        try:
+            self.conn.send(("stop",))
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class SandboxWorkerPool:
+    """
+    Pool of up to ``size`` sandbox worker processes.
+
+    No process is started until the first ``execute``; after that a worker
+    is started only when a call finds none idle and the pool is below
+    ``size``. Workers come from a ``forkserver`` (where available), a
+    single-threaded process, so starting one from a request thread never
+    forks the multi-threaded host.
+
+    ``execute`` is thread-safe: each call checks out an idle worker (waiting
+    if all are busy), so up to ``size`` scripts run in parallel. A worker is
+    retired after ``max_runs_per_worker`` executions, and immediately after
+    a timeout, a memory error, a crash or a malformed message, so a
+    misbehaving script never leaves a degraded process behind.
+    """
+
+    # Largest message accepted from a worker (result plus captured output)
+    MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        config: SandboxConfig,
+        size: int,
+        max_runs_per_worker: int = 100,
+        kill_grace: float = 2.0,
+        start_method: Optional[str] = None
+    ):
+        """
+        Args:
+            config: Sandbox limits applied inside each worker
+            size: Maximum number of worker processes
+            max_runs_per_worker: Executions before a worker is retired
+            kill_grace: Seconds past the timeout before a stuck worker is killed
+            start_method: multiprocessing start method (forkserver where available)
+        """
+        self.config = config
+        self.size = size
+        self.max_runs_per_worker = max_runs_per_worker
+        self.kill_grace = kill_grace
+
+        if start_method is None:
+            available = multiprocessing.get_all_start_methods()
+            start_method = "forkserver" if "forkserver" in available else "spawn"
+        self._mp = multiprocessing.get_context(start_method)
+
+        self._idle: deque = deque()
+        self._cond = threading.Condition()
+        self._live = 0  # Started and not yet retired, idle or busy
+        self._busy = 0
+        self._closed = False
+
+        self.stats = {
+            "executions": 0, "started": 0, "recycled": 0,
+            "timeouts": 0, "memory_errors": 0, "crashes": 0,
+        }
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._mp.Pipe()
+        process = self._mp.Process(
+            target=_worker_main,
+            args=(child_conn, self.config),
+            name="sandbox-worker",
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _checkout(self) -> _Worker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise SandboxExecutionError("Sandbox worker pool is closed")
+                if self._idle:
+                    self._busy += 1
+                    return self._idle.popleft()
+                if self._live < self.size:
+                    self._live += 1
+                    self._busy += 1
+                    self.stats["started"] += 1
+                    break
+                self._cond.wait()
+
+        try:
+            return self._spawn()
+        except Exception as e:
+            with self._cond:
+                self._live -= 1
+                self._busy -= 1
+                self._cond.notify()
+            raise SandboxExecutionError(f"Could not start sandbox worker: {e}")
+
+    def _checkin(self, worker: _Worker, healthy: bool) -> None:
+        worker.runs += 1
+        retire = not healthy or worker.runs >= self.max_runs_per_worker
+        if not healthy:
+            worker.kill()
+        elif retire:
+            worker.stop()
+
+        with self._cond:
+            self._busy -= 1
+            self.stats["executions"] += 1
+            self.stats["recycled"] += retire
+            stop = not retire and self._closed
+            if retire or stop:
+                self._live -= 1
+            else:
+                self._idle.append(worker)
+            self._cond.notify()
+        if stop:
+            worker.stop()
+
+    def execute(
+        self,
+        code: CompiledCode,
+        context: Dict[str, Any],
+        timeout: int
+    ) -> Tuple[Any, str, str]:
+        """
+        Run ``code`` in an idle worker.
+
+        The code object travels marshalled and each worker keeps the ones it
+        has seen, so workers never parse or compile. Context values that are
+        callable stay in this process and are invoked on demand; everything
+        else is pickled to the worker. Results and host function arguments
+        come back as JSON.
+
+        Returns:
+            Tuple of (result, stdout, stderr)
+
+        Raises:
+            SandboxExecutionError: On execution failure
+            SandboxTimeoutError: On timeout
+            SandboxMemoryError: On memory limit exceeded
+            SandboxWorkerLost: If the worker dies or misbehaves
+        """
+        handles: List[Callable] = []
+        host_functions: Dict[str, int] = {}
+        data: Dict[str, Any] = {}
+        for name, value in context.items():
+            if callable(value):
+                host_functions[name] = len(handles)
+                handles.append(value)
+            else:
+                data[name] = value
+
+        worker = self._checkout()
+        healthy = True
+        try:
+            try:
+                worker.conn.send(("exec", code.digest, code.payload, data, host_functions, timeout))
+            except OSError:
+                healthy = False
+                self._count_breach(SandboxWorkerLost())
+                raise SandboxWorkerLost("Sandbox worker exited unexpectedly")
+            except Exception as e:
+                # Pickling fails before anything is written, so the worker is still idle
+                raise SandboxExecutionError(f"Execution context is not serializable: {e}")
+
+            try:
+                outcome = self._serve(worker, handles, timeout)
+            except SandboxExecutionError as e:
+                healthy = False
+                self._count_breach(e)
+                raise
+
+            if outcome[0] == "ok":
+                return outcome[1], outcome[2], outcome[3]
+
+            error = _ERROR_KINDS[outcome[1]](outcome[2])
+            # Timeouts and memory errors leave the worker in an unknown state
+            if isinstance(error, (SandboxTimeoutError, SandboxMemoryError)):
+                healthy = False
+                self._count_breach(error)
+            raise error
+        finally:
+            self._checkin(worker, healthy)
+
+    def _serve(self, worker: _Worker, handles: List[Callable], timeout: int) -> list:
+        """Answer host calls until the worker reports the outcome"""
+        deadline = time.monotonic() + timeout + self.kill_grace
+        conn = worker.conn
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not conn.poll(remaining):
+                raise SandboxTimeoutError(f"Execution exceeded {timeout}s timeout")
+            try:
+                raw = conn.recv_bytes(self.MAX_MESSAGE_BYTES)
+            except (EOFError, OSError) as e:
+                worker.process.join(1.0 if isinstance(e, EOFError) else 0)
+                exitcode = worker.process.exitcode
+                if exitcode is None:
+                    # Still running: the message was oversized or truncated
+                    raise SandboxWorkerLost(f"Unreadable message from sandbox worker: {e}")
+                if exitcode == -signal.SIGXCPU:
+                    raise SandboxTimeoutError(f"Execution exceeded {timeout}s CPU time")
+                raise SandboxWorkerLost(f"Sandbox worker exited unexpectedly (exit code {exitcode})")
+
+            message = self._decode(raw, len(handles))
+            if message[0] != "call":
+                return message
+
+            _, handle, args, kwargs = message
+            reply = self._call_host(handles, handle, args, kwargs)
+            try:
+                conn.send(reply)
+            except OSError:
+                raise SandboxWorkerLost("Sandbox worker exited unexpectedly")
+            except Exception as e:
+                # Pickling failed before anything was written
+                conn.send(("raise", SandboxExecutionError(f"Host function result is not serializable: {e}")))
+
+    @staticmethod
+    def _decode(raw: bytes, handle_count: int) -> list:
+        """
+        Parse and check one worker message.
+
+        Accepted shapes:
+            ["call", handle, args, kwargs]  - handle < handle_count
+            ["ok", result, stdout, stderr]
+            ["error", kind, message]        - kind in _ERROR_KINDS
+
+        Raises:
+            SandboxWorkerLost: On anything else
+        """
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            raise SandboxWorkerLost("Sandbox worker sent a malformed message")
+
+        if isinstance(message, list) and message:
+            kind = message[0]
+            if kind == "call" and len(message) == 4:
+                _, handle, args, kwargs = message
+                if (type(handle) is int and 0 <= handle < handle_count
+                        and isinstance(args, list) and isinstance(kwargs, dict)):
+                    return message
+            elif kind == "ok" and len(message) == 4:
+                if isinstance(message[2], str) and isinstance(message[3], str):
+                    return message
+            elif kind == "error" and len(message) == 3:
+                if message[1] in _ERROR_KINDS and isinstance(message[2], str):
+                    return message
+
+        raise SandboxWorkerLost("Sandbox worker sent a malformed message")
+
+    @staticmethod
+    def _call_host(handles: List[Callable], handle: int, args: list, kwargs: dict) -> tuple:
+        try:
+            value = handles[handle](*args, **kwargs)
+        except Exception as e:
+            return ("raise", e)
+        if callable(value):
+            handles.append(value)
+            return ("callable", len(handles) - 1)
+        return ("return", value)
+
+    def _count_breach(self, error: Exception) -> None:
+        with self._cond:
+            if isinstance(error, SandboxTimeoutError):
+                self.stats["timeouts"] += 1
+            elif isinstance(error, SandboxMemoryError):
+                self.stats["memory_errors"] += 1
+            elif isinstance(error, SandboxWorkerLost):
+                self.stats["crashes"] += 1
+
+    def close(self) -> None:
+        """Stop idle workers; busy ones are stopped when their run finishes"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._live -= len(idle)
+            self._cond.notify_all()
+        for worker in idle:
+            worker.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                **self.stats,
+                "max_workers": self.size,
+                "workers": self._live,
+                "idle": len(self._idle),
+                "busy": self._busy,
+            }
@@ -1,6 +1,7 @@
 """Basic tests for MCP code execution"""
 
 import sys
+import tempfile
 from pathlib import Path
 
 # Add parent to path
@@ -8,7 +9,10 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from runtime import CodeExecutionRuntime
 from tool_loader import ToolLoader
-from sandbox import SecureSandbox, SandboxValidator
+from sandbox import (
+    SecureSandbox, SandboxConfig, SandboxValidator, SandboxExecutionError, SandboxTimeoutError
+)
+from sandbox_pool import SandboxWorkerPool, SandboxWorkerLost
 from privacy import PrivacyLayer, PIIDetector
 
 
@@ -42,6 +46,35 @@ def test_tool_loader():
     print("✓ Tool loader tests passed")
 
 
+def test_tool_hot_reload():
+    """Test tool module caching and incremental rescans"""
+    print("\n=== Testing Tool Hot Reload ===")
+
+    with tempfile.TemporaryDirectory() as servers_dir:
+        loader = ToolLoader(servers_dir, rescan_interval=0)
+        server_dir = loader.register_server("weather", category="weather")
+        tool_file = server_dir / "forecast.py"
+
+        tool_file.write_text('"""Marine forecast"""\ndef execute():\n    return "calm"\n')
+        forecast = loader.load_tool_function("weather", "forecast")
+        assert forecast() == "calm"
+        assert loader.load_tool_function("weather", "forecast") is forecast
+        print("✓ Module cached between loads")
+
+        tool_file.write_text('"""Marine forecast (gale warnings)"""\ndef execute():\n    return "gale"\n')
+        assert loader.load_tool_function("weather", "forecast")() == "gale"
+        assert "gale" in loader.get_tool("weather", "forecast").description
+        print("✓ Changed tool reloaded")
+
+        (server_dir / "tides.py").write_text('"""Tide tables"""\ndef execute():\n    return []\n')
+        assert [t.name for t in loader.search_tools("tide")] == ["tides"]
+        tool_file.unlink()
+        assert loader.get_tool("weather", "forecast") is None
+        print(f"✓ Added and removed tools picked up: {loader.get_stats()}")
+
+    print("✓ Tool hot reload tests passed")
+
+
 def test_sandbox():
     """Test secure sandbox execution"""
     print("\n=== Testing Sandbox ===")
@@ -67,9 +100,132 @@ print(f"Result: {result}")
     assert not is_safe, "Dangerous code not caught"
     print("✓ Dangerous code blocked")
 
+    # The validator reads the syntax tree, not the raw text
+    is_safe, error = SandboxValidator.validate("note = 'never call eval( here'  # or open(")
+    assert is_safe, f"String contents flagged: {error}"
+    is_safe, error = SandboxValidator.validate("x = ().__class__.__bases__[0].__subclasses__()")
+    assert not is_safe, "Dunder escape not caught"
+    print(f"✓ AST validation: {error}")
+
+
+    # Repeated sources are parsed and compiled once
+    compiled = sandbox.code_cache.get(code)
+    assert sandbox.code_cache.get(code) is compiled
+    stats = sandbox.code_cache.get_stats()
+    assert stats["hits"] >= 2 and stats["misses"] == 1
+    print(f"✓ Code cache: {stats}")
+
+    # Ordinary scripts using harmless dunders and module-like variable names run
+    accepted = """
+class Base:
+    def __init__(self, name):
+        self._name = name
+
+class Vessel(Base):
+    def __init__(self, name):
+        super().__init__(name)
+
+    def __repr__(self):
+        return self._name
+
+sys = {"platform": "sandbox"}
+if __name__ == "__main__":
+    result = f"{Vessel('MARITIME QUEEN')!r} on {sys['platform']}"
+"""
+    is_safe, error = SandboxValidator.validate(accepted)
+    assert is_safe, f"Ordinary script rejected: {error}"
+    result, _, _ = sandbox.execute(accepted)
+    assert result == "MARITIME QUEEN on sandbox"
+
+    # Private attributes of objects the script did not create, frame
+    # introspection and unbound module names are rejected
+    for code in (
+        "load_tool._conn.send_bytes(b'')",
+        "x = obj._handle",
+        "f = (x for x in []).gi_frame.f_back",
+        "sys.exit()",
+        "x = ().__class__",
+        "import os",
+    ):
+        is_safe, error = SandboxValidator.validate(code)
+        assert not is_safe, f"Not caught: {code}"
+    print("✓ Harmless dunders and variables allowed, private attributes blocked")
+
     print("✓ Sandbox tests passed")
 
 
+def test_sandbox_pool():
+    """Test process-isolated sandbox workers"""
+    print("\n=== Testing Sandbox Worker Pool ===")
+
+    sandbox = SecureSandbox(SandboxConfig(worker_processes=2, max_runs_per_worker=2))
+    assert sandbox.get_stats()["workers"]["workers"] == 0, "Workers started before first use"
+
+    try:
+        # Host callables run in this process; their results cross the pipe
+        calls = []
+
+        def lookup(name):
+            calls.append(name)
+            return {"name": name, "length": 42}
+
+        result, stdout, _ = sandbox.execute(
+            "vessel = lookup('MARITIME QUEEN')\nprint(vessel['name'])\nresult = vessel['length']",
+            {"lookup": lookup, "threshold": 10}
+        )
+        assert result == 42 and stdout == "MARITIME QUEEN\n"
+        assert calls == ["MARITIME QUEEN"]
+        print("✓ Host function called from worker")
+
+        # Host function proxies do not expose the worker's pipe
+        try:
+            sandbox.execute("result = lookup._conn", {"lookup": lookup})
+            assert False, "Pipe reachable from script"
+        except SandboxExecutionError:
+            pass
+
+        # Results must be JSON, the only format the host reads from a worker
+        try:
+            sandbox.execute("result = {1, 2}")
+            assert False, "Non-JSON result accepted"
+        except SandboxExecutionError as e:
+            assert "JSON" in str(e)
+        print("✓ Worker pipe hidden, results limited to JSON")
+
+        # A runaway script is stopped and its worker replaced
+        try:
+            sandbox.execute("while True:\n    pass", timeout=1)
+            assert False, "Timeout not enforced"
+        except SandboxTimeoutError:
+            pass
+        result, _, _ = sandbox.execute("result = 2 + 2")
+        assert result == 4
+        stats = sandbox.get_stats()["workers"]
+        assert stats["timeouts"] == 1 and stats["recycled"] >= 1
+        print(f"✓ Timed out worker recycled: {stats}")
+    finally:
+        sandbox.close()
+
+    # Anything but a well-formed JSON message from a worker is rejected
+    import pickle
+    for raw in (
+        pickle.dumps(("call", 0, (), {})),
+        b'["call", 5, [], {}]',
+        b'["call", true, [], {}]',
+        b'["error", "os.system", "x"]',
+        b'{"ok": 1}',
+    ):
+        try:
+            SandboxWorkerPool._decode(raw, handle_count=1)
+            assert False, f"Accepted {raw!r}"
+        except SandboxWorkerLost:
+            pass
+    assert SandboxWorkerPool._decode(b'["call", 0, ["x"], {}]', 1) == ["call", 0, ["x"], {}]
+    print("✓ Malformed worker messages rejected")
+
+    print("✓ Sandbox pool tests passed")
+
+
 def test_privacy():
     """Test PII detection and tokenization"""
     print("\n=== Testing Privacy Layer ===")
@@ -201,7 +357,9 @@ def run_all_tests():
 
     try:
         test_tool_loader()
+        test_tool_hot_reload()
         test_sandbox()
+        test_sandbox_pool()
         test_privacy()
         test_runtime()
         test_state_persistence()
@@ -6,10 +6,16 @@ Reduces token usage by loading only necessary tool definitions.
 
 import os
 import json
+import threading
+import time
 import importlib.util
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from types import ModuleType
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, asdict, field
+
+# (st_mtime_ns, st_size) of a file or directory; None if it does not exist
+FileStamp = Optional[Tuple[int, int]]
 
 
 @dataclass
@@ -26,6 +32,15 @@ class ToolMetadata:
         return asdict(self)
 
 
+@dataclass
+class _ServerState:
+    """What the last scan saw of one server directory"""
+    dir_stamp: FileStamp
+    meta_stamp: FileStamp
+    metadata: dict
+    tool_files: Dict[str, Path] = field(default_factory=dict)
+
+
 class ToolLoader:
     """
     Progressive tool loader for MCP servers.
@@ -38,14 +53,42 @@ class ToolLoader:
         weather/
             forecast.py
             marine_conditions.py
+
+    Tool metadata is kept fresh by an mtime-based incremental rescan:
+    directory listings are re-read only for directories whose mtime
+    changed, and metadata only for tool files whose mtime or size
+    changed. Loaded tool modules are cached by file path and reloaded
+    when the file changes.
     """
 
-    def __init__(self, servers_dir: str = "./mcp-code-execution/servers"):
+    def __init__(
+        self,
+        servers_dir: str = "./mcp-code-execution/servers",
+        rescan_interval: float = 1.0
+    ):
+        """
+        Args:
+            servers_dir: Directory holding one sub-directory per server
+            rescan_interval: Minimum seconds between filesystem rescans
+        """
         self.servers_dir = Path(servers_dir)
         self.servers_dir.mkdir(parents=True, exist_ok=True)
+        self.rescan_interval = rescan_interval
 
         self._tool_cache: Dict[str, ToolMetadata] = {}
-        self._loaded_servers: set = set()
+        self._servers: Dict[str, _ServerState] = {}
+        self._file_stamps: Dict[str, FileStamp] = {}
+        self._modules: Dict[str, Tuple[FileStamp, ModuleType]] = {}
+        self._next_scan = 0.0
+        self._lock = threading.RLock()
+
+        self.stats = {
+            "rescans": 0,
+            "metadata_extracted": 0,
+            "module_loads": 0,
+            "module_reloads": 0,
+            "module_cache_hits": 0,
+        }
 
     def search_tools(
         self,
@@ -73,7 +116,7 @@ class ToolLoader:
         results = []
         query_lower = query.lower()
 
-        for tool_meta in self._tool_cache.values():
+        for tool_meta in list(self._tool_cache.values()):
             # Apply filters
             if server and tool_meta.server != server:
                 continue
@@ -92,6 +135,7 @@ class ToolLoader:
 
     def get_tool(self, server: str, tool_name: str) -> Optional[ToolMetadata]:
         """Get specific tool metadata"""
+        self._scan_servers()
         key = f"{server}/{tool_name}"
         return self._tool_cache.get(key)
 
@@ -103,8 +147,9 @@ class ToolLoader:
 
     def list_tools(self, server: str) -> List[ToolMetadata]:
         """List all tools in a server"""
+        self._scan_servers()
         return [
-            tool for tool in self._tool_cache.values()
+            tool for tool in list(self._tool_cache.values())
             if tool.server == server
         ]
 
@@ -112,16 +157,41 @@ class ToolLoader:
         """
         Dynamically load tool function from file.
 
-        This enables on-demand loading of tool implementations.
+        This enables on-demand loading of tool implementations. Modules are
+        cached per file and re-imported only when the file's mtime or size
+        changes.
         """
         tool_meta = self.get_tool(server, tool_name)
         if not tool_meta:
             return None
 
+        module = self._load_module(server, tool_name, tool_meta.file_path)
+        if module is None:
+            return None
+
+        # Look for execute function
+        if hasattr(module, 'execute'):
+            return module.execute
+
+        # Or function with tool name
+        if hasattr(module, tool_name):
+            return getattr(module, tool_name)
+
+        return None
+
+    def _load_module(self, server: str, tool_name: str, file_path: str) -> Optional[ModuleType]:
+        """Cached module for ``file_path``, importing it if new or changed"""
+        stamp = self._stamp(file_path)
+        with self._lock:
+            cached = self._modules.get(file_path)
+            if cached is not None and cached[0] == stamp:
+                self.stats["module_cache_hits"] += 1
+                return cached[1]
+
         try:
             spec = importlib.util.spec_from_file_location(
                 f"{server}.{tool_name}",
-                tool_meta.file_path
+                file_path
             )
             if not spec or not spec.loader:
                 return None
@@ -129,58 +199,141 @@ class ToolLoader:
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
 
-            # Look for execute function
-            if hasattr(module, 'execute'):
-                return module.execute
-
-            # Or function with tool name
-            if hasattr(module, tool_name):
-                return getattr(module, tool_name)
-
-            return None
-
         except Exception as e:
             print(f"Error loading tool {server}/{tool_name}: {e}")
             return None
 
-    def _scan_servers(self):
-        """Scan servers directory and build tool cache"""
-        if not self.servers_dir.exists():
-            return
+        with self._lock:
+            self._modules[file_path] = (stamp, module)
+            self.stats["module_loads"] += 1
+            if cached is not None:
+                self.stats["module_reloads"] += 1
+        return module
 
-        for server_dir in self.servers_dir.iterdir():
-            if not server_dir.is_dir():
-                continue
+    @staticmethod
+    def _stamp(path) -> FileStamp:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
-            server_name = server_dir.name
-            if server_name in self._loaded_servers:
-                continue
+    def refresh(self):
+        """Rescan the servers directory now, ignoring rescan_interval"""
+        self._scan_servers(force=True)
+
+    def _scan_servers(self, force: bool = False):
+        """
+        Bring the tool cache up to date with the servers directory.
+
+        Incremental: a server's directory is listed again only when its
+        mtime changed (tool added or removed), and a tool's metadata is
+        extracted again only when its file changed. Runs at most once per
+        ``rescan_interval`` unless forced.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not force and now < self._next_scan:
+                return
+            self._next_scan = now + self.rescan_interval
+            self.stats["rescans"] += 1
+
+            present = {}
+            if self.servers_dir.exists():
+                present = {d.name: d for d in self.servers_dir.iterdir() if d.is_dir()}
+
+            for server_name in list(self._servers):
+                if server_name not in present:
+                    self._sync_tools(server_name, {}, {}, force=True)
+                    del self._servers[server_name]
+
+            for server_name, server_dir in present.items():
+                self._sync_server(server_name, server_dir)
+
+    def _sync_server(self, server_name: str, server_dir: Path):
+        """Update one server's tools (caller holds the lock)"""
+        state = self._servers.get(server_name)
+        dir_stamp = self._stamp(server_dir)
+        meta_file = server_dir / "metadata.json"
+        meta_stamp = self._stamp(meta_file)
 
+        metadata_changed = state is None or state.meta_stamp != meta_stamp
+        if metadata_changed:
             # Load server metadata
-            meta_file = server_dir / "metadata.json"
             server_meta = {}
-            if meta_file.exists():
-                with open(meta_file) as f:
-                    server_meta = json.load(f)
-
+            if meta_stamp is not None:
+                try:
+                    with open(meta_file) as f:
+                        server_meta = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"Error reading server metadata {meta_file}: {e}")
+        else:
+            server_meta = state.metadata
+
+        if state is None or state.dir_stamp != dir_stamp:
             # Scan tool files
-            for tool_file in server_dir.glob("*.py"):
-                if tool_file.name.startswith("_"):
-                    continue
-
-                tool_name = tool_file.stem
-                tool_meta = self._extract_tool_metadata(
-                    server_name,
-                    tool_name,
-                    tool_file,
-                    server_meta
-                )
-
-                if tool_meta:
-                    key = f"{server_name}/{tool_name}"
-                    self._tool_cache[key] = tool_meta
+            tool_files = {
+                tool_file.stem: tool_file
+                for tool_file in server_dir.glob("*.py")
+                if not tool_file.name.startswith("_")
+            }
+        else:
+            tool_files = state.tool_files
+
+        self._sync_tools(server_name, tool_files, server_meta, force=metadata_changed)
+        self._servers[server_name] = _ServerState(dir_stamp, meta_stamp, server_meta, tool_files)
+
+    def _sync_tools(
+        self,
+        server_name: str,
+        tool_files: Dict[str, Path],
+        server_meta: dict,
+        force: bool
+    ):
+        """Re-extract changed tools and drop removed ones (caller holds the lock)"""
+        previous = self._servers.get(server_name)
+        for tool_name, tool_file in (previous.tool_files.items() if previous else ()):
+            if tool_name not in tool_files:
+                self._tool_cache.pop(f"{server_name}/{tool_name}", None)
+                self._file_stamps.pop(str(tool_file), None)
+                self._modules.pop(str(tool_file), None)
+
+        for tool_name, tool_file in tool_files.items():
+            key = f"{server_name}/{tool_name}"
+            path = str(tool_file)
+            stamp = self._stamp(tool_file)
+            if stamp is None:
+                # Deleted since the listing; the directory mtime changed too
+                self._tool_cache.pop(key, None)
+                self._file_stamps.pop(path, None)
+                continue
+            if not force and key in self._tool_cache and self._file_stamps.get(path) == stamp:
+                continue
 
-            self._loaded_servers.add(server_name)
+            tool_meta = self._extract_tool_metadata(
+                server_name,
+                tool_name,
+                tool_file,
+                server_meta
+            )
+            self.stats["metadata_extracted"] += 1
+
+            if tool_meta:
+                self._tool_cache[key] = tool_meta
+                self._file_stamps[path] = stamp
+            else:
+                self._tool_cache.pop(key, None)
+                self._file_stamps.pop(path, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tool cache, rescan and module cache statistics"""
+        with self._lock:
+            return {
+                **self.stats,
+                "servers": len(self._servers),
+                "tools": len(self._tool_cache),
+                "modules_cached": len(self._modules),
+            }
 
     def _extract_tool_metadata(
         self,
@@ -243,4 +396,7 @@ class ToolLoader:
         init_file = server_dir / "__init__.py"
         init_file.write_text(f'"""MCP Server: {server_name}"""\n')
 
+        # Pick the new server up on the next lookup
+        self._next_scan = 0.0
+
         return server_dir